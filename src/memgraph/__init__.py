@@ -2,15 +2,18 @@
 
 from pathlib import Path
 from datetime import datetime
-from typing import Union
+from typing import Optional, Union
 
 __version__ = "0.1.0"
 
 # Import key classes for easy access
-from memgraph.trace.parser import parse_trace
+from memgraph.trace.parser import parse_trace, stream_trace
 from memgraph.graph.builder import GraphBuilder
-from memgraph.graph.windowing import FixedWindow, SlidingWindow, AdaptiveWindow
+from memgraph.graph.windowing import FixedWindow, SlidingWindow, AdaptiveWindow, TimeWindow
 from memgraph.graph.coarsening import Granularity
+from memgraph.graph.csr import AnyGraph
+from memgraph.graph.edges import TemporalNeighbors
+from memgraph.graph.sketch import SketchConfig
 from memgraph.graph.stats import GraphStats
 from memgraph.graphlets.enumeration import GraphletEnumerator
 from memgraph.graphlets.sampling import GraphletSampler
@@ -22,6 +25,7 @@ __all__ = [
     "__version__",
     "analyze",
     "parse_trace",
+    "stream_trace",
     "GraphBuilder",
     "FixedWindow",
     "SlidingWindow",
@@ -39,11 +43,16 @@ def analyze(
     trace_path: str | Path,
     window_size: int = 100,
     window_strategy: str = "fixed",
-    granularity: str = "cacheline",
+    granularity: str | Granularity = "cacheline",
     sample: bool = False,
     num_samples: int = 100000,
     metric: str = "cosine",
     trace_format: str | None = None,
+    streaming: bool = False,
+    workers: int = 1,
+    min_edge_weight: int = 1,
+    edge_sketch: Optional[SketchConfig] = None,
+    neighbors: Optional[TemporalNeighbors] = None,
 ) -> AnalysisResult:
     """
     Analyze a memory trace file and classify its access pattern.
@@ -54,12 +63,25 @@ def analyze(
     Args:
         trace_path: Path to trace file (Lackey, CSV, or native format)
         window_size: Temporal window size for graph construction (default: 100)
-        window_strategy: Window strategy - "fixed", "sliding", or "adaptive" (default: "fixed")
-        granularity: Address granularity - "byte", "cacheline", or "page" (default: "cacheline")
+        window_strategy: Window strategy - "fixed", "sliding", "adaptive", or "time"
+            (default: "fixed"). Time windows span `window_size` timestamp units.
+        granularity: Address granularity - a Granularity, a name ("byte", "cacheline",
+            "line_pair", "page", "huge_page", "giga_page") or a power-of-two size such as
+            "256" or "2MB" (default: "cacheline")
         sample: Use sampling for graphlet enumeration (default: False, auto-enabled for large graphs)
         num_samples: Number of samples if sampling (default: 100000)
         metric: Distance metric - "cosine", "euclidean", or "manhattan" (default: "cosine")
         trace_format: Trace format - "lackey", "csv", or "native" (default: auto-detect)
+        streaming: Stream the trace through the graph builder instead of loading
+            it, so memory is bounded by the window and graph size (default: False)
+        workers: Processes used to parse line-oriented traces and to build the
+            graph; ignored when streaming (default: 1)
+        min_edge_weight: Drop graph edges with a lower weight (default: 1)
+        edge_sketch: Count edge weights in a count-min sketch and keep only
+            edges estimated to reach min_edge_weight; the bound on the
+            overcount is reported as ``edge_weight_error`` (default: exact)
+        neighbors: Link each access only to its nearest predecessors instead
+            of the whole window (default: clique of each window)
 
     Returns:
         AnalysisResult containing classification, confidence, recommendations, and full statistics
@@ -91,41 +113,47 @@ def analyze(
     if not trace_path.exists():
         raise FileNotFoundError(f"Trace file not found: {trace_path}")
 
-    # Parse trace
-    trace = parse_trace(trace_path, format=trace_format)
-
     # Select window strategy
     window_strategy = window_strategy.lower()
-    strategy: Union[FixedWindow, SlidingWindow, AdaptiveWindow]
+    strategy: Union[FixedWindow, SlidingWindow, AdaptiveWindow, TimeWindow]
     if window_strategy == "fixed":
         strategy = FixedWindow(size=window_size)
     elif window_strategy == "sliding":
         strategy = SlidingWindow(size=window_size, step=1)
     elif window_strategy == "adaptive":
         strategy = AdaptiveWindow(base_size=window_size)
+    elif window_strategy == "time":
+        strategy = TimeWindow(duration=window_size)
     else:
         raise ValueError(
             f"Unknown window strategy: {window_strategy}. "
-            f"Must be one of: fixed, sliding, adaptive"
+            f"Must be one of: fixed, sliding, adaptive, time"
         )
 
     # Select granularity
-    granularity = granularity.lower()
-    granularity_map = {
-        "byte": Granularity.BYTE,
-        "cacheline": Granularity.CACHELINE,
-        "page": Granularity.PAGE,
-    }
-    if granularity not in granularity_map:
-        raise ValueError(
-            f"Unknown granularity: {granularity}. "
-            f"Must be one of: byte, cacheline, page"
-        )
-    gran = granularity_map[granularity]
-
-    # Build graph
-    builder = GraphBuilder(window_strategy=strategy, granularity=gran)
-    graph = builder.build(trace)
+    if isinstance(granularity, Granularity):
+        gran = granularity
+    else:
+        gran = Granularity.parse(granularity)
+
+    # Parse trace and build graph
+    builder = GraphBuilder(
+        window_strategy=strategy,
+        granularity=gran,
+        min_edge_weight=min_edge_weight,
+        workers=workers,
+        sketch=edge_sketch,
+        neighbors=neighbors,
+    )
+    graph: AnyGraph
+    if streaming:
+        stream = stream_trace(trace_path, format=trace_format)
+        graph = builder.build_stream(stream.addresses())
+        trace_metadata = stream.metadata
+    else:
+        trace = parse_trace(trace_path, format=trace_format, workers=workers)
+        graph = builder.build_csr(trace)
+        trace_metadata = trace.metadata
 
     # Compute graph stats
     graph_stats = GraphStats.from_graph(graph)
@@ -156,10 +184,11 @@ def analyze(
         trace_source=str(trace_path),
         analysis_timestamp=datetime.now(),
         memgraph_version=__version__,
-        total_accesses=trace.metadata.total_accesses,
-        unique_addresses=trace.metadata.unique_addresses,
-        read_count=trace.metadata.read_count,
-        write_count=trace.metadata.write_count,
+        total_accesses=trace_metadata.total_accesses,
+        unique_addresses=trace_metadata.unique_addresses,
+        unique_addresses_error=trace_metadata.unique_addresses_error,
+        read_count=trace_metadata.read_count,
+        write_count=trace_metadata.write_count,
         node_count=graph.number_of_nodes(),
         edge_count=graph.number_of_edges(),
         density=graph_stats.density,
@@ -173,5 +202,6 @@ def analyze(
         recommendations=classification.recommendations,
         window_strategy=window_strategy,
         window_size=window_size,
-        granularity=granularity,
+        granularity=gran.label,
+        edge_weight_error=builder.edge_weight_error,
     )
@@ -8,12 +8,28 @@ from rich.console import Console  # type: ignore
 from rich.table import Table  # type: ignore
 from rich.panel import Panel  # type: ignore
 
-from memgraph.trace.parser import parse_trace
+from memgraph.trace.cardinality import (
+    DEFAULT_ERROR,
+    CardinalityConfig,
+    format_unique_addresses,
+)
+from memgraph.trace.parser import parse_trace, stream_trace
 from memgraph.trace.generator import GENERATORS, get_available_patterns
 from memgraph.trace.formats.native import NativeParser
+from memgraph.trace.formats.binary import BinaryParser
 from memgraph.graph.builder import GraphBuilder
-from memgraph.graph.windowing import WindowStrategy, FixedWindow, SlidingWindow, AdaptiveWindow
+from memgraph.graph.transitions import TransitionGraphBuilder
+from memgraph.graph.windowing import (
+    WindowStrategy,
+    FixedWindow,
+    SlidingWindow,
+    AdaptiveWindow,
+    TimeWindow,
+)
 from memgraph.graph.coarsening import Granularity
+from memgraph.graph.csr import AnyGraph
+from memgraph.graph.edges import SpillConfig, TemporalNeighbors, WindowMemo
+from memgraph.graph.sketch import SketchConfig
 from memgraph.graph.stats import GraphStats
 from memgraph.graph.serialization import save_graph, load_graph
 from memgraph.graphlets.enumeration import GraphletEnumerator
@@ -36,6 +52,18 @@ app = typer.Typer(
 console = Console()
 
 
+def _temporal_neighbors(
+    neighbors: Optional[int],
+    decay: Optional[float]
+) -> Optional[TemporalNeighbors]:
+    """Return the edge model selected by --neighbors and --decay."""
+    if neighbors is None:
+        if decay is not None:
+            raise ValueError("--decay requires --neighbors")
+        return None
+    return TemporalNeighbors(neighbors, decay)
+
+
 @app.command()
 def parse(
     trace_file: Path = typer.Argument(
@@ -49,13 +77,44 @@ def parse(
         None,
         "--format",
         "-f",
-        help="Trace format (native, lackey, csv). Auto-detected if not specified."
+        help="Trace format (binary, native, lackey, csv). Auto-detected if not specified."
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes for parsing large lackey/csv traces"
+    ),
+    approx_unique: bool = typer.Option(
+        False,
+        "--approx-unique",
+        help="Estimate unique addresses with HyperLogLog instead of counting exactly"
+    ),
+    unique_error: float = typer.Option(
+        DEFAULT_ERROR,
+        "--unique-error",
+        help="Relative standard error of the unique-address estimate"
+    ),
+    unique_budget: Optional[int] = typer.Option(
+        None,
+        "--unique-budget",
+        min=0,
+        help="Memory budget (MB) for exact unique counting; estimate above it"
     ),
 ) -> None:
     """Parse a trace file and display summary statistics."""
     try:
+        cardinality = CardinalityConfig(
+            exact=not approx_unique,
+            memory_budget=None if unique_budget is None else unique_budget << 20,
+            error=unique_error,
+        )
+
         # Parse the trace
-        trace = parse_trace(trace_file, format=format)
+        trace = parse_trace(
+            trace_file, format=format, workers=jobs, cardinality=cardinality
+        )
 
         # Create a rich table for the summary
         meta = trace.metadata
@@ -69,7 +128,8 @@ def parse(
             f"[cyan]Source:[/cyan] {meta.source}",
             f"[cyan]Format:[/cyan] {meta.format}",
             f"[cyan]Total accesses:[/cyan] {meta.total_accesses:,}",
-            f"[cyan]Unique addresses:[/cyan] {meta.unique_addresses:,}",
+            "[cyan]Unique addresses:[/cyan] "
+            + format_unique_addresses(meta.unique_addresses, meta.unique_addresses_error),
             f"[cyan]Reads:[/cyan] {meta.read_count:,} ({read_pct:.1f}%)",
             f"[cyan]Writes:[/cyan] {meta.write_count:,} ({write_pct:.1f}%)",
             f"[cyan]Address range:[/cyan] {hex(meta.address_range[0])} - {hex(meta.address_range[1])}",
@@ -129,9 +189,22 @@ def generate(
         "--seed",
         help="Random seed for reproducibility"
     ),
+    output_format: str = typer.Option(
+        "native",
+        "--format",
+        "-f",
+        help="Output format: native (text) or binary"
+    ),
 ) -> None:
     """Generate a synthetic trace with the specified pattern."""
     try:
+        # Validate output format
+        output_format = output_format.lower()
+        if output_format not in ("native", "binary"):
+            console.print(f"[red]Error:[/red] Unknown output format: {output_format}")
+            console.print("Available: native, binary")
+            raise typer.Exit(1)
+
         # Validate pattern
         if pattern not in GENERATORS:
             console.print(
@@ -158,9 +231,11 @@ def generate(
             # Fallback
             trace = generator(n=size)  # type: ignore
 
-        # Write trace to file in native format
-        parser = NativeParser()
-        parser.write(trace, output)
+        # Write trace to file in native or binary format
+        if output_format == "binary":
+            BinaryParser().write(trace, output)
+        else:
+            NativeParser().write(trace, output)
 
         console.print(
             f"[green]✓[/green] Generated {size:,} memory accesses "
@@ -175,6 +250,64 @@ def generate(
         raise typer.Exit(1)
 
 
+@app.command()
+def convert(
+    trace_file: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        help="Path to trace file"
+    ),
+    output: Path = typer.Option(
+        ...,
+        "--output",
+        "-o",
+        help="Output file path"
+    ),
+    output_format: str = typer.Option(
+        "binary",
+        "--to",
+        help="Output format: binary or native"
+    ),
+    trace_format: Optional[str] = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="Input trace format (auto-detect if not specified)"
+    ),
+) -> None:
+    """Convert a trace file to the native text or binary format."""
+    try:
+        output_format = output_format.lower()
+        if output_format not in ("native", "binary"):
+            console.print(f"[red]Error:[/red] Unknown output format: {output_format}")
+            console.print("Available: native, binary")
+            raise typer.Exit(1)
+
+        trace = parse_trace(trace_file, format=trace_format)
+
+        if output_format == "binary":
+            BinaryParser().write(trace, output)
+        else:
+            NativeParser().write(trace, output)
+
+        console.print(
+            f"[green]✓[/green] Converted {len(trace):,} memory accesses "
+            f"({trace.metadata.format} → {output_format}) → {output}"
+        )
+
+    except FileNotFoundError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Unexpected error:[/red] {e}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def formats() -> None:
     """List supported trace formats."""
@@ -184,6 +317,11 @@ def formats() -> None:
     table.add_column("Description", style="white")
     table.add_column("Example", style="dim")
 
+    table.add_row(
+        "binary",
+        "MemGraph native binary format (v2, memory-mapped)",
+        "MGTRACE2 header + 24-byte records"
+    )
     table.add_row(
         "native",
         "MemGraph native format",
@@ -248,29 +386,29 @@ def build(
         ...,
         "--output",
         "-o",
-        help="Output graph file path"
+        help="Output graph file path (.npz saves a compact CSR graph)"
     ),
     window: str = typer.Option(
         "fixed",
         "--window",
         "-w",
-        help="Window strategy: fixed, sliding, adaptive"
+        help="Window strategy: fixed, sliding, adaptive, time"
     ),
     window_size: int = typer.Option(
         100,
         "--window-size",
-        help="Window size (number of accesses)"
+        help="Window size (number of accesses, or timestamp units for time windows)"
     ),
-    step: int = typer.Option(
-        1,
+    step: Optional[int] = typer.Option(
+        None,
         "--step",
-        help="Step size for sliding window"
+        help="Step size for sliding and time windows (default: 1 for sliding, the window size for time)"
     ),
     granularity: str = typer.Option(
         "cacheline",
         "--granularity",
         "-g",
-        help="Address granularity: byte, cacheline, page"
+        help="Address granularity: byte, cacheline, line_pair, page, huge_page, giga_page, or a power-of-two size (e.g. 256, 2MB)"
     ),
     min_weight: int = typer.Option(
         1,
@@ -288,12 +426,66 @@ def build(
         "-f",
         help="Trace format (auto-detect if not specified)"
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes for parsing lackey/csv traces and building the graph"
+    ),
+    edge_budget: Optional[int] = typer.Option(
+        None,
+        "--edge-budget",
+        min=1,
+        help="Memory budget (MB) for aggregated edges; spill sorted runs to disk above it"
+    ),
+    edge_sketch: Optional[int] = typer.Option(
+        None,
+        "--edge-sketch",
+        min=1,
+        help="Count edges in a count-min sketch of this many MB and keep only those reaching --min-weight"
+    ),
+    neighbors: Optional[int] = typer.Option(
+        None,
+        "--neighbors",
+        "-k",
+        min=1,
+        help="Link each access only to its k nearest predecessors instead of the whole window"
+    ),
+    decay: Optional[float] = typer.Option(
+        None,
+        "--decay",
+        help="With --neighbors, weight a pair at distance d by decay**(d-1) (0 < decay <= 1)"
+    ),
+    min_node_frequency: int = typer.Option(
+        1,
+        "--min-node-frequency",
+        min=1,
+        help="Drop accesses to addresses accessed fewer times than this before windowing"
+    ),
+    top_nodes: Optional[int] = typer.Option(
+        None,
+        "--top-nodes",
+        min=1,
+        help="Keep only accesses to the N most frequently accessed addresses"
+    ),
+    memo_windows: Optional[int] = typer.Option(
+        None,
+        "--memo-windows",
+        min=1,
+        help="Form each repeated window's clique once, remembering up to this many distinct windows"
+    ),
+    transitions: bool = typer.Option(
+        False,
+        "--transitions",
+        help="Build a directed graph of next-access transitions instead (window options are ignored)"
+    ),
 ) -> None:
     """Build a temporal adjacency graph from a trace file."""
     try:
         # Parse trace
         console.print(f"[cyan]Parsing trace:[/cyan] {trace_file}")
-        trace = parse_trace(trace_file, format=trace_format)
+        trace = parse_trace(trace_file, format=trace_format, workers=jobs)
         console.print(f"  Loaded {len(trace):,} memory accesses")
 
         # Select window strategy
@@ -302,39 +494,67 @@ def build(
         if window == "fixed":
             strategy = FixedWindow(size=window_size)
         elif window == "sliding":
-            strategy = SlidingWindow(size=window_size, step=step)
+            strategy = SlidingWindow(size=window_size, step=1 if step is None else step)
         elif window == "adaptive":
             strategy = AdaptiveWindow(base_size=window_size)
+        elif window == "time":
+            strategy = TimeWindow(duration=window_size, step=step)
         else:
             console.print(f"[red]Error:[/red] Unknown window strategy: {window}")
-            console.print("Available: fixed, sliding, adaptive")
+            console.print("Available: fixed, sliding, adaptive, time")
             raise typer.Exit(1)
 
         # Select granularity
-        granularity_map = {
-            "byte": Granularity.BYTE,
-            "cacheline": Granularity.CACHELINE,
-            "page": Granularity.PAGE,
-        }
-        granularity = granularity.lower()
-        if granularity not in granularity_map:
-            console.print(f"[red]Error:[/red] Unknown granularity: {granularity}")
-            console.print("Available: byte, cacheline, page")
+        try:
+            gran = Granularity.parse(granularity)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
-
-        gran = granularity_map[granularity]
+        granularity = gran.label
+
+        if transitions:
+            console.print(f"[cyan]Building transition graph:[/cyan] {granularity} granularity")
+            directed = TransitionGraphBuilder(gran, min_edge_weight=min_weight).build(trace)
+            # Only pickle and graphml keep edge direction
+            graph_format = "graphml" if output.suffix.lower() in (".graphml", ".xml") else "pickle"
+            save_graph(directed, output, format=graph_format)
+            console.print(f"[green]✓[/green] Graph saved to: {output}")
+            if show_stats:
+                console.print(Panel(
+                    GraphStats.from_graph(directed).format_summary(),
+                    title="[bold]Graph Statistics[/bold]",
+                    border_style="green",
+                    padding=(1, 2),
+                ))
+            return
 
         # Build graph
         console.print(f"[cyan]Building graph:[/cyan] {window} window, {granularity} granularity")
         builder = GraphBuilder(
             window_strategy=strategy,
             granularity=gran,
-            min_edge_weight=min_weight
+            min_edge_weight=min_weight,
+            workers=jobs,
+            spill=None if edge_budget is None else SpillConfig(edge_budget << 20),
+            sketch=None if edge_sketch is None else SketchConfig(edge_sketch << 20),
+            neighbors=_temporal_neighbors(neighbors, decay),
+            min_node_frequency=min_node_frequency,
+            top_n_nodes=top_nodes,
+            memo=None if memo_windows is None else WindowMemo(memo_windows)
         )
-        graph = builder.build(trace)
+        graph = builder.build_csr(trace)
+        if min_node_frequency > 1 or top_nodes is not None:
+            console.print(
+                f"  Dropped {builder.dropped_access_fraction:.1%} of accesses to cold addresses"
+            )
+        if builder.sketch is not None:
+            console.print(
+                f"  Edge weights from a count-min sketch may overcount by up to "
+                f"{builder.edge_weight_error:,} (confidence {builder.sketch.confidence:.1%})"
+            )
 
-        # Save graph
-        save_graph(graph, output)
+        # Save graph (compact CSR arrays for .npz, otherwise a NetworkX pickle)
+        save_graph(graph, output, format="npz" if output.suffix.lower() == ".npz" else "pickle")
         console.print(f"[green]✓[/green] Graph saved to: {output}")
 
         # Show statistics if requested
@@ -680,18 +900,18 @@ def analyze(
         "fixed",
         "--window",
         "-w",
-        help="Window strategy: fixed, sliding, adaptive"
+        help="Window strategy: fixed, sliding, adaptive, time"
     ),
     window_size: int = typer.Option(
         100,
         "--window-size",
-        help="Window size (number of accesses)"
+        help="Window size (number of accesses, or timestamp units for time windows)"
     ),
     granularity: str = typer.Option(
         "cacheline",
         "--granularity",
         "-g",
-        help="Address granularity: byte, cacheline, page"
+        help="Address granularity: byte, cacheline, line_pair, page, huge_page, giga_page, a power-of-two size (e.g. 256, 2MB), or all (combined report)"
     ),
     sample: bool = typer.Option(
         False,
@@ -727,6 +947,47 @@ def analyze(
         "-o",
         help="Output file for json/html reports"
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Stream the trace instead of loading it (memory bounded by window and graph size)"
+    ),
+    min_weight: int = typer.Option(
+        1,
+        "--min-weight",
+        help="Minimum edge weight to include"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker processes for parsing lackey/csv traces and building the graph"
+    ),
+    edge_budget: Optional[int] = typer.Option(
+        None,
+        "--edge-budget",
+        min=1,
+        help="Memory budget (MB) for aggregated edges; spill sorted runs to disk above it"
+    ),
+    edge_sketch: Optional[int] = typer.Option(
+        None,
+        "--edge-sketch",
+        min=1,
+        help="Count edges in a count-min sketch of this many MB and keep only those reaching --min-weight"
+    ),
+    neighbors: Optional[int] = typer.Option(
+        None,
+        "--neighbors",
+        "-k",
+        min=1,
+        help="Link each access only to its k nearest predecessors instead of the whole window"
+    ),
+    decay: Optional[float] = typer.Option(
+        None,
+        "--decay",
+        help="With --neighbors, weight a pair at distance d by decay**(d-1) (0 < decay <= 1)"
+    ),
 ) -> None:
     """End-to-end analysis: parse trace, build graph, and classify pattern."""
     try:
@@ -749,11 +1010,6 @@ def analyze(
             console.print("Available: cosine, euclidean, manhattan")
             raise typer.Exit(1)
 
-        # Parse trace
-        console.print(f"[cyan]Step 1/4: Parsing trace[/cyan] {trace_file}")
-        trace = parse_trace(trace_file, format=trace_format)
-        console.print(f"  → Loaded {len(trace):,} memory accesses")
-
         # Select window strategy
         window = window.lower()
         strategy: WindowStrategy
@@ -763,87 +1019,156 @@ def analyze(
             strategy = SlidingWindow(size=window_size, step=1)
         elif window == "adaptive":
             strategy = AdaptiveWindow(base_size=window_size)
+        elif window == "time":
+            strategy = TimeWindow(duration=window_size)
         else:
             console.print(f"[red]Error:[/red] Unknown window strategy: {window}")
-            console.print("Available: fixed, sliding, adaptive")
+            console.print("Available: fixed, sliding, adaptive, time")
             raise typer.Exit(1)
 
         # Select granularity
-        granularity_map = {
-            "byte": Granularity.BYTE,
-            "cacheline": Granularity.CACHELINE,
-            "page": Granularity.PAGE,
-        }
         granularity = granularity.lower()
-        if granularity not in granularity_map:
-            console.print(f"[red]Error:[/red] Unknown granularity: {granularity}")
-            console.print("Available: byte, cacheline, page")
-            raise typer.Exit(1)
-
-        gran = granularity_map[granularity]
-
-        # Build graph
-        console.print(f"[cyan]Step 2/4: Building graph[/cyan] ({window} window, {granularity})")
-        builder = GraphBuilder(window_strategy=strategy, granularity=gran)
-        graph = builder.build(trace)
-        console.print(f"  → Graph: {graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges")
-
-        # Compute graph stats
-        graph_stats = GraphStats.from_graph(graph)
-
-        # Enumerate graphlets
-        console.print(f"[cyan]Step 3/4: Computing graphlet signature[/cyan]")
-        if sample:
-            sampler = GraphletSampler(graph)
-            counts = sampler.sample_count(num_samples=num_samples)
-            console.print(f"  → Sampled {num_samples:,} graphlets")
+        granularities: list[Granularity]
+        if granularity == "all":
+            if stream:
+                console.print("[red]Error:[/red] --granularity all can't be combined with --stream")
+                raise typer.Exit(1)
+            if report == "html":
+                console.print("[red]Error:[/red] --granularity all supports cli and json reports")
+                raise typer.Exit(1)
+            granularities = list(Granularity)
         else:
-            enumerator = GraphletEnumerator(graph)
-            counts = enumerator.count_all()
-            console.print(f"  → Enumerated {counts.total:,} graphlets")
-
-        signature = GraphletSignature.from_counts(counts)
+            try:
+                granularities = [Granularity.parse(granularity)]
+            except ValueError as e:
+                console.print(f"[red]Error:[/red] {e}")
+                raise typer.Exit(1)
+            granularity = granularities[0].label
+
+        spill = None if edge_budget is None else SpillConfig(edge_budget << 20)
+        sketch = None if edge_sketch is None else SketchConfig(edge_sketch << 20)
+        edge_model = _temporal_neighbors(neighbors, decay)
+        graphs: dict[str, AnyGraph] = {}
+        if stream:
+            # Parse and build in one pass over the file
+            builder = GraphBuilder(
+                window_strategy=strategy,
+                granularity=granularities[0],
+                min_edge_weight=min_weight,
+                spill=spill,
+                sketch=sketch,
+                neighbors=edge_model,
+            )
+            console.print(f"[cyan]Step 1/4: Streaming trace[/cyan] {trace_file}")
+            console.print(f"[cyan]Step 2/4: Building graph[/cyan] ({window} window, {granularity})")
+            trace_stream = stream_trace(trace_file, format=trace_format)
+            graphs[granularity] = builder.build_stream(trace_stream.addresses())
+            trace_metadata = trace_stream.metadata
+            console.print(f"  → Streamed {trace_metadata.total_accesses:,} memory accesses")
+        else:
+            # Parse trace
+            console.print(f"[cyan]Step 1/4: Parsing trace[/cyan] {trace_file}")
+            trace = parse_trace(trace_file, format=trace_format, workers=jobs)
+            trace_metadata = trace.metadata
+            console.print(f"  → Loaded {len(trace):,} memory accesses")
+
+            # Build graph(s)
+            console.print(f"[cyan]Step 2/4: Building graph[/cyan] ({window} window, {granularity})")
+            if len(granularities) > 1:
+                # Window once, build every granularity from the same windows
+                builder = GraphBuilder(
+                    window_strategy=strategy,
+                    min_edge_weight=min_weight,
+                    workers=jobs,
+                    spill=spill,
+                    sketch=sketch,
+                    neighbors=edge_model,
+                )
+                built = builder.build_multi_csr(trace, granularities)
+                graphs = {gran.label: graph for gran, graph in built.items()}
+            else:
+                builder = GraphBuilder(
+                    window_strategy=strategy,
+                    granularity=granularities[0],
+                    min_edge_weight=min_weight,
+                    workers=jobs,
+                    spill=spill,
+                    sketch=sketch,
+                    neighbors=edge_model,
+                )
+                graphs[granularity] = builder.build_csr(trace)
+        for name, graph in graphs.items():
+            label = f"{name}: " if len(graphs) > 1 else ""
+            console.print(f"  → {label}Graph: {graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges")
 
-        # Classify pattern
-        console.print(f"[cyan]Step 4/4: Classifying pattern[/cyan]")
         classifier = PatternClassifier(metric=metric)  # type: ignore
-        classification = classifier.classify(signature)
-
-        # Build AnalysisResult
-        analysis_result = AnalysisResult(
-            trace_source=str(trace_file),
-            analysis_timestamp=datetime.now(),
-            memgraph_version=__version__,
-            total_accesses=trace.metadata.total_accesses,
-            unique_addresses=trace.metadata.unique_addresses,
-            read_count=trace.metadata.read_count,
-            write_count=trace.metadata.write_count,
-            node_count=graph.number_of_nodes(),
-            edge_count=graph.number_of_edges(),
-            density=graph_stats.density,
-            avg_degree=graph_stats.avg_degree,
-            avg_clustering=graph_stats.avg_clustering,
-            graphlet_counts=counts.to_dict(),
-            graphlet_frequencies=signature.to_dict(),
-            detected_pattern=classification.pattern_name,
-            confidence=classification.confidence,
-            all_similarities=classification.all_similarities,
-            recommendations=classification.recommendations,
-            window_strategy=window,
-            window_size=window_size,
-            granularity=granularity,
-        )
+        results = []
+        for name, graph in graphs.items():
+            label = f" ({name})" if len(graphs) > 1 else ""
+
+            # Compute graph stats
+            graph_stats = GraphStats.from_graph(graph)
+
+            # Enumerate graphlets
+            console.print(f"[cyan]Step 3/4: Computing graphlet signature[/cyan]{label}")
+            if sample:
+                sampler = GraphletSampler(graph)
+                counts = sampler.sample_count(num_samples=num_samples)
+                console.print(f"  → Sampled {num_samples:,} graphlets")
+            else:
+                enumerator = GraphletEnumerator(graph)
+                counts = enumerator.count_all()
+                console.print(f"  → Enumerated {counts.total:,} graphlets")
+
+            signature = GraphletSignature.from_counts(counts)
+
+            # Classify pattern
+            console.print(f"[cyan]Step 4/4: Classifying pattern[/cyan]{label}")
+            classification = classifier.classify(signature)
+
+            # Build AnalysisResult
+            results.append(AnalysisResult(
+                trace_source=str(trace_file),
+                analysis_timestamp=datetime.now(),
+                memgraph_version=__version__,
+                total_accesses=trace_metadata.total_accesses,
+                unique_addresses=trace_metadata.unique_addresses,
+                unique_addresses_error=trace_metadata.unique_addresses_error,
+                read_count=trace_metadata.read_count,
+                write_count=trace_metadata.write_count,
+                node_count=graph.number_of_nodes(),
+                edge_count=graph.number_of_edges(),
+                density=graph_stats.density,
+                avg_degree=graph_stats.avg_degree,
+                avg_clustering=graph_stats.avg_clustering,
+                graphlet_counts=counts.to_dict(),
+                graphlet_frequencies=signature.to_dict(),
+                detected_pattern=classification.pattern_name,
+                confidence=classification.confidence,
+                all_similarities=classification.all_similarities,
+                recommendations=classification.recommendations,
+                window_strategy=window,
+                window_size=window_size,
+                granularity=name,
+                edge_weight_error=builder.edge_weight_error,
+            ))
 
         # Generate report
         console.print("")
-        if report == "cli":
-            CLIReporter(console).report(analysis_result)
+        if len(results) > 1:
+            if report == "cli":
+                CLIReporter(console).report_multi(results)
+            else:
+                JSONReporter().report_multi(results, output)
+                console.print(f"[green]✓[/green] JSON report saved to: {output}")
+        elif report == "cli":
+            CLIReporter(console).report(results[0])
         elif report == "json":
-            JSONReporter().report(analysis_result, output)
+            JSONReporter().report(results[0], output)
             console.print(f"[green]✓[/green] JSON report saved to: {output}")
         elif report == "html":
             console.print("[cyan]Generating HTML report...[/cyan]")
-            HTMLReporter().report(analysis_result, output)  # type: ignore
+            HTMLReporter().report(results[0], output)  # type: ignore
             console.print(f"[green]✓[/green] HTML report saved to: {output}")
 
     except FileNotFoundError as e:
@@ -874,18 +1199,18 @@ def run(
         "fixed",
         "--window",
         "-w",
-        help="Window strategy: fixed, sliding, adaptive"
+        help="Window strategy: fixed, sliding, adaptive, time"
     ),
     window_size: int = typer.Option(
         100,
         "--window-size",
-        help="Window size (number of accesses)"
+        help="Window size (number of accesses, or timestamp units for time windows)"
     ),
     granularity: str = typer.Option(
         "cacheline",
         "--granularity",
         "-g",
-        help="Address granularity: byte, cacheline, page"
+        help="Address granularity: byte, cacheline, line_pair, page, huge_page, giga_page, or a power-of-two size (e.g. 256, 2MB)"
     ),
     sample: bool = typer.Option(
         False,
@@ -1009,29 +1334,25 @@ def run(
             strategy = SlidingWindow(size=window_size, step=1)
         elif window == "adaptive":
             strategy = AdaptiveWindow(base_size=window_size)
+        elif window == "time":
+            strategy = TimeWindow(duration=window_size)
         else:
             console.print(f"[red]Error:[/red] Unknown window strategy: {window}")
-            console.print("Available: fixed, sliding, adaptive")
+            console.print("Available: fixed, sliding, adaptive, time")
             raise typer.Exit(1)
 
         # Select granularity
-        granularity_map = {
-            "byte": Granularity.BYTE,
-            "cacheline": Granularity.CACHELINE,
-            "page": Granularity.PAGE,
-        }
-        granularity = granularity.lower()
-        if granularity not in granularity_map:
-            console.print(f"[red]Error:[/red] Unknown granularity: {granularity}")
-            console.print("Available: byte, cacheline, page")
+        try:
+            gran = Granularity.parse(granularity)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
             raise typer.Exit(1)
-
-        gran = granularity_map[granularity]
+        granularity = gran.label
 
         # Step 3: Build graph
         console.print(f"[cyan]Step 3/5: Building graph[/cyan] ({window} window, {granularity})")
         builder = GraphBuilder(window_strategy=strategy, granularity=gran)
-        graph = builder.build(trace)
+        graph = builder.build_csr(trace)
         console.print(f"  → Graph: {graph.number_of_nodes():,} nodes, {graph.number_of_edges():,} edges")
 
         # Compute graph stats
@@ -1062,6 +1383,7 @@ def run(
             memgraph_version=__version__,
             total_accesses=trace.metadata.total_accesses,
             unique_addresses=trace.metadata.unique_addresses,
+            unique_addresses_error=trace.metadata.unique_addresses_error,
             read_count=trace.metadata.read_count,
             write_count=trace.metadata.write_count,
             node_count=graph.number_of_nodes(),
@@ -1,19 +1,40 @@
 """Graph construction and analysis modules."""
 
-from memgraph.graph.coarsening import Granularity, coarsen_address
-from memgraph.graph.windowing import WindowStrategy, FixedWindow, SlidingWindow, AdaptiveWindow
+from memgraph.graph.coarsening import Granularity, coarsen_address, coarsen_addresses
+from memgraph.graph.windowing import (
+    WindowStrategy,
+    FixedWindow,
+    SlidingWindow,
+    AdaptiveWindow,
+    TimeWindow,
+)
 from memgraph.graph.builder import GraphBuilder
+from memgraph.graph.transitions import TransitionGraphBuilder
+from memgraph.graph.edges import SpillConfig, TemporalNeighbors, WindowMemo
+from memgraph.graph.sketch import CountMinSketch, SketchConfig
+from memgraph.graph.dense import DenseGraph
+from memgraph.graph.csr import CSRGraph
 from memgraph.graph.stats import GraphStats
 from memgraph.graph.serialization import save_graph, load_graph
 
 __all__ = [
     "Granularity",
     "coarsen_address",
+    "coarsen_addresses",
     "WindowStrategy",
     "FixedWindow",
     "SlidingWindow",
     "AdaptiveWindow",
+    "TimeWindow",
     "GraphBuilder",
+    "TransitionGraphBuilder",
+    "SpillConfig",
+    "TemporalNeighbors",
+    "WindowMemo",
+    "SketchConfig",
+    "CountMinSketch",
+    "DenseGraph",
+    "CSRGraph",
     "GraphStats",
     "save_graph",
     "load_graph",
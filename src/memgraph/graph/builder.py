@@ -1,12 +1,30 @@
 """Graph builder for constructing temporal adjacency graphs from traces."""
 
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
 import networkx as nx  # type: ignore
-from typing import Optional
+import numpy as np  # type: ignore
+from typing import Iterable, Optional, Sequence
+
+from memgraph.trace.models import Trace, sorted_unique
+from memgraph.graph.windowing import Accesses, WindowStrategy, FixedWindow
+from memgraph.graph.coarsening import Granularity, coarsen_addresses
+from memgraph.graph.csr import CSRGraph
+from memgraph.graph.dense import DenseGraph
+from memgraph.graph.sketch import CountMinSketch, SketchConfig
+from memgraph.graph.edges import (
+    EdgeAggregator,
+    EdgeList,
+    SpillConfig,
+    TemporalNeighbors,
+    WindowMemo,
+    merge_edge_lists,
+    span_edges,
+)
+
 
-from memgraph.trace.models import Trace, MemoryAccess
-from memgraph.graph.windowing import WindowStrategy, FixedWindow
-from memgraph.graph.coarsening import Granularity, coarsen_address
+# Traces shorter than this per worker are not worth a separate process
+MIN_SHARD_ACCESSES = 1 << 18
 
 
 class GraphBuilder:
@@ -16,13 +34,30 @@ class GraphBuilder:
     memory addresses within temporal windows. Nodes are memory addresses (or
     coarsened addresses), and edges connect addresses that appear together
     within a window. Edge weights represent co-occurrence frequency.
+
+    With a SketchConfig, edge weights are counted in a count-min sketch and
+    only edges estimated to reach `min_edge_weight` are stored. Such
+    weights may be too high; after each build `edge_weight_error` holds the
+    bound on the overcount (0 for exact builds).
+
+    With `min_node_frequency` or `top_n_nodes`, accesses to cold coarsened
+    addresses are dropped before the trace is windowed, so they never
+    enter a window's clique; after each build `dropped_access_fraction`
+    holds the fraction of accesses dropped.
     """
 
     def __init__(
         self,
         window_strategy: Optional[WindowStrategy] = None,
         granularity: Granularity = Granularity.CACHELINE,
-        min_edge_weight: int = 1
+        min_edge_weight: int = 1,
+        workers: int = 1,
+        spill: Optional[SpillConfig] = None,
+        sketch: Optional[SketchConfig] = None,
+        neighbors: Optional[TemporalNeighbors] = None,
+        min_node_frequency: int = 1,
+        top_n_nodes: Optional[int] = None,
+        memo: Optional[WindowMemo] = None
     ):
         """Initialize graph builder.
 
@@ -33,10 +68,68 @@ class GraphBuilder:
                 Defaults to CACHELINE (64 bytes).
             min_edge_weight: Minimum edge weight to include in graph.
                 Edges with weight < min_edge_weight are filtered out.
+            workers: Number of processes to aggregate edges with. Windows
+                are split into contiguous shards, one per process, and the
+                shards' edges are merged. Streaming builds are serial.
+            spill: Bound the memory of edge aggregation by spilling sorted
+                runs of edges to disk (see SpillConfig); edges lighter than
+                min_edge_weight are dropped while the runs are merged.
+                Spilling builds are serial.
+            sketch: Count edge weights in a count-min sketch of this size
+                (one per granularity) and keep exact weights only for edges
+                whose estimate reaches min_edge_weight, so memory is bounded
+                by the heavy edges rather than by all pairs observed. Every
+                edge of weight >= min_edge_weight is kept; light edges may
+                be kept too, and weights may be overcounted by up to the
+                sketch's error bound. Sketched builds are serial.
+            neighbors: Link each access only to its nearest predecessors in
+                the window instead of forming the window's clique (see
+                TemporalNeighbors), so wide windows give O(n * k) edges.
+                Decayed weights are floats and cannot be spilled or
+                sketched.
+            min_node_frequency: Drop accesses to coarsened addresses
+                accessed fewer times than this in the whole trace. Windows
+                are then taken over the remaining accesses (time windows
+                keep the original timestamps). Streaming builds can't
+                count frequencies ahead and don't support it.
+            top_n_nodes: Keep only the accesses to the N most frequently
+                accessed coarsened addresses (ties go to the lower
+                address); combines with min_node_frequency.
+            memo: Count windows by their set of coarsened addresses and form
+                each distinct set's clique once (see WindowMemo). Pays off
+                when loops repeat window contents; the graph is unchanged.
+                Needs the clique model, i.e. no neighbors.
+
+        Raises:
+            ValueError: If workers is less than 1, both spill and sketch are
+                given, decayed neighbor weights are spilled or sketched,
+                min_node_frequency or top_n_nodes is less than 1, or both
+                memo and neighbors are given
         """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if spill is not None and sketch is not None:
+            raise ValueError("Edges can be sketched or spilled, not both")
+        if neighbors is not None and neighbors.decay is not None and (spill or sketch):
+            raise ValueError("Decayed edge weights cannot be spilled or sketched")
+        if min_node_frequency < 1:
+            raise ValueError("min_node_frequency must be at least 1")
+        if top_n_nodes is not None and top_n_nodes < 1:
+            raise ValueError("top_n_nodes must be at least 1")
+        if memo is not None and neighbors is not None:
+            raise ValueError("Window memoization needs the clique edge model")
         self.window_strategy = window_strategy or FixedWindow(100)
         self.granularity = granularity
         self.min_edge_weight = min_edge_weight
+        self.workers = workers
+        self.spill = spill
+        self.sketch = sketch
+        self.neighbors = neighbors
+        self.min_node_frequency = min_node_frequency
+        self.top_n_nodes = top_n_nodes
+        self.memo = memo
+        self.edge_weight_error = 0
+        self.dropped_access_fraction = 0.0
 
     def build(self, trace: Trace) -> nx.Graph:
         """Build temporal adjacency graph from trace.
@@ -50,68 +143,273 @@ class GraphBuilder:
             - Edges connect addresses that co-occur within windows
             - Edge weights represent co-occurrence frequency
         """
-        # Track edge weights (co-occurrence counts)
-        edge_weights: dict[tuple[int, int], int] = defaultdict(int)
+        return self.build_dense(trace).to_networkx()
+
+    def build_dense(self, trace: Trace) -> DenseGraph:
+        """Build temporal adjacency graph over dense node IDs.
+
+        Same graph as `build`, but nodes are int32 IDs 0..N-1 into a table
+        of coarsened addresses, and edges are NumPy arrays.
+
+        Args:
+            trace: Memory trace to convert to graph
+
+        Returns:
+            DenseGraph whose address table maps node IDs to addresses
+        """
+        edges, _ = self._trace_edges(trace)
+        return self._dense_graph(edges)
+
+    def build_csr(self, trace: Trace) -> CSRGraph:
+        """Build temporal adjacency graph in compact CSR form.
 
-        # Process each window
-        for window in self.window_strategy.windows(trace.accesses):
-            self._process_window(window, edge_weights)
+        Same graph as `build`, held in a few NumPy arrays rather than
+        NetworkX dicts. GraphStats, GraphletEnumerator and GraphletSampler
+        accept it directly; call `to_networkx` for anything else.
 
-        # Build NetworkX graph
-        graph = self._create_graph(edge_weights)
+        Args:
+            trace: Memory trace to convert to graph
 
-        return graph
+        Returns:
+            CSRGraph whose address table maps node IDs to addresses
+        """
+        return CSRGraph.from_dense(self.build_dense(trace))
 
-    def _process_window(
+    def build_multi(
         self,
-        window: list[MemoryAccess],
-        edge_weights: dict[tuple[int, int], int]
-    ) -> None:
-        """Process a single window and update edge weights.
+        trace: Trace,
+        granularities: Sequence[Granularity] = tuple(Granularity)
+    ) -> dict[Granularity, nx.Graph]:
+        """Build one graph per granularity, windowing the trace once.
+
+        Each graph equals what `build` gives with that granularity; the
+        builder's own granularity is ignored.
 
         Args:
-            window: Window of memory accesses
-            edge_weights: Dictionary tracking edge co-occurrence counts
+            trace: Memory trace to convert to graphs
+            granularities: Granularities to build (default: all of them)
+
+        Returns:
+            Dictionary mapping each granularity to its NetworkX graph
         """
-        # Get unique coarsened addresses in this window
-        addresses = set()
-        for access in window:
-            coarsened = coarsen_address(access.address, self.granularity)
-            addresses.add(coarsened)
-
-        # Skip windows with 0 or 1 unique addresses
-        if len(addresses) <= 1:
-            return
-
-        # Create edges between all pairs in window (clique)
-        addresses_list = sorted(addresses)
-        for i in range(len(addresses_list)):
-            for j in range(i + 1, len(addresses_list)):
-                addr1, addr2 = addresses_list[i], addresses_list[j]
-                # Store edges with smaller address first (canonical form)
-                edge = (addr1, addr2)
-                edge_weights[edge] += 1
-
-    def _create_graph(
+        return {
+            granularity: dense.to_networkx()
+            for granularity, dense in self._multi_dense(trace, granularities).items()
+        }
+
+    def build_multi_csr(
+        self,
+        trace: Trace,
+        granularities: Sequence[Granularity] = tuple(Granularity)
+    ) -> dict[Granularity, CSRGraph]:
+        """Build one CSR graph per granularity, windowing the trace once.
+
+        Args:
+            trace: Memory trace to convert to graphs
+            granularities: Granularities to build (default: all of them)
+
+        Returns:
+            Dictionary mapping each granularity to its CSRGraph
+        """
+        return {
+            granularity: CSRGraph.from_dense(dense)
+            for granularity, dense in self._multi_dense(trace, granularities).items()
+        }
+
+    def _multi_dense(
         self,
-        edge_weights: dict[tuple[int, int], int]
-    ) -> nx.Graph:
-        """Create NetworkX graph from edge weights.
+        trace: Trace,
+        granularities: Sequence[Granularity]
+    ) -> dict[Granularity, DenseGraph]:
+        """Build dense graphs for several granularities (see `build_multi`)."""
+        if not granularities:
+            raise ValueError("At least one granularity is required")
+        granularities = list(dict.fromkeys(granularities))
+        edges, _ = self._multi_edges(trace, granularities)
+        return {
+            granularity: self._dense_graph(edges[granularity])
+            for granularity in granularities
+        }
+
+    def build_stream(self, address_chunks: Iterable[np.ndarray]) -> nx.Graph:
+        """Build temporal adjacency graph from a stream of address chunks.
+
+        Produces the same graph as `build` over the concatenated chunks, but
+        holds only about one window of addresses in memory at a time, so
+        memory use is bounded by the window and graph size rather than the
+        trace length. Pair with `stream_trace` to analyze traces that don't
+        fit in memory.
 
         Args:
-            edge_weights: Dictionary of edge -> weight
+            address_chunks: Iterable of address arrays, in trace order
+
+        Returns:
+            NetworkX undirected graph (see `build`)
+
+        Raises:
+            ValueError: If the builder filters nodes by frequency
+        """
+        if self._filters_nodes():
+            raise ValueError("Node frequency filtering needs the whole trace, not a stream")
+        sketches = self._new_sketches([self.granularity])
+        edges, _ = _window_edges(
+            self.window_strategy.stream(address_chunks),
+            [self.granularity],
+            self.spill,
+            self.min_edge_weight,
+            sketches,
+            self.neighbors,
+            self.memo,
+        )
+        self._record_error(sketches)
+        return self._dense_graph(edges[self.granularity]).to_networkx()
+
+    def _trace_edges(self, trace: Trace) -> tuple[EdgeList, int]:
+        """Aggregate the edges of a whole trace at the builder's granularity.
+
+        Returns:
+            Tuple of (edges, number of windows processed)
+        """
+        edges, window_count = self._multi_edges(trace, [self.granularity])
+        return edges[self.granularity], window_count
+
+    def _multi_edges(
+        self,
+        trace: Trace,
+        granularities: Sequence[Granularity]
+    ) -> tuple[dict[Granularity, EdgeList], int]:
+        """Aggregate the edges of a whole trace at several granularities.
+
+        The trace is windowed once; windows are read as (start, end) spans
+        of the address column, so no window is copied, and each granularity
+        coarsens the same spans. With several workers, the spans are split
+        into contiguous shards aggregated in parallel, unless edges are
+        spilled to disk or sketched. When nodes are filtered by frequency,
+        which accesses remain depends on the granularity, so the filtered
+        trace is windowed once per granularity.
 
         Returns:
-            NetworkX undirected graph
+            Tuple of (edges by granularity, number of windows processed)
         """
-        graph: nx.Graph = nx.Graph()
+        sketches = self._new_sketches(granularities)
+        self.dropped_access_fraction = 0.0
 
-        # Add edges with weights >= min_edge_weight
-        for (node1, node2), weight in edge_weights.items():
-            if weight >= self.min_edge_weight:
-                graph.add_edge(node1, node2, weight=weight)
+        if not self._filters_nodes():
+            edges, window_count = self._windowed_edges(trace, granularities, sketches)
+        else:
+            edges = {}
+            for granularity in granularities:
+                hot, dropped = self._hot_trace(trace, granularity)
+                if granularity == self.granularity:
+                    self.dropped_access_fraction = dropped
+                part, window_count = self._windowed_edges(hot, [granularity], sketches)
+                edges.update(part)
 
-        return graph
+        self._record_error(sketches)
+        return edges, window_count
+
+    def _windowed_edges(
+        self,
+        trace: Trace,
+        granularities: Sequence[Granularity],
+        sketches: Optional[dict[Granularity, CountMinSketch]]
+    ) -> tuple[dict[Granularity, EdgeList], int]:
+        """Window a trace once and aggregate its edges at each granularity."""
+        if not self.window_strategy.implements_spans:
+            # windows()-only strategies may yield windows that have no spans
+            return _window_edges(
+                self.window_strategy.trace_windows(trace),
+                granularities,
+                self.spill,
+                self.min_edge_weight,
+                sketches,
+                self.neighbors,
+                self.memo,
+            )
+
+        addresses = trace.addresses
+        starts, ends = self.window_strategy.trace_spans(trace)
+
+        shards = min(self.workers, len(starts), len(addresses) // MIN_SHARD_ACCESSES)
+        if shards > 1 and self.spill is None and sketches is None:
+            edges = _sharded_edges(
+                addresses, starts, ends, granularities, shards,
+                self.neighbors, self.memo,
+            )
+        else:
+            edges = _span_edges(
+                addresses, starts, ends, granularities,
+                self.spill, self.min_edge_weight, sketches,
+                self.neighbors, self.memo,
+            )
+        return edges, len(starts)
+
+    def _filters_nodes(self) -> bool:
+        """Return True if cold nodes are dropped before windowing."""
+        return self.min_node_frequency > 1 or self.top_n_nodes is not None
+
+    def _hot_trace(self, trace: Trace, granularity: Granularity) -> tuple[Trace, float]:
+        """Drop the accesses to cold coarsened addresses.
+
+        Access counts come from one bincount over dense codes of the
+        coarsened address column.
+
+        Returns:
+            Tuple of (trace of the remaining accesses, fraction dropped)
+        """
+        if len(trace) == 0:
+            return trace, 0.0
+
+        lines = coarsen_addresses(trace.addresses, granularity)
+        unique = sorted_unique(lines)
+        codes = np.searchsorted(unique, lines)
+        counts = np.bincount(codes, minlength=len(unique))
+
+        hot = counts >= self.min_node_frequency
+        if self.top_n_nodes is not None and self.top_n_nodes < len(unique):
+            # Most frequent first; the stable sort breaks ties by address
+            ranked = np.argsort(-counts, kind="stable")
+            hot[ranked[self.top_n_nodes:]] = False
+
+        keep = hot[codes]
+        kept = int(np.count_nonzero(keep))
+        hot_trace = Trace(
+            trace.metadata,
+            addresses=trace.addresses[keep],
+            operations=trace.operations[keep],
+            sizes=trace.sizes[keep],
+            timestamps=trace.get_timestamps()[keep],
+        )
+        return hot_trace, 1.0 - kept / len(trace)
+
+    def _new_sketches(
+        self,
+        granularities: Sequence[Granularity]
+    ) -> Optional[dict[Granularity, CountMinSketch]]:
+        """Create one empty count-min sketch per granularity, if sketching."""
+        if self.sketch is None:
+            return None
+        return {granularity: self.sketch.create() for granularity in granularities}
+
+    def _record_error(
+        self,
+        sketches: Optional[dict[Granularity, CountMinSketch]]
+    ) -> None:
+        """Set `edge_weight_error` from the sketches of the last build."""
+        self.edge_weight_error = max(
+            (sketch.error_bound() for sketch in (sketches or {}).values()), default=0
+        )
+
+    def _dense_graph(self, edges: EdgeList) -> DenseGraph:
+        """Create a dense graph from an aggregated edge list.
+
+        Args:
+            edges: Edges in window order (see EdgeAggregator.result)
+
+        Returns:
+            DenseGraph with edges of weight >= min_edge_weight
+        """
+        return DenseGraph.from_edge_list(edges.filter(self.min_edge_weight))
 
     def build_with_metadata(self, trace: Trace) -> tuple[nx.Graph, dict]:
         """Build graph and return additional metadata.
@@ -125,14 +423,185 @@ class GraphBuilder:
             - total_accesses: Total memory accesses in trace
             - granularity: Coarsening granularity used
             - strategy: Window strategy name
+            - dropped_access_fraction: Fraction of accesses dropped as
+              cold by min_node_frequency / top_n_nodes (0.0 if unused)
+            - edge_sketch: Only for sketched builds: the sketch's width and
+              depth, the bound on how far edge weights may overcount, and
+              the probability that the bound holds
         """
-        graph = self.build(trace)
+        edges, window_count = self._trace_edges(trace)
+        graph = self._dense_graph(edges).to_networkx()
 
         metadata = {
-            "window_count": sum(1 for _ in self.window_strategy.windows(trace.accesses)),
-            "total_accesses": len(trace.accesses),
+            "window_count": window_count,
+            "total_accesses": len(trace),
             "granularity": self.granularity.name,
             "strategy": self.window_strategy.__class__.__name__,
+            "dropped_access_fraction": self.dropped_access_fraction,
         }
+        if self.sketch is not None:
+            metadata["edge_sketch"] = {
+                "width": self.sketch.width,
+                "depth": self.sketch.depth,
+                "error_bound": self.edge_weight_error,
+                "confidence": self.sketch.confidence,
+            }
 
         return graph, metadata
+
+
+def _window_edges(
+    windows: Iterable[Accesses],
+    granularities: Sequence[Granularity],
+    spill: Optional[SpillConfig] = None,
+    min_weight: int = 1,
+    sketches: Optional[dict[Granularity, CountMinSketch]] = None,
+    neighbors: Optional[TemporalNeighbors] = None,
+    memo: Optional[WindowMemo] = None
+) -> tuple[dict[Granularity, EdgeList], int]:
+    """Aggregate the edges of a sequence of windows.
+
+    Edge weights are aggregated by one vectorized EdgeAggregator per
+    granularity: a pair's weight is the number of windows holding both
+    addresses, and edges lighter than `min_weight` are dropped.
+
+    Returns:
+        Tuple of (edges by granularity, number of windows processed)
+    """
+    aggregators = [
+        EdgeAggregator(
+            granularity,
+            spill,
+            sketches[granularity] if sketches else None,
+            min_weight,
+            neighbors,
+            memo,
+        )
+        for granularity in granularities
+    ]
+    window_count = 0
+    for window in windows:
+        for aggregator in aggregators:
+            aggregator.add_window(window)
+        window_count += 1
+
+    edges = {
+        granularity: aggregator.result()
+        for granularity, aggregator in zip(granularities, aggregators)
+    }
+    return edges, window_count
+
+
+def _span_edges(
+    addresses: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    granularities: Sequence[Granularity],
+    spill: Optional[SpillConfig] = None,
+    min_weight: int = 1,
+    sketches: Optional[dict[Granularity, CountMinSketch]] = None,
+    neighbors: Optional[TemporalNeighbors] = None,
+    memo: Optional[WindowMemo] = None
+) -> dict[Granularity, EdgeList]:
+    """Aggregate the edges of windows given as (start, end) spans of `addresses`.
+
+    Overlapping windows (e.g. sliding) are handled incrementally by
+    `span_edges`, which only follows the addresses entering and leaving
+    the window instead of rebuilding every window's clique.
+    """
+    if neighbors is None and _monotone_overlapping(starts, ends):
+        return {
+            granularity: span_edges(
+                addresses, starts, ends, granularity,
+                spill=spill,
+                min_weight=min_weight,
+                sketch=sketches[granularity] if sketches else None,
+            )
+            for granularity in granularities
+        }
+
+    edges, _ = _window_edges(
+        (addresses[start:end] for start, end in zip(starts.tolist(), ends.tolist())),
+        granularities,
+        spill,
+        min_weight,
+        sketches,
+        neighbors,
+        memo,
+    )
+    return edges
+
+
+def _shard_edges(
+    addresses: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    granularities: Sequence[Granularity],
+    first_window: int,
+    neighbors: Optional[TemporalNeighbors],
+    memo: Optional[WindowMemo]
+) -> dict[Granularity, EdgeList]:
+    """Process pool entry point: aggregate the edges of one shard of windows.
+
+    Window numbers are offset by `first_window`, the shard's first window
+    in the whole trace.
+    """
+    edges = _span_edges(
+        addresses, starts, ends, granularities, neighbors=neighbors, memo=memo
+    )
+    for shard in edges.values():
+        shard.first_window += first_window
+    return edges
+
+
+def _sharded_edges(
+    addresses: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    granularities: Sequence[Granularity],
+    shards: int,
+    neighbors: Optional[TemporalNeighbors] = None,
+    memo: Optional[WindowMemo] = None
+) -> dict[Granularity, EdgeList]:
+    """Aggregate edges with a process pool, one contiguous range of windows each.
+
+    Every window belongs to exactly one shard, so summing the shards'
+    weights per pair gives the whole trace's weights. Workers receive only
+    the address range their windows cover and return edge arrays, which
+    are merged with `merge_edge_lists`.
+    """
+    bounds = np.linspace(0, len(starts), shards + 1).astype(np.int64).tolist()
+    with ProcessPoolExecutor(max_workers=shards) as pool:
+        futures = []
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            shard_starts = starts[first:last]
+            shard_ends = ends[first:last]
+            low = int(shard_starts.min())
+            high = int(shard_ends.max())
+            futures.append(pool.submit(
+                _shard_edges,
+                addresses[low:high],
+                shard_starts - low,
+                shard_ends - low,
+                granularities,
+                first,
+                neighbors,
+                memo,
+            ))
+        results = [future.result() for future in futures]
+
+    return {
+        granularity: merge_edge_lists(result[granularity] for result in results)
+        for granularity in granularities
+    }
+
+
+def _monotone_overlapping(starts: np.ndarray, ends: np.ndarray) -> bool:
+    """Return True if windows overlap and both offsets never decrease."""
+    if len(starts) < 2:
+        return False
+    return bool(
+        np.all(starts[1:] >= starts[:-1])
+        and np.all(ends[1:] >= ends[:-1])
+        and np.any(starts[1:] < ends[:-1])
+    )
@@ -1,25 +1,103 @@
 """Address coarsening for different granularities."""
 
+import re
 from enum import Enum
+from typing import Optional, TypeGuard
+
+import numpy as np  # type: ignore
+
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+_SIZE_PATTERN = re.compile(r"^(0x[0-9a-f]+|\d+)\s*([kmgt]?)(?:i?b)?$", re.IGNORECASE)
 
 
 class Granularity(Enum):
-    """Memory address granularity levels."""
+    """Memory address granularity levels.
+
+    The named members cover the usual hardware units. Any other power of
+    two is also a valid granularity: ``Granularity(8192)`` returns a member
+    named after its size ("8KB"), which is not listed when iterating the
+    enum. Each member's shift is computed once, so coarsening is a single
+    shift.
+    """
+
+    BYTE = 1                # No coarsening
+    CACHELINE = 64          # 64-byte cache lines
+    LINE_PAIR = 128         # Adjacent cache-line pairs (spatial prefetcher)
+    PAGE = 4096             # 4KB pages
+    HUGE_PAGE = 1 << 21     # 2MB huge pages
+    GIGA_PAGE = 1 << 30     # 1GB huge pages
+
+    shift_bits: int  # Number of bits to shift for this granularity
+
+    def __init__(self, size: int):
+        self.shift_bits = size.bit_length() - 1
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["Granularity"]:
+        """Create a member for a power-of-two size that has no name."""
+        if not _is_power_of_two(value):
+            return None
+        member = object.__new__(cls)
+        member._name_ = _format_size(value)
+        member._value_ = value
+        member.shift_bits = value.bit_length() - 1
+        return cls._value2member_map_.setdefault(value, member)  # type: ignore[return-value]
+
+    @classmethod
+    def parse(cls, text: str) -> "Granularity":
+        """Parse a granularity name or power-of-two size.
+
+        Args:
+            text: Member name (e.g. "cacheline", "huge_page") or size in
+                bytes with an optional unit (e.g. "128", "2MB", "1GiB", "4k")
+
+        Returns:
+            Matching Granularity
+
+        Raises:
+            ValueError: If the text is not a name or a power-of-two size
+        """
+        name = text.strip().upper().replace("-", "_")
+        if name in cls.__members__:
+            return cls.__members__[name]
 
-    BYTE = 1           # No coarsening
-    CACHELINE = 64     # 64-byte cache lines
-    PAGE = 4096        # 4KB pages
+        match = _SIZE_PATTERN.match(text.strip())
+        if match is not None:
+            size = int(match.group(1), 0) * _SIZE_UNITS[match.group(2).upper()]
+            if _is_power_of_two(size):
+                return cls(size)
+
+        names = ", ".join(member.label for member in cls)
+        raise ValueError(
+            f"Unknown granularity: {text}. "
+            f"Must be one of: {names}, or a power-of-two size (e.g. 256, 8KB, 2MB)"
+        )
 
     @property
-    def shift_bits(self) -> int:
-        """Get the number of bits to shift for this granularity."""
-        if self == Granularity.BYTE:
-            return 0
-        elif self == Granularity.CACHELINE:
-            return 6  # 2^6 = 64
-        elif self == Granularity.PAGE:
-            return 12  # 2^12 = 4096
-        return 0
+    def label(self) -> str:
+        """Lowercase name used in the CLI and reports (e.g. "page", "8kb")."""
+        return self.name.lower()
+
+
+def _is_power_of_two(value: object) -> TypeGuard[int]:
+    """Return True for integer powers of two that fit a 64-bit shift."""
+    return (
+        isinstance(value, int)
+        and not isinstance(value, bool)
+        and 0 < value < 1 << 64
+        and value & (value - 1) == 0
+    )
+
+
+def _format_size(size: int) -> str:
+    """Format a power-of-two size with the largest exact unit (e.g. "8KB")."""
+    for unit in ("T", "G", "M", "K"):
+        scale = _SIZE_UNITS[unit]
+        if size >= scale and size % scale == 0:
+            return f"{size // scale}{unit}B"
+    return f"{size}B"
 
 
 def coarsen_address(address: int, granularity: Granularity) -> int:
@@ -39,3 +117,21 @@ def coarsen_address(address: int, granularity: Granularity) -> int:
         0x1000  # Aligned to 4KB boundary
     """
     return address >> granularity.shift_bits
+
+
+def coarsen_addresses(addresses: np.ndarray, granularity: Granularity) -> np.ndarray:
+    """Map an array of addresses to coarsened granularity.
+
+    Vectorized counterpart of `coarsen_address` for columnar traces.
+
+    Args:
+        addresses: Array of memory addresses
+        granularity: Target granularity level
+
+    Returns:
+        uint64 array of coarsened addresses
+    """
+    addresses = np.asarray(addresses, dtype=np.uint64)
+    if granularity.shift_bits == 0:
+        return addresses
+    return addresses >> np.uint64(granularity.shift_bits)  # type: ignore[no-any-return]
@@ -0,0 +1,244 @@
+"""Compressed sparse row (CSR) graphs backed by NumPy arrays."""
+
+from dataclasses import dataclass
+from typing import Hashable, Union
+
+import networkx as nx  # type: ignore
+import numpy as np  # type: ignore
+
+from memgraph.graph.dense import NODE_ID_DTYPE, DenseGraph
+
+
+@dataclass
+class CSRGraph:
+    """Weighted undirected graph in compressed sparse row form.
+
+    The neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``
+    (sorted), with edge weights in the same slice of ``weights``; every
+    edge is stored once from each endpoint. Node ``i`` stands for the
+    coarsened address ``addresses[i]``.
+
+    A graph takes about 24 bytes per edge, instead of the several hundred
+    bytes of NetworkX's dict-of-dicts. `number_of_nodes` and
+    `number_of_edges` mirror NetworkX so size reporting works on either
+    type; `to_networkx` converts for visualization and other NetworkX
+    algorithms.
+    """
+
+    addresses: np.ndarray  # uint64, sorted and distinct
+    indptr: np.ndarray     # int64, one more than the number of nodes
+    indices: np.ndarray    # int32
+    weights: np.ndarray    # int64 (float64 for decayed weights)
+
+    @classmethod
+    def from_dense(cls, dense: DenseGraph) -> "CSRGraph":
+        """Build the CSR form of a dense edge-list graph.
+
+        Args:
+            dense: Graph over dense node IDs
+
+        Returns:
+            CSRGraph with the same node IDs and address table
+        """
+        n = dense.num_nodes
+        sources = np.concatenate([dense.u, dense.v]).astype(np.int64)
+        targets = np.concatenate([dense.v, dense.u]).astype(np.int64)
+        weights = np.concatenate([dense.weight, dense.weight])
+
+        # n < 2**31, so (source, target) packs into one int64 sort key
+        order = np.argsort(sources * n + targets)
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+
+        return cls(
+            dense.addresses,
+            indptr,
+            targets[order].astype(NODE_ID_DTYPE),
+            weights[order],
+        )
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph) -> "CSRGraph":
+        """Build a CSR graph from a NetworkX graph with address nodes.
+
+        Args:
+            graph: NetworkX graph whose nodes are non-negative integers.
+                Edges without a ``weight`` attribute get weight 1; weights
+                are stored as floats if any of them is a float.
+
+        Returns:
+            CSRGraph with node IDs in address order
+
+        Raises:
+            ValueError: If a node is not a non-negative integer
+        """
+        nodes = list(graph.nodes())
+        if not all(isinstance(node, int) and node >= 0 for node in nodes):
+            raise ValueError("CSR graphs need non-negative integer (address) nodes")
+
+        addresses = np.sort(np.array(nodes, dtype=np.uint64))
+        a = np.empty(graph.number_of_edges(), dtype=np.uint64)
+        b = np.empty_like(a)
+        weights = []
+        for i, (u, v, w) in enumerate(graph.edges(data="weight", default=1)):
+            a[i], b[i] = u, v
+            weights.append(w)
+        weight = np.array(weights) if weights else np.empty(0, dtype=np.int64)
+
+        return cls.from_dense(DenseGraph(
+            addresses,
+            np.searchsorted(addresses, a).astype(NODE_ID_DTYPE),
+            np.searchsorted(addresses, b).astype(NODE_ID_DTYPE),
+            weight,
+        ))
+
+    def number_of_nodes(self) -> int:
+        """Return the number of nodes."""
+        return len(self.addresses)
+
+    def number_of_edges(self) -> int:
+        """Return the number of (undirected) edges."""
+        return len(self.indices) // 2
+
+    def degrees(self) -> np.ndarray:
+        """Return the degree of every node, indexed by node ID."""
+        return np.diff(self.indptr)
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """Return the sorted neighbor IDs of a node."""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def edges(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return each undirected edge once.
+
+        Returns:
+            Tuple of (u, v, weight) arrays with u < v, sorted by (u, v)
+        """
+        sources = np.repeat(
+            np.arange(self.number_of_nodes(), dtype=NODE_ID_DTYPE), self.degrees()
+        )
+        forward = sources < self.indices
+        return sources[forward], self.indices[forward], self.weights[forward]
+
+    def adjacency(self) -> list[set[int]]:
+        """Return the neighbor ID set of every node, indexed by node ID."""
+        neighbors = self.indices.tolist()
+        bounds = self.indptr.tolist()
+        return [
+            set(neighbors[start:end]) for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+    def component_labels(self) -> np.ndarray:
+        """Label connected components.
+
+        Each round hooks the root of every edge's larger endpoint onto the
+        smaller root, then shortcuts parent pointers until every node
+        points at its root; all of it is vectorized.
+
+        Returns:
+            Array mapping each node ID to the smallest node ID of its component
+        """
+        parent = np.arange(self.number_of_nodes(), dtype=np.int64)
+        u, v, _ = self.edges()
+
+        while True:
+            root_u = parent[u]
+            root_v = parent[v]
+            differ = root_u != root_v
+            if not np.any(differ):
+                return parent
+            np.minimum.at(
+                parent,
+                np.maximum(root_u[differ], root_v[differ]),
+                np.minimum(root_u[differ], root_v[differ]),
+            )
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+
+    def triangles(self) -> np.ndarray:
+        """Count the triangles through every node.
+
+        Each triangle u < v < w is found once, from its edge (u, v), by
+        intersecting the higher-ID neighbors of u and v.
+
+        Returns:
+            int64 array indexed by node ID
+        """
+        u, v, _ = self.edges()
+        neighbors = v.tolist()
+        bounds = np.searchsorted(u, np.arange(self.number_of_nodes() + 1)).tolist()
+        forward = [
+            set(neighbors[start:end]) for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+        counts = [0] * self.number_of_nodes()
+        apexes: list[int] = []
+        for node, higher in enumerate(forward):
+            for neighbor in higher:
+                common = higher & forward[neighbor]
+                if common:
+                    counts[node] += len(common)
+                    counts[neighbor] += len(common)
+                    apexes.extend(common)
+
+        result = np.array(counts, dtype=np.int64)
+        np.add.at(result, np.array(apexes, dtype=np.int64), 1)
+        return result
+
+    def to_networkx(self) -> nx.Graph:
+        """Convert to a NetworkX graph whose nodes are the addresses.
+
+        Nodes are added in address order, and edges in (u, v) ID order.
+
+        Returns:
+            NetworkX undirected graph with ``weight`` edge attributes
+        """
+        u, v, weight = self.edges()
+        graph: nx.Graph = nx.Graph()
+        graph.add_nodes_from(self.addresses.tolist())
+        graph.add_weighted_edges_from(
+            zip(
+                self.addresses[u].tolist(),
+                self.addresses[v].tolist(),
+                weight.tolist(),
+            )
+        )
+        return graph
+
+
+# Graph types accepted by statistics and graphlet analysis
+AnyGraph = Union[nx.Graph, CSRGraph]
+
+
+def dense_adjacency(graph: AnyGraph) -> tuple[list[Hashable], list[set[int]]]:
+    """Relabel a graph's nodes to dense IDs.
+
+    CSR graphs already use dense IDs. For NetworkX graphs node ``i`` is
+    the i-th node in the graph's node order; directed graphs are reduced
+    to undirected adjacency (successors and predecessors, no self-loops).
+
+    Args:
+        graph: NetworkX graph with arbitrary node labels, or a CSR graph
+
+    Returns:
+        Tuple of (node labels by ID, neighbor ID sets by ID)
+    """
+    if isinstance(graph, CSRGraph):
+        return graph.addresses.tolist(), graph.adjacency()
+
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    adjacency = [
+        {index[neighbor] for neighbor in graph.neighbors(node)} for node in nodes
+    ]
+    if graph.is_directed():
+        for node, neighbors in enumerate(adjacency):
+            for neighbor in neighbors:
+                adjacency[neighbor].add(node)
+        for node, neighbors in enumerate(adjacency):
+            neighbors.discard(node)
+    return nodes, adjacency
@@ -0,0 +1,110 @@
+"""Graphs over dense integer node IDs with an address table."""
+
+from dataclasses import dataclass
+
+import networkx as nx  # type: ignore
+import numpy as np  # type: ignore
+
+from memgraph.graph.edges import EdgeList
+from memgraph.trace.models import sorted_unique
+
+
+NODE_ID_DTYPE = np.int32
+
+_MAX_NODES = int(np.iinfo(NODE_ID_DTYPE).max) + 1
+
+
+@dataclass
+class DenseGraph:
+    """Weighted undirected graph over dense node IDs 0..N-1.
+
+    Node ``i`` stands for the coarsened address ``addresses[i]``; edge ``k``
+    joins nodes ``u[k]`` and ``v[k]`` with weight ``weight[k]``. Algorithms
+    can index arrays by node ID instead of hashing 64-bit addresses, and
+    the address table recovers the original addresses for reports and
+    serialization.
+    """
+
+    addresses: np.ndarray  # uint64, sorted and distinct
+    u: np.ndarray          # int32
+    v: np.ndarray          # int32
+    weight: np.ndarray     # int64 (float64 for decayed weights)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes (length of the address table)."""
+        return len(self.addresses)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges."""
+        return len(self.u)
+
+    @classmethod
+    def from_edge_list(cls, edges: EdgeList) -> "DenseGraph":
+        """Assign dense IDs to the endpoints of an edge list.
+
+        IDs follow address order, and edges keep the order of `edges`.
+
+        Args:
+            edges: Edges between coarsened addresses
+
+        Returns:
+            DenseGraph with one node per distinct endpoint
+
+        Raises:
+            ValueError: If there are more nodes than int32 IDs
+        """
+        addresses = sorted_unique(np.concatenate([edges.a, edges.b]))
+        if len(addresses) > _MAX_NODES:
+            raise ValueError(f"Too many nodes for int32 IDs: {len(addresses):,}")
+        return cls(
+            addresses.astype(np.uint64, copy=False),
+            np.searchsorted(addresses, edges.a).astype(NODE_ID_DTYPE),
+            np.searchsorted(addresses, edges.b).astype(NODE_ID_DTYPE),
+            _weights(edges.weight),
+        )
+
+    def node_ids(self, addresses: np.ndarray) -> np.ndarray:
+        """Look up the node IDs of coarsened addresses.
+
+        Args:
+            addresses: Addresses present in the address table
+
+        Returns:
+            int32 array of node IDs
+
+        Raises:
+            ValueError: If an address is not a node of the graph
+        """
+        addresses = np.asarray(addresses, dtype=np.uint64)
+        ids = np.searchsorted(self.addresses, addresses)
+        found = ids < len(self.addresses)
+        found[found] = self.addresses[ids[found]] == addresses[found]
+        if not np.all(found):
+            missing = int(addresses[~found][0])
+            raise ValueError(f"Address {missing:#x} is not a node of the graph")
+        return ids.astype(NODE_ID_DTYPE)
+
+    def to_networkx(self) -> nx.Graph:
+        """Convert to a NetworkX graph whose nodes are the addresses.
+
+        Returns:
+            NetworkX undirected graph with ``weight`` edge attributes
+        """
+        graph: nx.Graph = nx.Graph()
+        graph.add_weighted_edges_from(
+            zip(
+                self.addresses[self.u].tolist(),
+                self.addresses[self.v].tolist(),
+                self.weight.tolist(),
+            )
+        )
+        return graph
+
+
+def _weights(weight: np.ndarray) -> np.ndarray:
+    """Return edge weights as int64, or float64 if they are fractional."""
+    if weight.dtype.kind == "f":
+        return weight.astype(np.float64, copy=False)
+    return weight.astype(np.int64, copy=False)
@@ -0,0 +1,1133 @@
+"""Vectorized aggregation of co-occurrence edges over windows."""
+
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np  # type: ignore
+
+from memgraph.graph.coarsening import Granularity, coarsen_addresses
+from memgraph.graph.sketch import CountMinSketch
+from memgraph.graph.windowing import Accesses
+from memgraph.trace.cardinality import mix64
+from memgraph.trace.models import sorted_unique
+
+
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+# Bytes per aggregated pair held in memory (int64 key, weight and first window)
+EDGE_ROW_BYTES = 24
+
+# Row layout of spilled runs
+_RUN_DTYPE = np.dtype([
+    ("a", np.uint64),
+    ("b", np.uint64),
+    ("weight", np.int64),
+    ("first_window", np.int64),
+])
+
+# Smallest number of rows read from each run per merge step
+_MIN_MERGE_CHUNK = 1 << 12
+
+# Distinct window contents remembered by default when memoizing windows
+DEFAULT_MEMO_WINDOWS = 1 << 12
+
+
+@dataclass(frozen=True)
+class SpillConfig:
+    """When and where to spill aggregated edges to disk.
+
+    Once the distinct pairs aggregated so far would take more than
+    ``memory_budget`` bytes (about EDGE_ROW_BYTES each), they are written
+    to a temporary file in ``directory`` (default: the system temporary
+    directory) as a run sorted by pair, and memory is freed. At the end
+    the runs are combined with a streaming k-way merge that drops light
+    edges as it goes, so only the final graph has to fit in memory.
+    """
+
+    memory_budget: int               # Bytes of aggregated edges kept in memory
+    directory: Optional[str] = None  # Where to write the runs
+
+    def __post_init__(self) -> None:
+        if self.memory_budget <= 0:
+            raise ValueError("memory_budget must be positive")
+
+    @property
+    def max_rows(self) -> int:
+        """Number of aggregated pairs that fit in the memory budget."""
+        return max(1, self.memory_budget // EDGE_ROW_BYTES)
+
+
+@dataclass(frozen=True)
+class TemporalNeighbors:
+    """Edge model linking each access only to its nearest predecessors.
+
+    Instead of the clique of every window, each access is paired with the
+    `k` accesses before it in its window (other than repeats of its own
+    address), so a window of n accesses yields at most n * k pairs instead
+    of n**2 / 2. A pair still counts once per window. Without `decay` its
+    weight is the number of windows in which it occurs within distance
+    `k`; with `decay`, each window adds ``decay ** (d - 1)`` for the
+    pair's smallest distance d there, so weights become floats. With
+    ``k >= window size - 1`` and no decay this is the clique model.
+    """
+
+    k: int                         # Predecessors linked to each access
+    decay: Optional[float] = None  # Per-step weight factor in (0, 1]
+
+    def __post_init__(self) -> None:
+        if self.k < 1:
+            raise ValueError("k must be at least 1")
+        if self.decay is not None and not 0.0 < self.decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+
+
+@dataclass(frozen=True)
+class WindowMemo:
+    """Memoize the cliques of windows whose contents repeat.
+
+    Loops give many windows with the same set of coarsened addresses. A
+    window's sorted distinct addresses are its fingerprint, and a bounded
+    LRU maps each fingerprint to the number of windows that had it. A
+    set's clique is formed once, with weights multiplied by that count,
+    when the set is evicted or at the end, so a repeated window costs
+    O(k) instead of O(k**2). Only identical sets are merged, so the edges
+    are the same as without memoization. This applies to the clique
+    model over non-overlapping windows; overlapping windows are already
+    aggregated incrementally (see `span_edges`).
+    """
+
+    max_windows: int = DEFAULT_MEMO_WINDOWS  # Distinct window sets remembered
+
+    def __post_init__(self) -> None:
+        if self.max_windows < 1:
+            raise ValueError("max_windows must be at least 1")
+
+
+@dataclass
+class EdgeList:
+    """Weighted undirected edges as parallel arrays.
+
+    Each edge is (a[i], b[i]) with a[i] < b[i], both coarsened addresses.
+    `first_window[i]` is the index of the first window in which the pair
+    co-occurred, and `weight[i]` the number of windows in which it did
+    (a float sum for decayed TemporalNeighbors weights).
+    """
+
+    a: np.ndarray             # uint64
+    b: np.ndarray             # uint64
+    weight: np.ndarray        # int64 (float64 for decayed weights)
+    first_window: np.ndarray  # int64
+
+    def __len__(self) -> int:
+        return len(self.a)
+
+    @classmethod
+    def empty(cls) -> "EdgeList":
+        """Return an edge list with no edges."""
+        return cls(
+            np.empty(0, dtype=np.uint64),
+            np.empty(0, dtype=np.uint64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+        )
+
+    def filter(self, min_weight: int) -> "EdgeList":
+        """Return only the edges with weight >= min_weight."""
+        if min_weight <= 1:
+            return self
+        keep = self.weight >= min_weight
+        return EdgeList(
+            self.a[keep], self.b[keep], self.weight[keep], self.first_window[keep]
+        )
+
+
+@dataclass
+class _KeyedEdges:
+    """Edges keyed by dense codes into a table of coarsened addresses.
+
+    Pair (values[i], values[j]) with i < j has key ``i * len(values) + j``,
+    so keys sort like the pairs. Keys are sorted and distinct.
+    """
+
+    keys: np.ndarray          # int64
+    weight: np.ndarray        # int64 (float64 for decayed weights)
+    first_window: np.ndarray  # int64
+    values: np.ndarray        # uint64, sorted and distinct
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def to_pair_order(self) -> EdgeList:
+        """Decode the keys, keeping edges sorted by (a, b)."""
+        m = len(self.values)
+        return EdgeList(
+            self.values[self.keys // m],
+            self.values[self.keys % m],
+            self.weight,
+            self.first_window,
+        )
+
+    def to_edge_list(self) -> EdgeList:
+        """Decode the keys, ordering edges by (first_window, a, b).
+
+        This is the order in which a window-by-window builder first
+        encounters each pair, so graphs built from it have the same node
+        and edge order as the original dict-based builder. Keys are already
+        sorted, so the row index breaks ties and one int64 sort suffices.
+        """
+        n = len(self)
+        if n == 0:
+            return EdgeList.empty()
+        order = np.argsort(self.first_window * n + np.arange(n))
+        keys = self.keys[order]
+        m = len(self.values)
+        return EdgeList(
+            self.values[keys // m],
+            self.values[keys % m],
+            self.weight[order],
+            self.first_window[order],
+        )
+
+
+def _merge(parts: list[_KeyedEdges]) -> _KeyedEdges:
+    """Merge keyed edge lists, summing weights and keeping the first window.
+
+    Each part's codes are translated to a shared address table with one
+    lookup per distinct address and a gather per edge (parts that already
+    share a table are used as is). The translation is monotonic, so every
+    part stays sorted and the final sort only has to interleave sorted runs.
+    """
+    if len(parts) == 1:
+        return parts[0]
+
+    values = parts[0].values
+    if any(p.values is not values for p in parts):
+        values = sorted_unique(np.concatenate([p.values for p in parts]))
+    n = len(values)
+    keys = []
+    for part in parts:
+        if part.values is values:
+            keys.append(part.keys)
+            continue
+        m = len(part.values)
+        remap = np.searchsorted(values, part.values).astype(np.int64)
+        first = part.keys // m
+        keys.append(remap[first] * n + remap[part.keys - first * m])
+
+    all_keys = np.concatenate(keys)
+    order = np.argsort(all_keys, kind="stable")
+    all_keys = all_keys[order]
+    starts = _run_starts(all_keys)
+
+    return _KeyedEdges(
+        all_keys[starts],
+        np.add.reduceat(np.concatenate([p.weight for p in parts])[order], starts),
+        np.minimum.reduceat(
+            np.concatenate([p.first_window for p in parts])[order], starts
+        ),
+        values,
+    )
+
+
+def merge_edge_lists(parts: Iterable[EdgeList]) -> EdgeList:
+    """Merge edge lists of disjoint window ranges.
+
+    Weights of the same pair are summed and the earliest first window is
+    kept, so merging the edges of consecutive shards of a trace gives the
+    edges of the whole trace. Each list is keyed by codes into its own
+    sorted address table; tables are reconciled with one sorted lookup and
+    all keys are reduced in a single sort, so no per-edge Python work is
+    done.
+
+    Args:
+        parts: Edge lists whose `first_window` values share one numbering
+
+    Returns:
+        EdgeList with one row per distinct pair, in window order
+    """
+    keyed = [_keyed(part) for part in parts if len(part)]
+    if not keyed:
+        return EdgeList.empty()
+    return _merge(keyed).to_edge_list()
+
+
+def _keyed(edges: EdgeList) -> _KeyedEdges:
+    """Key an edge list by codes into a table of its endpoints."""
+    values = sorted_unique(np.concatenate([edges.a, edges.b]))
+    m = len(values)
+    keys = (
+        np.searchsorted(values, edges.a).astype(np.int64) * m
+        + np.searchsorted(values, edges.b)
+    )
+    order = np.argsort(keys)
+    return _KeyedEdges(keys[order], edges.weight[order], edges.first_window[order], values)
+
+
+class _EdgeParts:
+    """Keyed edge lists, merged by pair whenever they grow past twice the
+    size of the last merge.
+
+    With a SpillConfig, a merged list larger than half the budget is
+    written out as a sorted run instead of being kept.
+    """
+
+    def __init__(self, merge_rows: int, spill: Optional[SpillConfig] = None):
+        self._parts: list[_KeyedEdges] = []
+        self._rows = 0
+        self._spill = spill
+        self._runs: Optional[_SpilledRuns] = None
+        if spill is not None:
+            merge_rows = min(merge_rows, spill.max_rows)
+        self._merge_rows = merge_rows
+        self._min_merge_rows = merge_rows
+
+    def add(self, part: _KeyedEdges) -> None:
+        """Add a part, merging all parts if they have grown large."""
+        if len(part) == 0:
+            return
+        self._parts.append(part)
+        self._rows += len(part)
+        if self._rows >= self._merge_rows:
+            self._merge()
+            if self._spill is not None and self._rows > self._spill.max_rows // 2:
+                self._spill_parts(self._spill)
+            self._merge_rows = max(self._min_merge_rows, 2 * self._rows)
+            if self._spill is not None:
+                self._merge_rows = min(self._merge_rows, self._spill.max_rows)
+
+    def result(self, min_weight: int = 1) -> EdgeList:
+        """Merge all parts and return them in window order.
+
+        Args:
+            min_weight: Drop edges with a lower total weight
+
+        Returns:
+            EdgeList with one row per distinct pair
+        """
+        self._merge()
+        tail = self._parts[0] if self._parts else None
+        if self._runs is None:
+            if tail is None:
+                return EdgeList.empty()
+            return tail.to_edge_list().filter(min_weight)
+
+        runs = self._runs
+        self._parts = []
+        self._rows = 0
+        self._runs = None
+        try:
+            return runs.merge(
+                tail.to_pair_order() if tail is not None else EdgeList.empty(),
+                min_weight,
+            )
+        finally:
+            runs.close()
+
+    def _merge(self) -> None:
+        if len(self._parts) > 1:
+            merged = _merge(self._parts)
+            self._parts = [merged]
+            self._rows = len(merged)
+
+    def _spill_parts(self, spill: SpillConfig) -> None:
+        """Write the (merged) parts to disk as one sorted run."""
+        if self._runs is None:
+            self._runs = _SpilledRuns(spill)
+        self._runs.write(self._parts[0].to_pair_order())
+        self._parts = []
+        self._rows = 0
+
+
+class _HeavyEdges:
+    """Exact weights for the pairs whose sketched weight reaches a threshold.
+
+    Parts are added like to _EdgeParts. Pairs not yet tracked are counted
+    in a count-min sketch; once a pair's estimate reaches `threshold` it
+    is tracked exactly from then on, starting from that estimate. The
+    estimate never undercounts, so every pair of true weight >= threshold
+    is kept, with a weight too high by at most the sketch's error bound.
+    Memory is the sketch plus the tracked pairs, not all pairs seen. A
+    pair's first window is the one in which it was promoted.
+    """
+
+    def __init__(self, sketch: CountMinSketch, threshold: int):
+        self.sketch = sketch
+        self._threshold = threshold
+        self._heavy: Optional[_KeyedEdges] = None
+
+    def add(self, part: _KeyedEdges) -> None:
+        """Add the weights of a part."""
+        if len(part) == 0:
+            return
+        n = len(part.values)
+        first = part.keys // n
+        second = part.keys - first * n
+
+        light = np.ones(len(part), dtype=bool)
+        heavy = self._heavy
+        if heavy is not None:
+            # Look the part's pairs up among the tracked ones
+            m = len(heavy.values)
+            code = np.minimum(np.searchsorted(heavy.values, part.values), m - 1)
+            present = heavy.values[code] == part.values
+            keys = code[first] * m + code[second]
+            row = np.minimum(np.searchsorted(heavy.keys, keys), len(heavy) - 1)
+            tracked = present[first] & present[second] & (heavy.keys[row] == keys)
+            row = row[tracked]
+            heavy.weight[row] += part.weight[tracked]
+            heavy.first_window[row] = np.minimum(
+                heavy.first_window[row], part.first_window[tracked]
+            )
+            light = ~tracked
+
+        estimates = self.sketch.update(
+            _pair_hash(part.values[first[light]], part.values[second[light]]),
+            part.weight[light],
+        )
+        promote = estimates >= self._threshold
+        if not np.any(promote):
+            return
+        promoted = _KeyedEdges(
+            part.keys[light][promote],
+            estimates[promote],
+            part.first_window[light][promote],
+            part.values,
+        )
+        self._heavy = promoted if heavy is None else _merge([heavy, promoted])
+
+    def result(self, min_weight: int = 1) -> EdgeList:
+        """Return the tracked pairs of weight >= min_weight, in window order."""
+        if self._heavy is None:
+            return EdgeList.empty()
+        return self._heavy.to_edge_list().filter(min_weight)
+
+
+def _edge_table(
+    merge_rows: int,
+    spill: Optional[SpillConfig],
+    sketch: Optional[CountMinSketch],
+    min_weight: int
+) -> Union[_EdgeParts, _HeavyEdges]:
+    """Return the store that batch results are added to."""
+    if sketch is None:
+        return _EdgeParts(merge_rows, spill)
+    if spill is not None:
+        raise ValueError("Edges can be sketched or spilled, not both")
+    return _HeavyEdges(sketch, min_weight)
+
+
+def _pair_hash(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hash (a, b) address pairs to uint64 sketch keys."""
+    with np.errstate(over="ignore"):
+        return mix64(a) ^ b  # type: ignore[no-any-return]
+
+
+class _SpilledRuns:
+    """Edge lists sorted by (a, b), each saved to a temporary .npy file."""
+
+    def __init__(self, spill: SpillConfig):
+        self._spill = spill
+        self._directory = tempfile.TemporaryDirectory(
+            prefix="memgraph-edges-", dir=spill.directory
+        )
+        self._paths: list[Path] = []
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def write(self, edges: EdgeList) -> None:
+        """Save a run of edges sorted by (a, b)."""
+        path = Path(self._directory.name) / f"run-{len(self._paths):06d}.npy"
+        np.save(path, _to_run(edges))
+        self._paths.append(path)
+
+    def merge(self, tail: EdgeList, min_weight: int) -> EdgeList:
+        """Merge the saved runs and an in-memory run `tail`.
+
+        Runs are memory-mapped and read a chunk at a time, so memory is
+        bounded by the budget plus the edges that pass `min_weight`.
+
+        Returns:
+            EdgeList with one row per distinct pair, in window order
+        """
+        runs = [np.load(path, mmap_mode="r") for path in self._paths]
+        if len(tail):
+            runs.append(_to_run(tail))
+        chunk_rows = max(self._spill.max_rows // len(runs), _MIN_MERGE_CHUNK)
+        return _merge_runs(runs, min_weight, chunk_rows)
+
+    def close(self) -> None:
+        """Delete the saved runs."""
+        self._paths = []
+        self._directory.cleanup()
+
+
+def _to_run(edges: EdgeList) -> np.ndarray:
+    """Pack an edge list into one structured array of run rows."""
+    run = np.empty(len(edges), dtype=_RUN_DTYPE)
+    run["a"] = edges.a
+    run["b"] = edges.b
+    run["weight"] = edges.weight
+    run["first_window"] = edges.first_window
+    return run
+
+
+def _merge_runs(runs: list[np.ndarray], min_weight: int, chunk_rows: int) -> EdgeList:
+    """K-way merge of runs sorted by (a, b) with distinct pairs per run.
+
+    Each step reads the next `chunk_rows` rows of every run. No later row
+    of any run can sort before the smallest last pair among the chunks
+    that do not finish their run, so all rows up to that pair are final:
+    they are reduced by pair in one sort, and edges lighter than
+    `min_weight` are dropped right away. The run with that smallest pair
+    is consumed whole, so every step advances by at least one chunk.
+    """
+    positions = [0] * len(runs)
+    pieces: list[EdgeList] = []
+    while True:
+        active = [i for i, run in enumerate(runs) if positions[i] < len(run)]
+        if not active:
+            break
+        chunks = {i: runs[i][positions[i]:positions[i] + chunk_rows] for i in active}
+        partial = [
+            (int(chunks[i]["a"][-1]), int(chunks[i]["b"][-1]))
+            for i in active
+            if positions[i] + len(chunks[i]) < len(runs[i])
+        ]
+        cutoff = min(partial) if partial else None
+
+        taken = []
+        for i in active:
+            chunk = chunks[i]
+            count = len(chunk) if cutoff is None else _rows_up_to(chunk, cutoff)
+            taken.append(np.asarray(chunk[:count]))
+            positions[i] += count
+        pieces.append(_reduce_rows(np.concatenate(taken), min_weight))
+
+    a = np.concatenate([p.a for p in pieces])
+    b = np.concatenate([p.b for p in pieces])
+    weight = np.concatenate([p.weight for p in pieces])
+    first_window = np.concatenate([p.first_window for p in pieces])
+
+    # Pieces are in (a, b) order; a stable sort gives (first_window, a, b)
+    order = np.argsort(first_window, kind="stable")
+    return EdgeList(a[order], b[order], weight[order], first_window[order])
+
+
+def _rows_up_to(chunk: np.ndarray, pair: tuple[int, int]) -> int:
+    """Count the rows of a (a, b)-sorted chunk that are <= `pair`."""
+    a = np.uint64(pair[0])
+    low = int(np.searchsorted(chunk["a"], a, side="left"))
+    high = int(np.searchsorted(chunk["a"], a, side="right"))
+    return low + int(
+        np.searchsorted(chunk["b"][low:high], np.uint64(pair[1]), side="right")
+    )
+
+
+def _reduce_rows(rows: np.ndarray, min_weight: int) -> EdgeList:
+    """Sum run rows by pair, keeping pairs of weight >= min_weight in (a, b) order."""
+    if len(rows) == 0:
+        return EdgeList.empty()
+    rows = rows[np.lexsort((rows["b"], rows["a"]))]
+    a = rows["a"]
+    b = rows["b"]
+    change = np.empty(len(rows), dtype=bool)
+    change[0] = True
+    change[1:] = (a[1:] != a[:-1]) | (b[1:] != b[:-1])
+    starts = np.flatnonzero(change)
+
+    weight = np.add.reduceat(rows["weight"], starts)
+    first_window = np.minimum.reduceat(rows["first_window"], starts)
+    keep = weight >= min_weight
+    return EdgeList(a[starts[keep]], b[starts[keep]], weight[keep], first_window[keep])
+
+
+@dataclass
+class _MemoEntry:
+    """A memoized window set, with how often and first when it occurred."""
+
+    lines: np.ndarray  # uint64, sorted and distinct
+    count: int
+    first_window: int
+
+
+class _WindowMemo:
+    """Bounded LRU from window contents to their `_MemoEntry`."""
+
+    def __init__(self, max_windows: int):
+        self.max_windows = max_windows
+        self._entries: OrderedDict[bytes, _MemoEntry] = OrderedDict()
+
+    def add(self, lines: np.ndarray, window: int) -> Optional[_MemoEntry]:
+        """Count one window with the given set of coarsened addresses.
+
+        Returns:
+            The least recently seen entry, if it was evicted to make room
+        """
+        key = lines.tobytes()
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.count += 1
+            self._entries.move_to_end(key)
+            return None
+
+        self._entries[key] = _MemoEntry(lines.copy(), 1, window)
+        if len(self._entries) > self.max_windows:
+            return self._entries.popitem(last=False)[1]
+        return None
+
+    def drain(self) -> list[_MemoEntry]:
+        """Remove and return all entries."""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        return entries
+
+
+class EdgeAggregator:
+    """Accumulate clique co-occurrence edges over many windows with NumPy.
+
+    Windows are buffered and processed in batches. Per batch, addresses are
+    coarsened with one shift, mapped to dense codes, deduplicated per window
+    with a single sort of (window, code) keys, expanded to all pairs with
+    index arithmetic, and reduced to weights with a sort of int64 pair keys.
+    Batch results are merged by pair whenever they grow past twice the size
+    of the last merge, so each window costs no Python-level work beyond
+    being appended to the batch.
+
+    With a count-min sketch, only the pairs whose estimated weight reaches
+    `min_weight` are kept (see `_HeavyEdges`), so memory is bounded by
+    the heavy edges rather than by all pairs observed. With
+    TemporalNeighbors, each access is only paired with its nearest
+    predecessors instead of the whole window. With a WindowMemo, windows
+    are only deduplicated per batch and counted by content; cliques are
+    formed once per distinct content (see `_memo_windows`).
+    """
+
+    # Window addresses buffered before a batch is processed
+    BATCH_ELEMENTS = 1 << 20
+    # Upper bound on candidate pairs per batch (bounds temporary memory)
+    BATCH_PAIRS = 1 << 22
+    # Batch results are first merged once they hold this many rows
+    MERGE_ROWS = 1 << 23
+
+    def __init__(
+        self,
+        granularity: Granularity = Granularity.CACHELINE,
+        spill: Optional[SpillConfig] = None,
+        sketch: Optional[CountMinSketch] = None,
+        min_weight: int = 1,
+        neighbors: Optional[TemporalNeighbors] = None,
+        memo: Optional[WindowMemo] = None
+    ):
+        """Initialize an empty aggregator.
+
+        Args:
+            granularity: Address coarsening granularity
+            spill: Spill aggregated edges to disk past a memory budget
+                (default: keep everything in memory)
+            sketch: Count light pairs approximately in this sketch and keep
+                exact weights only for pairs estimated at >= min_weight
+            min_weight: Drop edges with a lower weight. With spilling this
+                happens during the final merge, so light edges are never
+                loaded back into memory all at once.
+            neighbors: Link each access to its nearest predecessors only
+                (default: clique of each window)
+            memo: Form the clique of repeated window contents once
+
+        Raises:
+            ValueError: If both spill and sketch are given, or windows are
+                memoized with temporal neighbors
+        """
+        if memo is not None and neighbors is not None:
+            raise ValueError("Window memoization needs the clique edge model")
+        self.granularity = granularity
+        self.neighbors = neighbors
+        self.window_count = 0
+        self._batch: list[np.ndarray] = []
+        self._batch_elements = 0
+        self._batch_pairs = 0
+        self._batch_first_window = 0
+        self.min_weight = min_weight
+        self._parts = _edge_table(self.MERGE_ROWS, spill, sketch, min_weight)
+        self._memo = None if memo is None else _WindowMemo(memo.max_windows)
+        self._pending: list[_MemoEntry] = []
+        self._pending_pairs = 0
+
+    def add_window(self, window: Accesses) -> None:
+        """Add one window of (uncoarsened) addresses.
+
+        Args:
+            window: Address array (or MemoryAccess sequence) for the window
+        """
+        if isinstance(window, np.ndarray):
+            addresses = window.astype(np.uint64, copy=False)
+        else:
+            addresses = np.array([acc.address for acc in window], dtype=np.uint64)
+        n = len(addresses)
+
+        self._batch.append(addresses)
+        self._batch_elements += n
+        if self.neighbors is None:
+            self._batch_pairs += n * (n - 1) // 2
+        else:
+            self._batch_pairs += n * min(self.neighbors.k, n)
+        self.window_count += 1
+
+        if (
+            self._batch_elements >= self.BATCH_ELEMENTS
+            or self._batch_pairs >= self.BATCH_PAIRS
+        ):
+            self._flush()
+
+    def add_windows(self, windows: Iterable[Accesses]) -> None:
+        """Add a sequence of windows."""
+        for window in windows:
+            self.add_window(window)
+
+    def result(self) -> EdgeList:
+        """Return all edges seen so far, merged by pair.
+
+        Returns:
+            EdgeList with one row per distinct pair of weight >= min_weight,
+            in window order
+        """
+        self._flush()
+        if self._memo is not None:
+            for entry in self._memo.drain():
+                self._add_pending(entry)
+            self._emit_pending()
+        return self._parts.result(self.min_weight)
+
+    def _flush(self) -> None:
+        """Process the buffered batch of windows."""
+        batch = self._batch
+        first_window = self._batch_first_window
+        self._batch = []
+        self._batch_elements = 0
+        self._batch_pairs = 0
+        self._batch_first_window = self.window_count
+
+        if not batch:
+            return
+
+        if self._memo is not None:
+            self._memo_windows(batch, first_window)
+            return
+
+        if self.neighbors is None:
+            edges = _batch_edges(batch, self.granularity)
+        else:
+            edges = _batch_neighbor_edges(batch, self.granularity, self.neighbors)
+        edges.first_window += first_window
+        self._parts.add(edges)
+
+    def _memo_windows(self, batch: list[np.ndarray], first_window: int) -> None:
+        """Count the batch's window sets in the memo.
+
+        Windows with fewer than two distinct addresses have no edges. The
+        cliques of evicted sets are formed in batches of pairs.
+        """
+        assert self._memo is not None
+        for offset, lines in enumerate(_window_sets(batch, self.granularity)):
+            if len(lines) < 2:
+                continue
+            evicted = self._memo.add(lines, first_window + offset)
+            if evicted is not None:
+                self._add_pending(evicted)
+
+    def _add_pending(self, entry: _MemoEntry) -> None:
+        """Queue a memoized set for clique formation."""
+        n = len(entry.lines)
+        self._pending.append(entry)
+        self._pending_pairs += n * (n - 1) // 2
+        if self._pending_pairs >= self.BATCH_PAIRS:
+            self._emit_pending()
+
+    def _emit_pending(self) -> None:
+        """Form the weighted cliques of the queued sets."""
+        pending = sorted(self._pending, key=lambda entry: entry.first_window)
+        self._pending = []
+        self._pending_pairs = 0
+        if not pending:
+            return
+
+        # Already coarsened; batch indices follow first windows, so the
+        # earliest batch index of a pair maps to its earliest window
+        edges = _batch_edges(
+            [entry.lines for entry in pending],
+            Granularity.BYTE,
+            np.array([entry.count for entry in pending], dtype=np.int64),
+        )
+        first_windows = np.array([entry.first_window for entry in pending], dtype=np.int64)
+        edges.first_window = first_windows[edges.first_window]
+        self._parts.add(edges)
+
+
+def span_edges(
+    addresses: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    granularity: Granularity = Granularity.CACHELINE,
+    batch_rows: int = 1 << 22,
+    spill: Optional[SpillConfig] = None,
+    min_weight: int = 1,
+    sketch: Optional[CountMinSketch] = None
+) -> EdgeList:
+    """Compute co-occurrence edges incrementally for overlapping windows.
+
+    Window w covers ``addresses[starts[w]:ends[w]]``. Both offset arrays
+    must be non-decreasing (as for sliding windows), so each address is
+    present in runs of consecutive windows: it enters when its
+    multiplicity in the window becomes positive and leaves when it drops
+    back to zero. A pair's weight is the total overlap of the two
+    addresses' presence runs, and each overlapping pair of runs is found
+    once, when the later run enters, among the addresses already present.
+    So only pairs that enter the window are ever emitted, and the cost is
+    O(entries * window size) rather than O(windows * window size**2) for
+    rebuilding every clique. With step 1 that is about O(n * size).
+
+    The result is identical to aggregating the clique of every window.
+
+    Args:
+        addresses: Address array (uncoarsened)
+        starts: Start offset of each window
+        ends: End offset (exclusive) of each window
+        granularity: Address coarsening granularity
+        batch_rows: Candidate (entry, position) rows processed at a time
+        spill: Spill aggregated edges to disk past a memory budget (which
+            then also caps `batch_rows`)
+        min_weight: Drop edges with a lower weight
+        sketch: Count light pairs approximately in this sketch and keep
+            exact weights only for pairs estimated at >= min_weight
+
+    Returns:
+        EdgeList with one row per distinct pair of weight >= min_weight,
+        in window order
+    """
+    addresses = np.asarray(addresses, dtype=np.uint64)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    n = len(addresses)
+    if n == 0 or len(starts) == 0:
+        return EdgeList.empty()
+
+    values = coarsen_addresses(addresses, granularity)
+    unique = sorted_unique(values)
+    n_unique = len(unique)
+    codes = np.searchsorted(unique, values).astype(np.int64)
+
+    # The windows containing position p are lo[p]..hi[p]
+    positions = np.arange(n, dtype=np.int64)
+    lo = np.searchsorted(ends, positions, side="right")
+    hi = np.searchsorted(starts, positions, side="right") - 1
+
+    # Positions grouped by address, in trace order (one sort of packed
+    # (code, position) keys), skipping positions outside every window
+    order = np.sort(codes * n + positions) % n
+    order = order[lo[order] <= hi[order]]
+    if len(order) == 0:
+        return EdgeList.empty()
+    code_sorted = codes[order]
+    lo_sorted = lo[order]
+    hi_sorted = hi[order]
+
+    # Presence runs: maximal ranges of consecutive windows holding an address
+    new_run = np.empty(len(order), dtype=bool)
+    new_run[0] = True
+    same_code = code_sorted[1:] == code_sorted[:-1]
+    new_run[1:] = ~same_code | (lo_sorted[1:] > hi_sorted[:-1] + 1)
+    run_first = np.flatnonzero(new_run)
+    run_last = np.append(run_first[1:], len(order)) - 1
+    run_entry = lo_sorted[run_first]
+    run_exit = hi_sorted[run_last]
+    run_code = code_sorted[run_first]
+
+    run_of = np.empty(n, dtype=np.int64)
+    run_of[order] = np.cumsum(new_run) - 1
+
+    # Previous position of the same address, to find first occurrences
+    previous = np.full(n, -1, dtype=np.int64)
+    repeated = np.flatnonzero(same_code) + 1
+    previous[order[repeated]] = order[repeated - 1]
+
+    parts = _edge_table(EdgeAggregator.MERGE_ROWS, spill, sketch, min_weight)
+    if spill is not None:
+        batch_rows = min(batch_rows, spill.max_rows)
+    lengths = ends[run_entry] - starts[run_entry]
+    cumulative = np.cumsum(lengths)
+    n_runs = len(run_first)
+    first_run = 0
+    while first_run < n_runs:
+        done = int(cumulative[first_run - 1]) if first_run else 0
+        end_run = max(
+            int(np.searchsorted(cumulative, done + batch_rows, side="right")),
+            first_run + 1,
+        )
+        parts.add(_entry_edges(
+            np.arange(first_run, end_run), run_entry, run_exit, run_code,
+            run_of, previous, starts, ends, unique,
+        ))
+        first_run = end_run
+
+    return parts.result(min_weight)
+
+
+def transition_edges(
+    addresses: np.ndarray,
+    granularity: Granularity = Granularity.CACHELINE
+) -> EdgeList:
+    """Count directed transitions between consecutive accesses.
+
+    Row (a, b) counts how often coarsened address b directly follows a,
+    found by comparing the coarsened column with itself shifted by one;
+    repeated accesses to one address are not transitions. Unlike the
+    other edge lists, rows are ordered pairs (a may exceed b), and
+    `first_window` is the position of the pair's first transition.
+
+    Args:
+        addresses: Addresses in access order
+        granularity: Address coarsening granularity
+
+    Returns:
+        EdgeList with one row per ordered pair, in order of first transition
+    """
+    values = coarsen_addresses(addresses, granularity)
+    moved = np.flatnonzero(values[1:] != values[:-1])
+    if len(moved) == 0:
+        return EdgeList.empty()
+
+    unique = sorted_unique(values)
+    codes = np.searchsorted(unique, values).astype(np.int64)
+    keys = codes[moved] * len(unique) + codes[moved + 1]
+
+    # A stable sort keeps each pair's first transition at the head of its run
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = _run_starts(keys)
+    weight = np.diff(np.append(starts, len(keys)))
+    return _KeyedEdges(
+        keys[starts], weight.astype(np.int64), moved[order][starts].astype(np.int64), unique
+    ).to_edge_list()
+
+
+def _entry_edges(
+    runs: np.ndarray,
+    run_entry: np.ndarray,
+    run_exit: np.ndarray,
+    run_code: np.ndarray,
+    run_of: np.ndarray,
+    previous: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    unique: np.ndarray
+) -> _KeyedEdges:
+    """Pair each presence run with the runs already present when it enters."""
+    n_unique = len(unique)
+    entry = run_entry[runs]
+    span_start = starts[entry]
+    lengths = ends[entry] - span_start
+
+    # One row per (entering run, position in its entry window)
+    total = int(lengths.sum())
+    offsets = np.cumsum(lengths) - lengths
+    row_run = np.repeat(runs, lengths)
+    row_entry = np.repeat(entry, lengths)
+    row_start = np.repeat(span_start, lengths)
+    position = row_start + (np.arange(total) - np.repeat(offsets, lengths))
+
+    # Keep one row per address present (its first occurrence in the
+    # window) whose run entered earlier; runs entering together are
+    # paired once, from the one with the larger address
+    partner = run_of[position]
+    partner_entry = run_entry[partner]
+    keep = (previous[position] < row_start) & (
+        (partner_entry < row_entry)
+        | ((partner_entry == row_entry) & (run_code[partner] < run_code[row_run]))
+    )
+    row_run = row_run[keep]
+    row_entry = row_entry[keep]
+    partner = partner[keep]
+
+    own_code = run_code[row_run]
+    partner_code = run_code[partner]
+    pair_keys = (
+        np.minimum(own_code, partner_code) * n_unique
+        + np.maximum(own_code, partner_code)
+    )
+    overlap = np.minimum(run_exit[row_run], run_exit[partner]) - row_entry + 1
+
+    if len(pair_keys) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return _KeyedEdges(empty, empty, empty, unique)
+
+    order = np.argsort(pair_keys)
+    pair_keys = pair_keys[order]
+    pair_starts = _run_starts(pair_keys)
+    return _KeyedEdges(
+        pair_keys[pair_starts],
+        np.add.reduceat(overlap[order], pair_starts),
+        np.minimum.reduceat(row_entry[order], pair_starts),
+        unique,
+    )
+
+
+def _window_sets(windows: list[np.ndarray], granularity: Granularity) -> list[np.ndarray]:
+    """Return the sorted distinct coarsened addresses of each window."""
+    lengths = np.fromiter((len(w) for w in windows), dtype=np.int64, count=len(windows))
+    values = coarsen_addresses(np.concatenate(windows), granularity)
+    unique = sorted_unique(values)
+    n_unique = len(unique)
+    codes = np.searchsorted(unique, values).astype(np.int64)
+
+    window_ids = np.repeat(np.arange(len(windows), dtype=np.int64), lengths)
+    keys = sorted_unique(window_ids * n_unique + codes)
+    window_ids = keys // n_unique
+    lines = unique[keys - window_ids * n_unique]
+    sizes = np.bincount(window_ids, minlength=len(windows))
+    return np.split(lines, np.cumsum(sizes)[:-1])
+
+
+def _batch_edges(
+    windows: list[np.ndarray],
+    granularity: Granularity,
+    counts: Optional[np.ndarray] = None
+) -> _KeyedEdges:
+    """Compute the clique edges of a batch of windows.
+
+    Window indices in the result are relative to the batch. With `counts`,
+    the pairs of window w weigh ``counts[w]`` instead of 1.
+    """
+    lengths = np.fromiter((len(w) for w in windows), dtype=np.int64, count=len(windows))
+    values = coarsen_addresses(np.concatenate(windows), granularity)
+
+    # Dense codes keep every key below in int64 range
+    unique = sorted_unique(values)
+    n_unique = len(unique)
+    codes = np.searchsorted(unique, values).astype(np.int64)
+
+    # Deduplicate within each window; keys sort by (window, address)
+    window_ids = np.repeat(np.arange(len(windows), dtype=np.int64), lengths)
+    keys = sorted_unique(window_ids * n_unique + codes)
+    window_ids = keys // n_unique
+    codes = keys - window_ids * n_unique
+
+    # Element i of a window with c distinct addresses pairs with the
+    # c - 1 - i elements after it
+    sizes = np.bincount(window_ids, minlength=len(windows))
+    group_sizes = np.repeat(sizes, sizes)
+    local = np.arange(len(keys)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    partners = group_sizes - 1 - local
+
+    total = int(partners.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return _KeyedEdges(empty, empty, empty, unique)
+
+    first = np.repeat(np.arange(len(keys)), partners)
+    run_starts = np.cumsum(partners) - partners
+    second = first + 1 + (np.arange(total) - np.repeat(run_starts, partners))
+
+    pair_keys = codes[first] * n_unique + codes[second]
+    pair_windows = window_ids[first]
+
+    # Reduce pairs: count windows and keep the earliest. When (pair, window)
+    # packs into one int64, a plain sort (much faster than argsort) puts
+    # each pair's earliest window first in its run.
+    n_windows = len(windows)
+    if n_unique * n_unique <= _INT64_MAX // n_windows:
+        packed = np.sort(pair_keys * n_windows + pair_windows)
+        pair_keys = packed // n_windows
+        pair_windows = packed - pair_keys * n_windows
+        starts = _run_starts(pair_keys)
+        first_windows = pair_windows[starts]
+    else:
+        order = np.argsort(pair_keys)
+        pair_keys = pair_keys[order]
+        pair_windows = pair_windows[order]
+        starts = _run_starts(pair_keys)
+        first_windows = np.minimum.reduceat(pair_windows, starts)
+
+    if counts is None:
+        weight = np.diff(np.append(starts, total))
+    else:
+        weight = np.add.reduceat(counts[pair_windows], starts)
+
+    return _KeyedEdges(pair_keys[starts], weight, first_windows, unique)
+
+
+def _batch_neighbor_edges(
+    windows: list[np.ndarray],
+    granularity: Granularity,
+    neighbors: TemporalNeighbors
+) -> _KeyedEdges:
+    """Compute the temporal-neighbor edges of a batch of windows.
+
+    Pairs are generated one distance at a time, by comparing the batch
+    with itself shifted by d = 1..k, so a batch of n accesses costs
+    O(n * k). Window indices in the result are relative to the batch.
+    """
+    lengths = np.fromiter((len(w) for w in windows), dtype=np.int64, count=len(windows))
+    values = coarsen_addresses(np.concatenate(windows), granularity)
+    unique = sorted_unique(values)
+    n_unique = len(unique)
+    codes = np.searchsorted(unique, values).astype(np.int64)
+    window_ids = np.repeat(np.arange(len(windows), dtype=np.int64), lengths)
+
+    pair_parts = []
+    window_parts = []
+    distance_parts = []
+    max_distance = min(neighbors.k, int(lengths.max(initial=0)) - 1)
+    for distance in range(1, max_distance + 1):
+        earlier = codes[:-distance]
+        later = codes[distance:]
+        keep = (window_ids[distance:] == window_ids[:-distance]) & (earlier != later)
+        earlier = earlier[keep]
+        later = later[keep]
+        pair_parts.append(
+            np.minimum(earlier, later) * n_unique + np.maximum(earlier, later)
+        )
+        window_parts.append(window_ids[distance:][keep])
+        distance_parts.append(np.full(len(earlier), distance, dtype=np.int64))
+
+    empty = np.empty(0, dtype=np.int64)
+    pair_keys = np.concatenate(pair_parts) if pair_parts else empty
+    if len(pair_keys) == 0:
+        return _KeyedEdges(empty, empty, empty, unique)
+    pair_windows = np.concatenate(window_parts)
+    distances = np.concatenate(distance_parts)
+
+    # One row per (pair, window), at the pair's smallest distance there
+    order = np.lexsort((distances, pair_windows, pair_keys))
+    pair_keys = pair_keys[order]
+    pair_windows = pair_windows[order]
+    distances = distances[order]
+    first = np.empty(len(order), dtype=bool)
+    first[0] = True
+    first[1:] = (pair_keys[1:] != pair_keys[:-1]) | (pair_windows[1:] != pair_windows[:-1])
+    pair_keys = pair_keys[first]
+    pair_windows = pair_windows[first]
+
+    if neighbors.decay is None:
+        contributions = np.ones(len(pair_keys), dtype=np.int64)
+    else:
+        contributions = np.power(neighbors.decay, distances[first] - 1.0)
+
+    # Rows of a pair are in window order, so its first row has its first window
+    starts = _run_starts(pair_keys)
+    return _KeyedEdges(
+        pair_keys[starts],
+        np.add.reduceat(contributions, starts),
+        pair_windows[starts],
+        unique,
+    )
+
+
+def _run_starts(keys: np.ndarray) -> np.ndarray:
+    """Return the start index of each run of equal values in a sorted array."""
+    change = np.empty(len(keys), dtype=bool)
+    change[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=change[1:])
+    return np.flatnonzero(change)
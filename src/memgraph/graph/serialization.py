@@ -4,26 +4,60 @@ import pickle
 from pathlib import Path
 from typing import Optional
 import networkx as nx  # type: ignore
+import numpy as np  # type: ignore
+
+from memgraph.graph.csr import AnyGraph, CSRGraph
 
 
 def save_graph(
-    graph: nx.Graph,
+    graph: AnyGraph,
     path: Path,
     format: str = "pickle"
 ) -> None:
     """Save graph to disk.
 
+    The "npz" format stores the arrays of a CSRGraph and is the compact
+    choice for large graphs; the other formats store a NetworkX graph.
+    Graphs of the other type are converted first. Directed graphs (e.g.
+    transition graphs) keep their direction only in "pickle" and
+    "graphml".
+
     Args:
-        graph: NetworkX graph to save
+        graph: NetworkX or CSR graph to save
         path: Output file path
-        format: Serialization format ("pickle", "graphml", "edgelist")
+        format: Serialization format ("pickle", "graphml", "edgelist", "npz")
 
     Raises:
-        ValueError: If format is not supported
+        ValueError: If format is not supported, or would drop the
+            direction of a directed graph
     """
     path = Path(path)
     format = format.lower()
 
+    if format in ("npz", "edgelist") and not isinstance(graph, CSRGraph):
+        if graph.is_directed():
+            raise ValueError(
+                f"Format {format} stores undirected graphs; "
+                f"use pickle or graphml for directed graphs"
+            )
+
+    if format == "npz":
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_networkx(graph)
+        # Write through a file object so NumPy doesn't append ".npz"
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                addresses=graph.addresses,
+                indptr=graph.indptr,
+                indices=graph.indices,
+                weights=graph.weights,
+            )
+        return
+
+    if isinstance(graph, CSRGraph):
+        graph = graph.to_networkx()
+
     if format == "pickle":
         with open(path, "wb") as f:
             pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
@@ -37,11 +71,11 @@ def save_graph(
     else:
         raise ValueError(
             f"Unsupported format: {format}. "
-            f"Supported formats: pickle, graphml, edgelist"
+            f"Supported formats: pickle, graphml, edgelist, npz"
         )
 
 
-def load_graph(path: Path, format: Optional[str] = None) -> nx.Graph:
+def load_graph(path: Path, format: Optional[str] = None) -> AnyGraph:
     """Load graph from disk.
 
     Args:
@@ -49,7 +83,7 @@ def load_graph(path: Path, format: Optional[str] = None) -> nx.Graph:
         format: Serialization format. If None, auto-detect from extension.
 
     Returns:
-        Loaded NetworkX graph
+        Loaded graph: a CSRGraph for "npz", otherwise a NetworkX graph
 
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -77,15 +111,35 @@ def load_graph(path: Path, format: Optional[str] = None) -> nx.Graph:
         return nx.read_graphml(path)  # type: ignore[no-any-return]
 
     elif format == "edgelist":
-        return nx.read_edgelist(path, data=[("weight", int)])  # type: ignore[no-any-return,call-overload]
+        return nx.read_edgelist(path, data=[("weight", _parse_weight)])  # type: ignore[no-any-return,call-overload]
+
+    elif format == "npz":
+        with np.load(path) as arrays:
+            try:
+                return CSRGraph(
+                    arrays["addresses"],
+                    arrays["indptr"],
+                    arrays["indices"],
+                    arrays["weights"],
+                )
+            except KeyError as e:
+                raise ValueError(f"Not a CSR graph file: missing {e}") from e
 
     else:
         raise ValueError(
             f"Unsupported format: {format}. "
-            f"Supported formats: pickle, graphml, edgelist"
+            f"Supported formats: pickle, graphml, edgelist, npz"
         )
 
 
+def _parse_weight(text: str) -> int | float:
+    """Parse an edge-list weight: an int, or a float for decayed weights."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
 def _detect_format(path: Path) -> str:
     """Detect graph format from file extension.
 
@@ -107,6 +161,7 @@ def _detect_format(path: Path) -> str:
         ".xml": "graphml",
         ".edgelist": "edgelist",
         ".edges": "edgelist",
+        ".npz": "npz",
     }
 
     if suffix in format_map:
@@ -0,0 +1,133 @@
+"""Count-min sketches for approximate edge weights."""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np  # type: ignore
+
+from memgraph.trace.cardinality import mix64
+
+
+# Bytes per sketch counter (int64)
+COUNTER_BYTES = 8
+
+DEFAULT_SKETCH_BUDGET = 64 << 20
+DEFAULT_SKETCH_DEPTH = 4
+
+# Odd constant separating the hash rows (double hashing)
+_ROW_STEP = np.uint64(0x9E3779B97F4A7C15)
+
+
+@dataclass(frozen=True)
+class SketchConfig:
+    """Size of the count-min sketch used for heavy-edge graph building.
+
+    The sketch has ``depth`` rows of counters filling ``memory_budget``
+    bytes. A pair's estimated weight never undercounts and, with
+    probability at least ``1 - exp(-depth)``, overcounts by at most
+    ``e / width`` times the total weight added to the sketch.
+    """
+
+    memory_budget: int = DEFAULT_SKETCH_BUDGET  # Bytes of counters
+    depth: int = DEFAULT_SKETCH_DEPTH           # Independent hash rows
+
+    def __post_init__(self) -> None:
+        if self.depth < 1:
+            raise ValueError("depth must be at least 1")
+        if self.memory_budget < self.depth * COUNTER_BYTES:
+            raise ValueError("memory_budget must fit at least one counter per row")
+
+    @property
+    def width(self) -> int:
+        """Counters per row."""
+        return self.memory_budget // (self.depth * COUNTER_BYTES)
+
+    @property
+    def confidence(self) -> float:
+        """Probability that an estimate is within the error bound."""
+        return 1.0 - math.exp(-self.depth)
+
+    def create(self) -> "CountMinSketch":
+        """Return an empty sketch of this size."""
+        return CountMinSketch(self.width, self.depth)
+
+
+class CountMinSketch:
+    """Count-min sketch over uint64 keys with conservative update.
+
+    Each key is hashed to one counter per row, and its estimate is the
+    smallest of those counters. Updates only raise a key's counters as
+    far as needed for its estimate to cover the new count (conservative
+    update), which never undercounts and keeps estimates of light keys
+    much closer than the classic bound. Updates are vectorized over NumPy
+    arrays of distinct keys.
+    """
+
+    def __init__(self, width: int, depth: int = DEFAULT_SKETCH_DEPTH):
+        """Initialize an empty sketch.
+
+        Args:
+            width: Counters per row
+            depth: Number of rows
+        """
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be at least 1")
+        self.width = width
+        self.depth = depth
+        self.counters = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    @property
+    def epsilon(self) -> float:
+        """Overcount bound per unit of total weight (e / width)."""
+        return math.e / self.width
+
+    @property
+    def delta(self) -> float:
+        """Probability that an estimate exceeds the error bound."""
+        return math.exp(-self.depth)
+
+    def error_bound(self) -> int:
+        """Return the bound on how far an estimate may overcount.
+
+        With probability at least ``1 - delta``, every single estimate is
+        within this many counts of the true weight.
+        """
+        return math.ceil(self.epsilon * self.total)
+
+    def update(self, keys: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Add counts for distinct keys and return their new estimates.
+
+        Args:
+            keys: Array of distinct uint64 keys
+            counts: Count to add for each key
+
+        Returns:
+            int64 array of estimated totals, one per key
+        """
+        index = self._index(keys)
+        counts = np.asarray(counts, dtype=np.int64)
+        estimates: np.ndarray = self._estimate(index) + counts
+        for row in range(self.depth):
+            np.maximum.at(self.counters[row], index[row], estimates)
+        self.total += int(counts.sum())
+        return estimates
+
+    def estimate(self, keys: np.ndarray) -> np.ndarray:
+        """Return the estimated totals of keys (never below the true totals)."""
+        return self._estimate(self._index(keys))
+
+    def _estimate(self, index: np.ndarray) -> np.ndarray:
+        return np.min(  # type: ignore[no-any-return]
+            self.counters[np.arange(self.depth)[:, None], index], axis=0
+        )
+
+    def _index(self, keys: np.ndarray) -> np.ndarray:
+        """Return the (depth, n) counter indices of keys."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        first = mix64(keys)
+        step = mix64(keys ^ _ROW_STEP) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        with np.errstate(over="ignore"):
+            hashes = first + rows * step
+        return (hashes % np.uint64(self.width)).astype(np.intp)  # type: ignore[no-any-return]
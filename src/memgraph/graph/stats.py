@@ -2,6 +2,9 @@
 
 from dataclasses import dataclass
 import networkx as nx  # type: ignore
+import numpy as np  # type: ignore
+
+from memgraph.graph.csr import AnyGraph, CSRGraph
 
 
 @dataclass
@@ -18,15 +21,22 @@ class GraphStats:
     avg_clustering: float       # clustering coefficient
 
     @classmethod
-    def from_graph(cls, graph: nx.Graph) -> "GraphStats":
-        """Compute statistics from a NetworkX graph.
+    def from_graph(cls, graph: AnyGraph) -> "GraphStats":
+        """Compute statistics from a NetworkX or CSR graph.
+
+        For directed graphs (e.g. transition graphs) density counts
+        ordered pairs, degrees are in + out degrees, and components are
+        weakly connected.
 
         Args:
-            graph: NetworkX graph to analyze
+            graph: Graph to analyze
 
         Returns:
             GraphStats object with computed metrics
         """
+        if isinstance(graph, CSRGraph):
+            return cls._from_csr(graph)
+
         node_count = graph.number_of_nodes()
         edge_count = graph.number_of_edges()
 
@@ -34,7 +44,7 @@ class GraphStats:
         if node_count <= 1:
             density = 0.0
         else:
-            max_edges = node_count * (node_count - 1) / 2
+            max_edges = node_count * (node_count - 1) / (1 if graph.is_directed() else 2)
             density = edge_count / max_edges if max_edges > 0 else 0.0
 
         # Compute degree statistics
@@ -47,7 +57,10 @@ class GraphStats:
             max_degree = 0
 
         # Compute connected components
-        components = list(nx.connected_components(graph))
+        if isinstance(graph, nx.DiGraph):
+            components = list(nx.weakly_connected_components(graph))
+        else:
+            components = list(nx.connected_components(graph))
         connected_components = len(components)
         largest_component_size = len(max(components, key=len)) if components else 0
 
@@ -72,6 +85,45 @@ class GraphStats:
             avg_clustering=avg_clustering,
         )
 
+    @classmethod
+    def _from_csr(cls, graph: CSRGraph) -> "GraphStats":
+        """Compute statistics from a CSR graph without converting it.
+
+        Matches `from_graph` on the equivalent NetworkX graph.
+        """
+        node_count = graph.number_of_nodes()
+        edge_count = graph.number_of_edges()
+        if node_count == 0:
+            return cls(0, 0, 0.0, 0.0, 0, 0, 0, 0.0)
+
+        max_edges = node_count * (node_count - 1) / 2
+        density = edge_count / max_edges if max_edges > 0 else 0.0
+
+        degrees = graph.degrees()
+
+        component_sizes = np.bincount(graph.component_labels())
+        component_sizes = component_sizes[component_sizes > 0]
+
+        # Local clustering is 2T / (d (d - 1)), and 0 below degree 2
+        pairs = degrees * (degrees - 1)
+        clustering = np.divide(
+            2.0 * graph.triangles(),
+            pairs,
+            out=np.zeros(node_count),
+            where=pairs > 0,
+        )
+
+        return cls(
+            node_count=node_count,
+            edge_count=edge_count,
+            density=density,
+            avg_degree=float(degrees.mean()),
+            max_degree=int(degrees.max()),
+            connected_components=len(component_sizes),
+            largest_component_size=int(component_sizes.max()),
+            avg_clustering=float(clustering.mean()),
+        )
+
     def format_summary(self) -> str:
         """Format statistics as a human-readable summary.
 
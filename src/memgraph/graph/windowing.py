@@ -1,24 +1,301 @@
 """Windowing strategies for temporal adjacency graph construction."""
 
-from abc import ABC, abstractmethod
-from typing import Iterator
-from memgraph.trace.models import MemoryAccess
+from abc import ABC
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np  # type: ignore
+
+from memgraph.graph.coarsening import Granularity, coarsen_addresses
+from memgraph.trace.models import (
+    AccessView,
+    MemoryAccess,
+    Trace,
+    OPERATION_DTYPE,
+    SIZE_DTYPE,
+    TIMESTAMP_DTYPE,
+    sorted_unique,
+)
+
+
+# Windows can be taken over MemoryAccess sequences or over a column array
+# of a columnar Trace (e.g. ``trace.addresses``). Slicing an array yields a
+# view, so array windows never copy the underlying trace data.
+Accesses = Union[Sequence[MemoryAccess], np.ndarray]
+
+
+def _first_occurrence(values: np.ndarray) -> np.ndarray:
+    """Return, for each position, the position where its value first occurs."""
+    first = np.empty(len(values), dtype=np.int64)
+    if not len(values):
+        return first
+
+    order = np.argsort(values)
+    ordered = values[order]
+    new_value = np.empty(len(values), dtype=bool)
+    new_value[0] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=new_value[1:])
+
+    # The sort isn't stable, so take the smallest position of each value
+    run_first = np.minimum.reduceat(order, np.flatnonzero(new_value))
+    first[order] = run_first[np.cumsum(new_value) - 1]
+    return first
+
+
+def _address_array(accesses: Accesses) -> np.ndarray:
+    """Return the addresses of a trace or window as an array."""
+    if isinstance(accesses, np.ndarray):
+        return accesses
+    if isinstance(accesses, AccessView):
+        return accesses.addresses
+    return np.fromiter(
+        (acc.address for acc in accesses), dtype=np.uint64, count=len(accesses)
+    )
+
+
+def _access_sequence(accesses: Accesses) -> Sequence[MemoryAccess]:
+    """Return a trace or window as MemoryAccess objects.
+
+    Address arrays are wrapped in an AccessView; their operations and sizes
+    are unknown and read as zero-byte reads.
+    """
+    if not isinstance(accesses, np.ndarray):
+        return accesses
+    addresses = np.asarray(accesses, dtype=np.uint64)
+    return AccessView(
+        addresses,
+        np.zeros(len(addresses), dtype=OPERATION_DTYPE),
+        np.zeros(len(addresses), dtype=SIZE_DTYPE),
+        None,
+    )
+
+
+class _StreamBuffer:
+    """Bounded buffer of addresses fed from a stream of address chunks.
+
+    Positions are absolute indices into the whole stream. Only the
+    addresses from the oldest unreleased position onwards are held.
+    """
+
+    def __init__(self, chunks: Iterable[np.ndarray]):
+        self._chunks = iter(chunks)
+        self._buffer = np.empty(0, dtype=np.uint64)
+        self._offset = 0  # Absolute position of self._buffer[0]
+
+    @property
+    def end(self) -> int:
+        """Absolute position just past the last buffered address."""
+        return self._offset + len(self._buffer)
+
+    def _next_chunk(self) -> Optional[np.ndarray]:
+        """Return the next non-empty chunk, or None at the end of the stream."""
+        for chunk in self._chunks:
+            if len(chunk):
+                return np.asarray(chunk)
+        return None
+
+    def fill(self, end: int) -> int:
+        """Buffer addresses up to position `end` if the stream has them.
+
+        Returns:
+            min(end, stream length)
+        """
+        pieces = [self._buffer]
+        available = self.end
+        while available < end:
+            chunk = self._next_chunk()
+            if chunk is None:
+                break
+            pieces.append(chunk)
+            available += len(chunk)
+
+        if len(pieces) > 1:
+            self._buffer = np.concatenate(pieces)
+        return min(end, self.end)
+
+    def window(self, start: int, end: int) -> np.ndarray:
+        """Return buffered addresses [start, end) as a view."""
+        return self._buffer[start - self._offset:end - self._offset]
+
+    def release(self, position: int) -> None:
+        """Drop addresses before `position`, skipping ahead in the stream if needed."""
+        while position > self.end:
+            self._offset = self.end
+            self._buffer = self._buffer[:0]
+            chunk = self._next_chunk()
+            if chunk is None:
+                return
+            self._buffer = chunk
+
+        self._buffer = self._buffer[position - self._offset:]
+        self._offset = position
 
 
 class WindowStrategy(ABC):
-    """Abstract base class for windowing strategies."""
+    """Abstract base class for windowing strategies.
+
+    Strategies describe windows as (start, end) offsets into the trace by
+    implementing `spans`; `windows` then slices them, so windows over an
+    array are zero-copy views. Older strategies that only implement
+    `windows` keep working: they are given MemoryAccess objects, as they
+    were written for, and GraphBuilder aggregates whatever windows they
+    yield. A strategy must implement at least one of the two.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        if cls.spans is WindowStrategy.spans and cls.windows is WindowStrategy.windows:
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__}: "
+                "it must implement spans() or windows()"
+            )
+        return super().__new__(cls)
+
+    @property
+    def implements_spans(self) -> bool:
+        """True if the strategy describes its windows as spans.
+
+        Strategies that only implement `windows` may yield windows that are
+        not slices of the trace (e.g. filtered), which have no offsets.
+        """
+        return type(self).spans is not WindowStrategy.spans
+
+    def spans(self, accesses: Accesses) -> Iterator[tuple[int, int]]:
+        """Yield windows as (start, end) offsets into `accesses`.
+
+        This default adapts strategies that only implement `windows`. Their
+        windows are taken over `accesses` as MemoryAccess objects (an
+        address array is wrapped in an AccessView) and must be contiguous
+        slices of it.
+
+        Args:
+            accesses: Sequence of memory accesses, or an address array
+
+        Yields:
+            (start, end) offsets; the window is ``accesses[start:end]``
+
+        Raises:
+            ValueError: If a window is not a slice of `accesses`
+        """
+        sequence = _access_sequence(accesses)
+        positions: Optional[dict[int, int]] = None
+
+        for window in self.windows(sequence):
+            n = len(window)
+            if not n:
+                yield 0, 0
+                continue
+
+            start = -1
+            if isinstance(window, AccessView) and isinstance(sequence, AccessView):
+                # Slices of a view share its columns and know their offset
+                if np.may_share_memory(window.addresses, sequence.addresses):
+                    start = window.offset - sequence.offset
+            elif not isinstance(window, np.ndarray) and not isinstance(sequence, AccessView):
+                # Slices of a plain sequence hold the same objects
+                if positions is None:
+                    positions = {id(acc): i for i, acc in enumerate(sequence)}
+                start = positions.get(id(window[0]), -1)
+                if start >= 0 and not all(
+                    acc is other for acc, other in zip(window, sequence[start:start + n])
+                ):
+                    start = -1
+
+            if not 0 <= start <= len(sequence) - n:
+                raise ValueError(
+                    f"{type(self).__name__} windows must be slices of the trace"
+                )
+            yield start, start + n
+
+    def span_arrays(self, accesses: Accesses) -> tuple[np.ndarray, np.ndarray]:
+        """Return all window offsets as arrays.
+
+        Args:
+            accesses: Sequence of memory accesses, or an address array
+
+        Returns:
+            Tuple of (start, end) int64 arrays, one entry per window
+        """
+        bounds = np.fromiter(
+            (offset for span in self.spans(accesses) for offset in span),
+            dtype=np.int64,
+        )
+        return bounds[0::2], bounds[1::2]
 
-    @abstractmethod
-    def windows(self, accesses: list[MemoryAccess]) -> Iterator[list[MemoryAccess]]:
+    def trace_spans(self, trace: Trace) -> tuple[np.ndarray, np.ndarray]:
+        """Return the window offsets over a columnar trace.
+
+        Strategies that need more than the addresses (e.g. timestamps)
+        override this; by default windows are taken over the address column,
+        or over `trace.accesses` for strategies that only implement `windows`.
+
+        Args:
+            trace: Trace to split into windows
+
+        Returns:
+            Tuple of (start, end) int64 arrays, one entry per window
+        """
+        if not self.implements_spans:
+            return self.span_arrays(trace.accesses)
+        return self.span_arrays(trace.addresses)
+
+    def trace_windows(self, trace: Trace) -> Iterator[np.ndarray]:
+        """Yield the windows of a columnar trace as address arrays.
+
+        Windows described by spans are views of the address column.
+        Strategies that only implement `windows` are given `trace.accesses`
+        and may yield any windows, e.g. filtered or rebuilt ones.
+
+        Args:
+            trace: Trace to split into windows
+
+        Yields:
+            Address arrays representing windows
+        """
+        if not self.implements_spans:
+            for window in self.windows(trace.accesses):
+                yield _address_array(window)
+            return
+
+        starts, ends = self.trace_spans(trace)
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            yield trace.addresses[start:end]
+
+    def windows(self, accesses: Accesses) -> Iterator[Accesses]:
         """Yield windows of memory accesses.
 
         Args:
-            accesses: List of memory accesses
+            accesses: Sequence of memory accesses, or an address array
 
         Yields:
-            Lists of memory accesses representing windows
+            Slices of `accesses` representing windows (views for arrays)
         """
-        pass
+        for start, end in self.spans(accesses):
+            yield accesses[start:end]
+
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Yield windows over a stream of address chunks.
+
+        Produces the same windows as `windows` over the concatenated
+        addresses. The built-in strategies hold only about one window plus
+        one chunk in memory; this default implementation collects the whole
+        stream first, so custom strategies work unchanged.
+
+        Windows are views into an internal buffer and are only valid until
+        the next window is requested.
+
+        Args:
+            chunks: Iterable of address arrays, in trace order
+
+        Yields:
+            Address arrays representing windows
+        """
+        parts = [np.asarray(chunk) for chunk in chunks]
+        addresses = np.concatenate(parts) if parts else np.empty(0, dtype=np.uint64)
+        if not self.implements_spans:
+            for window in self.windows(_access_sequence(addresses)):
+                yield _address_array(window)
+            return
+        for window in self.windows(addresses):
+            yield np.asarray(window)
 
 
 class FixedWindow(WindowStrategy):
@@ -37,19 +314,43 @@ class FixedWindow(WindowStrategy):
             raise ValueError("Window size must be positive")
         self.size = size
 
-    def windows(self, accesses: list[MemoryAccess]) -> Iterator[list[MemoryAccess]]:
-        """Yield non-overlapping fixed-size windows.
+    def spans(self, accesses: Accesses) -> Iterator[tuple[int, int]]:
+        """Yield non-overlapping fixed-size windows as offsets.
+
+        Args:
+            accesses: Sequence of memory accesses, or an address array
+
+        Yields:
+            (start, end) offsets of windows of size `self.size`
+        """
+        n = len(accesses)
+        for i in range(0, n, self.size):
+            yield i, min(i + self.size, n)
+
+    def span_arrays(self, accesses: Accesses) -> tuple[np.ndarray, np.ndarray]:
+        """Return the window offsets as arrays (see `WindowStrategy.span_arrays`)."""
+        n = len(accesses)
+        starts = np.arange(0, n, self.size, dtype=np.int64)
+        return starts, np.minimum(starts + self.size, n)
+
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Yield non-overlapping fixed-size windows over address chunks.
 
         Args:
-            accesses: List of memory accesses
+            chunks: Iterable of address arrays, in trace order
 
         Yields:
             Non-overlapping windows of size `self.size`
         """
-        for i in range(0, len(accesses), self.size):
-            window = accesses[i:i + self.size]
-            if window:  # Skip empty windows
-                yield window
+        buffer = _StreamBuffer(chunks)
+        i = 0
+        while True:
+            end = buffer.fill(i + self.size)
+            if end <= i:
+                break
+            yield buffer.window(i, end)
+            buffer.release(end)
+            i = end
 
 
 class SlidingWindow(WindowStrategy):
@@ -72,25 +373,64 @@ class SlidingWindow(WindowStrategy):
         self.size = size
         self.step = step
 
-    def windows(self, accesses: list[MemoryAccess]) -> Iterator[list[MemoryAccess]]:
-        """Yield overlapping sliding windows.
+    def spans(self, accesses: Accesses) -> Iterator[tuple[int, int]]:
+        """Yield overlapping sliding windows as offsets.
+
+        Args:
+            accesses: Sequence of memory accesses, or an address array
+
+        Yields:
+            (start, end) offsets of windows of size `self.size`, sliding by
+            `self.step`; the last window might be smaller
+        """
+        starts, ends = self.bounds(len(accesses))
+        yield from zip(starts.tolist(), ends.tolist())
+
+    def span_arrays(self, accesses: Accesses) -> tuple[np.ndarray, np.ndarray]:
+        """Return the window offsets as arrays (see `WindowStrategy.span_arrays`)."""
+        return self.bounds(len(accesses))
+
+    def bounds(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the offsets of the sliding windows over n accesses.
+
+        Args:
+            n: Number of accesses
+
+        Returns:
+            Tuple of (start, end) int64 arrays; window w is [start[w], end[w])
+        """
+        if n <= 0:
+            starts = np.empty(0, dtype=np.int64)
+        elif n < self.size:
+            starts = np.zeros(1, dtype=np.int64)
+        else:
+            # Full windows, then at most one shorter final window
+            full = (n - self.size) // self.step + 1
+            count = full + (full * self.step < n)
+            starts = np.arange(count, dtype=np.int64) * self.step
+        return starts, np.minimum(starts + self.size, n)
+
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Yield overlapping sliding windows over address chunks.
 
         Args:
-            accesses: List of memory accesses
+            chunks: Iterable of address arrays, in trace order
 
         Yields:
             Overlapping windows of size `self.size`, sliding by `self.step`
         """
+        buffer = _StreamBuffer(chunks)
         i = 0
-        while i < len(accesses):
-            window = accesses[i:i + self.size]
-            if len(window) < self.size:
+        while True:
+            end = buffer.fill(i + self.size)
+            if end <= i:
+                break
+            yield buffer.window(i, end)
+            if end - i < self.size:
                 # Last window might be smaller
-                if window:
-                    yield window
                 break
-            yield window
             i += self.step
+            buffer.release(i)
 
 
 class AdaptiveWindow(WindowStrategy):
@@ -105,7 +445,8 @@ class AdaptiveWindow(WindowStrategy):
         base_size: int = 100,
         min_size: int = 20,
         max_size: int = 500,
-        locality_threshold: float = 0.5
+        locality_threshold: float = 0.5,
+        granularity: Optional[Granularity] = None
     ):
         """Initialize adaptive window strategy.
 
@@ -116,6 +457,9 @@ class AdaptiveWindow(WindowStrategy):
             locality_threshold: Threshold for locality ratio (0.0 to 1.0)
                 High locality (>threshold) increases window size
                 Low locality (<threshold) decreases window size
+            granularity: Granularity at which reuse is tracked (default:
+                raw byte addresses). Coarser tracking counts accesses to the
+                same cache line or page as reuse.
         """
         if base_size <= 0 or min_size <= 0 or max_size <= 0:
             raise ValueError("All sizes must be positive")
@@ -128,62 +472,234 @@ class AdaptiveWindow(WindowStrategy):
         self.min_size = min_size
         self.max_size = max_size
         self.locality_threshold = locality_threshold
+        self.granularity = granularity
+
+    def _locality_addresses(self, accesses: Accesses) -> np.ndarray:
+        """Return the addresses reuse is tracked on (coarsened if configured)."""
+        addresses = _address_array(accesses)
+        if self.granularity is None:
+            return addresses
+        return coarsen_addresses(addresses, self.granularity)
 
-    def _compute_locality(self, window: list[MemoryAccess], seen: set[int]) -> float:
-        """Compute locality ratio for a window.
+    def _compute_locality(self, window: Accesses, seen: set[int]) -> float:
+        """Compute locality for a window against a set of seen addresses.
+
+        Used when streaming, where the whole trace isn't available up front.
 
         Args:
             window: Current window of accesses
-            seen: Set of addresses seen before this window
+            seen: Set of (tracked) addresses seen before this window
 
         Returns:
             Ratio of accesses to previously seen addresses (0.0 to 1.0)
         """
-        if not window:
+        if not len(window):
             return 0.0
 
-        reuse_count = sum(1 for acc in window if acc.address in seen)
+        addresses = self._locality_addresses(window).tolist()
+        reuse_count = sum(1 for address in addresses if address in seen)
         return reuse_count / len(window)
 
-    def windows(self, accesses: list[MemoryAccess]) -> Iterator[list[MemoryAccess]]:
-        """Yield adaptive windows that adjust size based on locality.
+    def _next_size(self, current_size: int, locality: float) -> int:
+        """Return the size of the next window given this window's locality."""
+        if locality > self.locality_threshold:
+            # High locality - increase window size
+            return min(int(current_size * 1.2), self.max_size)
+        # Low locality - decrease window size
+        return max(int(current_size * 0.8), self.min_size)
+
+    def spans(self, accesses: Accesses) -> Iterator[tuple[int, int]]:
+        """Yield adaptive windows that adjust size based on locality, as offsets.
+
+        An access is a reuse if its address first occurred before the
+        current window. The first occurrence of every address is computed
+        once for the whole trace, so each window's locality is a single
+        vectorized comparison instead of a scan over a growing set.
 
         Args:
-            accesses: List of memory accesses
+            accesses: Sequence of memory accesses, or an address array
 
         Yields:
-            Windows with adaptive sizes based on temporal locality
+            (start, end) offsets of windows with adaptive sizes based on
+            temporal locality
         """
-        if not accesses:
+        n = len(accesses)
+        if not n:
             return
 
+        first_seen = _first_occurrence(self._locality_addresses(accesses))
         current_size = self.base_size
-        seen_addresses: set[int] = set()
         i = 0
 
-        while i < len(accesses):
-            # Get current window
-            window_end = min(i + current_size, len(accesses))
-            window = accesses[i:window_end]
+        while i < n:
+            window_end = min(i + current_size, n)
+            yield i, window_end
+
+            reuse_count = np.count_nonzero(first_seen[i:window_end] < i)
+            locality = reuse_count / (window_end - i)
+            current_size = self._next_size(current_size, locality)
+            i = window_end
+
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Yield adaptive windows over address chunks.
+
+        Args:
+            chunks: Iterable of address arrays, in trace order
 
-            if not window:
+        Yields:
+            Windows with adaptive sizes based on temporal locality
+        """
+        buffer = _StreamBuffer(chunks)
+        current_size = self.base_size
+        seen_addresses: set[int] = set()
+        i = 0
+
+        while True:
+            window_end = buffer.fill(i + current_size)
+            if window_end <= i:
                 break
 
+            window = buffer.window(i, window_end)
             yield window
 
-            # Compute locality for this window
             locality = self._compute_locality(window, seen_addresses)
+            seen_addresses.update(self._locality_addresses(window).tolist())
+            current_size = self._next_size(current_size, locality)
+
+            buffer.release(window_end)
+            i = window_end
 
-            # Update seen addresses
-            for acc in window:
-                seen_addresses.add(acc.address)
 
-            # Adjust window size based on locality
-            if locality > self.locality_threshold:
-                # High locality - increase window size
-                current_size = min(int(current_size * 1.2), self.max_size)
-            else:
-                # Low locality - decrease window size
-                current_size = max(int(current_size * 0.8), self.min_size)
+class TimeWindow(WindowStrategy):
+    """Windows covering a fixed span of time.
+
+    Window w holds the accesses with timestamps in
+    ``[t0 + w * step, t0 + w * step + duration)``, where t0 is the first
+    timestamp. Timestamps are in whatever unit the trace records (cycles,
+    nanoseconds, instruction counts); traces without explicit timestamps
+    use the access index. Only windows that hold an access are generated,
+    and their boundaries are found by binary search over the sorted
+    timestamps, so computing all windows costs O(n + windows * log n)
+    whatever the time span. Windows that contain no accesses are skipped.
+    """
+
+    def __init__(self, duration: int, step: Optional[int] = None):
+        """Initialize time window strategy.
+
+        Args:
+            duration: Time covered by each window
+            step: Time to slide forward each time (default: duration, i.e.
+                non-overlapping windows)
+        """
+        if duration <= 0:
+            raise ValueError("Window duration must be positive")
+        if step is not None and step <= 0:
+            raise ValueError("Step size must be positive")
+        self.duration = duration
+        self.step = duration if step is None else step
+
+    def bounds(self, timestamps: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the offsets of the windows over a timestamp column.
+
+        Args:
+            timestamps: Non-decreasing timestamps, one per access
+
+        Returns:
+            Tuple of (start, end) int64 arrays, one entry per non-empty window
+
+        Raises:
+            ValueError: If the timestamps are not sorted
+        """
+        timestamps = np.asarray(timestamps, dtype=TIMESTAMP_DTYPE)
+        if not len(timestamps):
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            raise ValueError("TimeWindow requires timestamps in non-decreasing order")
+
+        first = np.uint64(timestamps[0])
+        times = self._window_indices(timestamps - first).astype(TIMESTAMP_DTYPE)
+        times = times * np.uint64(self.step) + first
+
+        starts = np.searchsorted(timestamps, times, side="left").astype(np.int64)
+        ends = np.searchsorted(
+            timestamps, times + np.uint64(self.duration), side="left"
+        ).astype(np.int64)
+        keep = ends > starts
+        return starts[keep], ends[keep]
+
+    def _window_indices(self, offsets: np.ndarray) -> np.ndarray:
+        """Return the sorted indices of the windows holding any access.
+
+        Only windows that cover an access are generated, so the cost
+        depends on the number of accesses and windows, not on how much
+        time the trace spans.
+
+        Args:
+            offsets: Non-decreasing timestamps relative to the first one
+
+        Returns:
+            int64 array of distinct window indices
+        """
+        step = np.uint64(self.step)
+        if self.step >= self.duration:
+            # Windows don't overlap: an access can only be in window t // step
+            return sorted_unique(offsets // step).astype(np.int64)
+
+        # Access t is in windows ceil((t - duration + 1) / step) .. t // step
+        duration = np.uint64(self.duration)
+        high = (offsets // step).astype(np.int64)
+        low = np.where(
+            offsets >= duration,
+            (np.maximum(offsets, duration) - duration) // step + np.uint64(1),
+            np.uint64(0),
+        ).astype(np.int64)
+
+        # Both bounds are non-decreasing, so each access adds the windows
+        # past the highest one covered by the accesses before it
+        low[1:] = np.maximum(low[1:], high[:-1] + 1)
+        counts = np.maximum(high - low + 1, 0)
+        total = int(counts.sum())
+        within = np.arange(total, dtype=np.int64) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        windows: np.ndarray = np.repeat(low, counts) + within
+        return windows
+
+    def spans(self, accesses: Accesses) -> Iterator[tuple[int, int]]:
+        """Yield time windows as offsets.
+
+        Args:
+            accesses: Sequence of memory accesses (their timestamps are
+                used), or an address array (the index is used as time)
+
+        Yields:
+            (start, end) offsets of the non-empty windows
+        """
+        starts, ends = self.span_arrays(accesses)
+        yield from zip(starts.tolist(), ends.tolist())
+
+    def span_arrays(self, accesses: Accesses) -> tuple[np.ndarray, np.ndarray]:
+        """Return the window offsets as arrays (see `WindowStrategy.span_arrays`)."""
+        if isinstance(accesses, np.ndarray):
+            timestamps = np.arange(len(accesses), dtype=TIMESTAMP_DTYPE)
+        else:
+            timestamps = np.fromiter(
+                (acc.timestamp for acc in accesses),
+                dtype=TIMESTAMP_DTYPE,
+                count=len(accesses),
+            )
+        return self.bounds(timestamps)
+
+    def trace_spans(self, trace: Trace) -> tuple[np.ndarray, np.ndarray]:
+        """Return the window offsets over a trace, from its timestamp column."""
+        return self.bounds(trace.get_timestamps())
+
+    def stream(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Not supported: address streams carry no timestamps.
+
+        Raises:
+            ValueError: Always
+        """
+        raise ValueError("TimeWindow needs timestamps and can't window an address stream")
 
-            i = window_end
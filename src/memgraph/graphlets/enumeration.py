@@ -2,8 +2,9 @@
 
 import networkx as nx  # type: ignore
 from itertools import combinations
-from typing import Dict, Set
+from typing import Dict, List
 
+from memgraph.graph.csr import AnyGraph, dense_adjacency
 from memgraph.graphlets.definitions import GraphletType, GraphletCount
 
 
@@ -14,17 +15,15 @@ class GraphletEnumerator:
     graphlets up to 4 nodes in a graph.
     """
 
-    def __init__(self, graph: nx.Graph):
+    def __init__(self, graph: AnyGraph):
         """Initialize graphlet enumerator.
 
         Args:
-            graph: NetworkX graph to analyze
+            graph: NetworkX or CSR graph to analyze
         """
         self.graph = graph
-        # Pre-compute adjacency for efficiency
-        self.adj: Dict[int, Set[int]] = {
-            n: set(graph.neighbors(n)) for n in graph.nodes()
-        }
+        # Pre-compute adjacency over dense node IDs (self.nodes[i] is node i)
+        self.nodes, self.adj = dense_adjacency(graph)
 
     def count_all(self) -> GraphletCount:
         """Count all graphlets in the graph.
@@ -33,9 +32,11 @@ class GraphletEnumerator:
             GraphletCount with counts for all graphlet types
         """
         counts = {g: 0 for g in GraphletType}
+        # Undirected edges, so a -> b and b -> a of a directed graph count once
+        edge_count = sum(len(neighbors) for neighbors in self.adj) // 2
 
         # Count 2-node graphlets (edges)
-        counts[GraphletType.G0_EDGE] = self.graph.number_of_edges()
+        counts[GraphletType.G0_EDGE] = edge_count
 
         # Count 3-node graphlets
         triangles, paths = self._count_3node()
@@ -50,7 +51,7 @@ class GraphletEnumerator:
             counts=counts,
             total=sum(counts.values()),
             node_count=self.graph.number_of_nodes(),
-            edge_count=self.graph.number_of_edges(),
+            edge_count=edge_count,
         )
 
     def _count_3node(self) -> tuple[int, int]:
@@ -59,21 +60,18 @@ class GraphletEnumerator:
         Returns:
             Tuple of (triangle_count, path_count)
         """
-        # Count triangles using NetworkX's efficient algorithm
-        triangle_dict: dict = nx.triangles(self.graph)  # type: ignore[assignment]
-        triangles = sum(triangle_dict.values()) // 3
-
-        # Count 2-paths: for each node, count pairs of neighbors that aren't connected
-        paths = 0
-        for node in self.graph.nodes():
-            neighbors = list(self.adj[node])
-            # For each pair of neighbors
-            for i in range(len(neighbors)):
-                for j in range(i + 1, len(neighbors)):
-                    n1, n2 = neighbors[i], neighbors[j]
-                    # If they're not connected, this forms a 2-path
-                    if n2 not in self.adj[n1]:
-                        paths += 1
+        # Each triangle is seen once from each of its three edges
+        closed = 0
+        for u, neighbors in enumerate(self.adj):
+            for v in neighbors:
+                if u < v:
+                    closed += len(neighbors & self.adj[v])
+        triangles = closed // 3
+
+        # Every pair of neighbors of a node is a 2-path unless the pair is
+        # connected, which happens three times per triangle
+        wedges = sum(len(n) * (len(n) - 1) // 2 for n in self.adj)
+        paths = wedges - 3 * triangles
 
         return triangles, paths
 
@@ -93,17 +91,17 @@ class GraphletEnumerator:
         }
 
         # Enumerate all 4-node combinations
-        nodes = list(self.graph.nodes())
-        for node_set in combinations(nodes, 4):
-            # Get induced subgraph
-            subgraph = self.graph.subgraph(node_set)
+        for node_set in combinations(range(len(self.adj)), 4):
+            # Degrees within the induced subgraph
+            degrees = [len(self.adj[n].intersection(node_set)) for n in node_set]
 
-            # Skip if not connected
-            if not nx.is_connected(subgraph):
+            # Four nodes are connected iff no node is isolated and there are
+            # at least 3 edges (a triangle plus an isolated node has 3)
+            if min(degrees) == 0 or sum(degrees) < 6:
                 continue
 
             # Classify the graphlet
-            gtype = self._classify_4node(subgraph)
+            gtype = self._classify_degrees(degrees)
             if gtype is not None:
                 counts[gtype] += 1
 
@@ -121,10 +119,22 @@ class GraphletEnumerator:
         if subgraph.number_of_nodes() != 4:
             return None
 
-        m = subgraph.number_of_edges()
+        return self._classify_degrees([d for _, d in subgraph.degree()])
+
+    @staticmethod
+    def _classify_degrees(degrees: List[int]) -> GraphletType | None:
+        """Classify a connected 4-node subgraph by its degree sequence.
+
+        Args:
+            degrees: Degree of each node within the subgraph
+
+        Returns:
+            GraphletType or None if not classifiable
+        """
+        m = sum(degrees) // 2
 
         # Classify by edge count and degree sequence
-        degrees = sorted([d for _, d in subgraph.degree()], reverse=True)
+        degrees = sorted(degrees, reverse=True)
 
         if m == 3:
             # Either 4-path [2,2,1,1] or 3-star [3,1,1,1]
@@ -7,6 +7,7 @@ from rich.columns import Columns
 from rich import box
 
 from memgraph.report.result import AnalysisResult
+from memgraph.trace.cardinality import format_unique_addresses
 
 
 class CLIReporter:
@@ -26,6 +27,18 @@ class CLIReporter:
         self._print_recommendations(result)
         self.console.print()
 
+    def report_multi(self, results: list[AnalysisResult]) -> None:
+        """Print a combined report for one trace analyzed at several granularities."""
+        self.console.print()
+        self._print_header(results[0])
+        self._print_trace_stats(results[0])
+        self._print_granularity_comparison(results)
+        for result in results:
+            self.console.print(f"\n[bold]Granularity: {result.granularity}[/bold]")
+            self._print_graphlet_distribution(result)
+            self._print_recommendations(result)
+        self.console.print()
+
     def _print_header(self, result: AnalysisResult):
         """Print report header."""
         self.console.print(Panel(
@@ -43,7 +56,10 @@ class CLIReporter:
 
         total = result.total_accesses
         table.add_row("Total Accesses", f"{total:,}")
-        table.add_row("Unique Addresses", f"{result.unique_addresses:,}")
+        table.add_row(
+            "Unique Addresses",
+            format_unique_addresses(result.unique_addresses, result.unique_addresses_error),
+        )
 
         read_pct = (result.read_count / total * 100) if total > 0 else 0
         write_pct = (result.write_count / total * 100) if total > 0 else 0
@@ -61,12 +77,40 @@ class CLIReporter:
 
         table.add_row("Nodes", f"{result.node_count:,}")
         table.add_row("Edges", f"{result.edge_count:,}")
+        if result.edge_weight_error:
+            table.add_row(
+                "Edge Weights", f"approximate (≤+{result.edge_weight_error:,}, count-min)"
+            )
         table.add_row("Density", f"{result.density:.4f}")
         table.add_row("Avg Degree", f"{result.avg_degree:.2f}")
         table.add_row("Avg Clustering", f"{result.avg_clustering:.4f}")
 
         self.console.print(table)
 
+    def _print_granularity_comparison(self, results: list[AnalysisResult]):
+        """Print graph statistics and classification side by side per granularity."""
+        table = Table(title="Granularity Comparison", box=box.SIMPLE)
+        table.add_column("Granularity", style="cyan", no_wrap=True)
+        table.add_column("Nodes", justify="right")
+        table.add_column("Edges", justify="right")
+        table.add_column("Degree", justify="right")
+        table.add_column("Clustering", justify="right")
+        table.add_column("Pattern", style="bold", no_wrap=True)
+        table.add_column("Conf.", justify="right")
+
+        for result in results:
+            table.add_row(
+                result.granularity,
+                f"{result.node_count:,}",
+                f"{result.edge_count:,}",
+                f"{result.avg_degree:.2f}",
+                f"{result.avg_clustering:.4f}",
+                result.detected_pattern,
+                f"{result.confidence:.1%}",
+            )
+
+        self.console.print(table)
+
     def _print_graphlet_distribution(self, result: AnalysisResult):
         """Print graphlet frequencies as horizontal bar chart."""
         table = Table(title="Graphlet Distribution", box=box.SIMPLE)
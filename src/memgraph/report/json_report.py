@@ -18,6 +18,21 @@ class JSONReporter:
 
         return json_str
 
+    def report_multi(
+        self, results: list[AnalysisResult], path: Path | None = None
+    ) -> str:
+        """Export results for several granularities as one JSON document.
+
+        The document maps each result's granularity to its full result.
+        """
+        combined = {result.granularity: result.to_dict() for result in results}
+        json_str = json.dumps({"granularities": combined}, indent=2)
+
+        if path:
+            path.write_text(json_str)
+
+        return json_str
+
     def report_minimal(self, result: AnalysisResult) -> str:
         """Export minimal JSON (just classification + recommendations)."""
         minimal = {
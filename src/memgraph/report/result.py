@@ -43,6 +43,13 @@ class AnalysisResult:
     window_size: int
     granularity: str
 
+    # Relative standard error of unique_addresses (0.0 = exact count)
+    unique_addresses_error: float = 0.0
+
+    # Bound on how far edge weights may overcount when the graph was built
+    # with a count-min sketch (0 = exact weights)
+    edge_weight_error: int = 0
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
         d = asdict(self)
@@ -1,6 +1,14 @@
 """Trace parsing and generation modules."""
 
 from memgraph.trace.models import MemoryAccess, TraceMetadata, Trace
-from memgraph.trace.parser import parse_trace
+from memgraph.trace.parser import parse_trace, stream_trace
+from memgraph.trace.stream import TraceStream
 
-__all__ = ["MemoryAccess", "TraceMetadata", "Trace", "parse_trace"]
+__all__ = [
+    "MemoryAccess",
+    "TraceMetadata",
+    "Trace",
+    "TraceStream",
+    "parse_trace",
+    "stream_trace",
+]
@@ -0,0 +1,76 @@
+"""Transparent decompression of gzip, bzip2 and xz trace files."""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO, Literal, Optional, cast
+
+
+# Leading magic bytes of each supported compression format
+COMPRESSION_MAGIC: dict[str, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+_MAGIC_LENGTH = max(len(magic) for magic in COMPRESSION_MAGIC.values())
+
+# Errors raised when reading a missing, unreadable, corrupt or non-text
+# trace file
+READ_ERRORS: tuple[type[Exception], ...] = (
+    IOError,
+    EOFError,
+    lzma.LZMAError,
+    UnicodeDecodeError,
+)
+
+
+def detect_compression(file_path: Path) -> Optional[str]:
+    """Detect whether a file is compressed, from its magic bytes.
+
+    The file extension is ignored, so misnamed files are handled too.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        "gzip", "bz2" or "xz", or None for uncompressed files
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(_MAGIC_LENGTH)
+    except IOError:
+        return None
+
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_trace(file_path: Path, mode: Literal["r", "rb"] = "r") -> IO:
+    """Open a trace file, decompressing it on the fly if needed.
+
+    Compressed files are decoded as a stream: nothing is written to disk and
+    only the data actually read is decompressed. Forward seeks are supported
+    (by decompressing and discarding), so byte offsets refer to the
+    decompressed content.
+
+    Args:
+        file_path: Path to the trace file
+        mode: "r" for text or "rb" for bytes
+
+    Returns:
+        Readable file object
+    """
+    compression = detect_compression(file_path)
+    text_mode = "rt" if mode == "r" else "rb"
+
+    if compression == "gzip":
+        return cast(IO, gzip.open(file_path, text_mode))
+    if compression == "bz2":
+        return bz2.open(file_path, text_mode)
+    if compression == "xz":
+        return lzma.open(file_path, text_mode)
+    return open(file_path, mode)
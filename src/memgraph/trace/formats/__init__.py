@@ -1,8 +1,16 @@
 """Trace format parsers."""
 
-from memgraph.trace.formats.base import BaseParser
+from memgraph.trace.formats.base import BaseParser, RangeParser
 from memgraph.trace.formats.lackey import LackeyParser
 from memgraph.trace.formats.csv import CSVParser
 from memgraph.trace.formats.native import NativeParser
+from memgraph.trace.formats.binary import BinaryParser
 
-__all__ = ["BaseParser", "LackeyParser", "CSVParser", "NativeParser"]
+__all__ = [
+    "BaseParser",
+    "RangeParser",
+    "LackeyParser",
+    "CSVParser",
+    "NativeParser",
+    "BinaryParser",
+]
@@ -2,13 +2,36 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Iterator
-from memgraph.trace.models import MemoryAccess, Trace
+from typing import Iterator, Optional
+
+import numpy as np  # type: ignore
+
+from memgraph.trace.cardinality import CardinalityConfig
+from memgraph.trace.models import (
+    MemoryAccess,
+    Trace,
+    OP_CODES,
+    ADDRESS_DTYPE,
+    OPERATION_DTYPE,
+    SIZE_DTYPE,
+)
 
 
 class BaseParser(ABC):
     """Abstract base class for trace format parsers."""
 
+    #: Accesses per chunk yielded by the default `iter_columns`
+    COLUMN_CHUNK = 1 << 16
+
+    def __init__(self, cardinality: Optional[CardinalityConfig] = None):
+        """Initialize the parser.
+
+        Args:
+            cardinality: How to count unique addresses in the metadata of
+                parsed traces (default: exactly)
+        """
+        self.cardinality = cardinality
+
     @abstractmethod
     def parse(self, file_path: Path) -> Trace:
         """Parse a trace file and return a Trace object.
@@ -41,6 +64,40 @@ class BaseParser(ABC):
         """
         pass
 
+    def iter_columns(
+        self,
+        file_path: Path
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Parse a trace file lazily as a stream of column chunks.
+
+        The default implementation batches `parse_iter`; formats with a bulk
+        decoder override it. Only one chunk is held in memory at a time.
+
+        Args:
+            file_path: Path to the trace file
+
+        Yields:
+            Tuples of (addresses, operations, sizes) column arrays
+
+        Raises:
+            ValueError: If the file format is invalid
+            FileNotFoundError: If the file doesn't exist
+        """
+        addresses: list[int] = []
+        operations: list[int] = []
+        sizes: list[int] = []
+
+        for access in self.parse_iter(file_path):
+            addresses.append(access.address)
+            operations.append(OP_CODES[access.operation])
+            sizes.append(access.size)
+            if len(addresses) >= self.COLUMN_CHUNK:
+                yield _columns(addresses, operations, sizes)
+                addresses, operations, sizes = [], [], []
+
+        if addresses:
+            yield _columns(addresses, operations, sizes)
+
     @classmethod
     @abstractmethod
     def can_parse(cls, file_path: Path) -> bool:
@@ -59,3 +116,60 @@ class BaseParser(ABC):
     def format_name(cls) -> str:
         """Return the name of this format."""
         pass
+
+
+class RangeParser(BaseParser):
+    """Base class for line-oriented formats that can be parsed by byte range.
+
+    Any newline-aligned byte range of the file (after `data_offset`) can be
+    parsed independently, which is what parallel parsing relies on.
+    """
+
+    def data_offset(self, file_path: Path) -> int:
+        """Return the byte offset of the first record (after any header).
+
+        Args:
+            file_path: Path to the trace file
+
+        Returns:
+            Byte offset where range parsing may start
+        """
+        return 0
+
+    @abstractmethod
+    def parse_range(
+        self,
+        file_path: Path,
+        start: int = 0,
+        end: Optional[int] = None,
+        first_line: int = 1
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parse a newline-aligned byte range of a line-oriented trace file.
+
+        Args:
+            file_path: Path to the trace file
+            start: Byte offset of the first line in the range
+            end: Byte offset just past the last line (None = end of file)
+            first_line: Line number of the first line, for error messages
+
+        Returns:
+            Tuple of (addresses, operations, sizes) column arrays
+
+        Raises:
+            ValueError: If the file format is invalid
+            FileNotFoundError: If the file doesn't exist
+        """
+        pass
+
+
+def _columns(
+    addresses: list[int],
+    operations: list[int],
+    sizes: list[int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert lists of access fields to column arrays."""
+    return (
+        np.array(addresses, dtype=ADDRESS_DTYPE),
+        np.array(operations, dtype=OPERATION_DTYPE),
+        np.array(sizes, dtype=SIZE_DTYPE),
+    )
@@ -0,0 +1,329 @@
+"""Parser for MemGraph binary trace format (native v2)."""
+
+import struct
+from pathlib import Path
+from typing import IO, Iterator
+
+import numpy as np  # type: ignore
+
+from memgraph.trace.compression import READ_ERRORS, detect_compression, open_trace
+from memgraph.trace.models import (
+    AccessView,
+    MemoryAccess,
+    Trace,
+    TraceMetadata,
+    count_unique,
+)
+from memgraph.trace.formats.base import BaseParser
+
+
+class BinaryParser(BaseParser):
+    """Parser for the fixed-width binary MemGraph trace format (v2).
+
+    Layout (little-endian):
+        Header (64 bytes):
+            magic           8s   b"MGTRACE2"
+            version         u32  2
+            record_size     u32  24
+            count           u64  number of records
+            read_count      u64
+            write_count     u64
+            unique_addrs    u64  exact count of distinct addresses
+            min_address     u64
+            max_address     u64
+        Records (24 bytes each):
+            address         u64
+            timestamp       u64
+            size            u32
+            op              u8   0 = read, 1 = write
+            (padding)       3 bytes
+
+    Records are memory-mapped rather than read, so opening a trace is O(1)
+    regardless of its size: metadata comes from the header and the trace
+    columns are views into the mapped file. Compressed files can't be
+    mapped; their records are decompressed into memory (or streamed by
+    `parse_iter`) instead.
+    """
+
+    MAGIC = b"MGTRACE2"
+    VERSION = 2
+
+    HEADER = struct.Struct("<8sII6Q")
+    RECORD_DTYPE = np.dtype([
+        ("address", "<u8"),
+        ("timestamp", "<u8"),
+        ("size", "<u4"),
+        ("op", "u1"),
+        ("pad", "V3"),
+    ])
+
+    # Records encoded per write() call, to bound writer memory
+    WRITE_CHUNK = 1 << 20
+
+    # Records decoded at a time when streaming a compressed file
+    READ_CHUNK = 1 << 16
+
+    @classmethod
+    def format_name(cls) -> str:
+        """Return the name of this format."""
+        return "binary"
+
+    @classmethod
+    def can_parse(cls, file_path: Path) -> bool:
+        """Check if this file is in binary format.
+
+        Args:
+            file_path: Path to the trace file
+
+        Returns:
+            True if the file starts with the binary format magic bytes
+        """
+        if not file_path.exists():
+            return False
+
+        try:
+            with open_trace(file_path, "rb") as f:
+                return bool(f.read(len(cls.MAGIC)) == cls.MAGIC)
+        except READ_ERRORS:
+            return False
+
+    def _read_header(
+        self,
+        f: IO[bytes],
+        file_path: Path,
+        check_size: bool = True
+    ) -> tuple[int, TraceMetadata]:
+        """Read and validate the file header.
+
+        Args:
+            f: File object positioned at the start of the trace
+            file_path: Path to the trace file
+            check_size: Check the file size against the record count (only
+                possible for uncompressed files)
+
+        Returns:
+            Tuple of (record_count, metadata)
+
+        Raises:
+            ValueError: If the header is invalid or the file is truncated
+        """
+        raw = f.read(self.HEADER.size)
+
+        if len(raw) < self.HEADER.size:
+            raise ValueError(f"Invalid binary trace: header truncated in {file_path}")
+
+        (magic, version, record_size, count, read_count, write_count,
+         unique, min_addr, max_addr) = self.HEADER.unpack(raw)
+
+        if magic != self.MAGIC:
+            raise ValueError(
+                f"Invalid binary format: expected magic {self.MAGIC!r}, got {magic!r}"
+            )
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported binary trace version: {version}")
+        if record_size != self.RECORD_DTYPE.itemsize:
+            raise ValueError(
+                f"Unsupported record size: {record_size} "
+                f"(expected {self.RECORD_DTYPE.itemsize})"
+            )
+
+        if check_size:
+            expected_size = self.HEADER.size + count * record_size
+            actual_size = file_path.stat().st_size
+            if actual_size < expected_size:
+                raise ValueError(
+                    f"Binary trace truncated: expected {expected_size} bytes, "
+                    f"got {actual_size}"
+                )
+
+        metadata = TraceMetadata(
+            source=file_path,
+            format=self.format_name(),
+            total_accesses=count,
+            unique_addresses=unique,
+            read_count=read_count,
+            write_count=write_count,
+            address_range=(min_addr, max_addr),
+        )
+        return count, metadata
+
+    def _map_records(self, file_path: Path, count: int) -> np.ndarray:
+        """Memory-map the record section of a binary trace."""
+        if count == 0:
+            return np.empty(0, dtype=self.RECORD_DTYPE)
+        return np.memmap(
+            file_path,
+            dtype=self.RECORD_DTYPE,
+            mode="r",
+            offset=self.HEADER.size,
+            shape=(count,),
+        )
+
+    def _stream_records(
+        self,
+        f: IO[bytes],
+        count: int,
+        chunk: int
+    ) -> Iterator[np.ndarray]:
+        """Read records from a (decompressing) stream, `chunk` records at a time.
+
+        Raises:
+            ValueError: If the stream ends before `count` records
+        """
+        record_size = self.RECORD_DTYPE.itemsize
+        done = 0
+        while done < count:
+            n = min(chunk, count - done)
+            data = f.read(n * record_size)
+            if len(data) < n * record_size:
+                raise ValueError(
+                    f"Binary trace truncated: expected {count} records, "
+                    f"got {done + len(data) // record_size}"
+                )
+            yield np.frombuffer(data, dtype=self.RECORD_DTYPE)
+            done += n
+
+    def parse(self, file_path: Path) -> Trace:
+        """Open a binary trace file as a memory-mapped Trace.
+
+        Args:
+            file_path: Path to the trace file
+
+        Returns:
+            Trace whose columns are views into the mapped file (or into
+            memory, for compressed files)
+
+        Raises:
+            ValueError: If the file format is invalid
+            FileNotFoundError: If the file doesn't exist
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Trace file not found: {file_path}")
+
+        if detect_compression(file_path) is None:
+            with open(file_path, "rb") as f:
+                count, metadata = self._read_header(f, file_path)
+            records = self._map_records(file_path, count)
+        else:
+            with open_trace(file_path, "rb") as f:
+                count, metadata = self._read_header(f, file_path, check_size=False)
+                records = np.empty(count, dtype=self.RECORD_DTYPE)
+                done = 0
+                for chunk in self._stream_records(f, count, self.WRITE_CHUNK):
+                    records[done:done + len(chunk)] = chunk
+                    done += len(chunk)
+
+        return Trace(
+            metadata=metadata,
+            addresses=records["address"],
+            operations=records["op"],
+            sizes=records["size"],
+            timestamps=records["timestamp"],
+        )
+
+    def parse_iter(self, file_path: Path) -> Iterator[MemoryAccess]:
+        """Parse a binary trace file lazily.
+
+        Args:
+            file_path: Path to the trace file
+
+        Yields:
+            MemoryAccess objects
+
+        Raises:
+            ValueError: If the file format is invalid
+            FileNotFoundError: If the file doesn't exist
+        """
+        if detect_compression(file_path) is None:
+            yield from self.parse(file_path).accesses
+            return
+
+        with open_trace(file_path, "rb") as f:
+            count, _ = self._read_header(f, file_path, check_size=False)
+            offset = 0
+            for records in self._stream_records(f, count, self.READ_CHUNK):
+                yield from AccessView(
+                    records["address"],
+                    records["op"],
+                    records["size"],
+                    records["timestamp"],
+                    offset,
+                )
+                offset += len(records)
+
+    def iter_columns(
+        self,
+        file_path: Path
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Parse a binary trace file lazily as a stream of column chunks.
+
+        Args:
+            file_path: Path to the trace file
+
+        Yields:
+            Tuples of (addresses, operations, sizes) column arrays
+
+        Raises:
+            ValueError: If the file format is invalid
+            FileNotFoundError: If the file doesn't exist
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Trace file not found: {file_path}")
+
+        if detect_compression(file_path) is None:
+            trace = self.parse(file_path)
+            for start in range(0, len(trace), self.READ_CHUNK):
+                end = start + self.READ_CHUNK
+                yield (
+                    trace.addresses[start:end],
+                    trace.operations[start:end],
+                    trace.sizes[start:end],
+                )
+            return
+
+        with open_trace(file_path, "rb") as f:
+            count, _ = self._read_header(f, file_path, check_size=False)
+            for records in self._stream_records(f, count, self.READ_CHUNK):
+                yield records["address"], records["op"], records["size"]
+
+    def write(self, trace: Trace, file_path: Path) -> None:
+        """Write a trace to a file in binary format.
+
+        The header has no room for an error bound, so a HyperLogLog
+        estimate of the unique address count is replaced by an exact
+        count before writing; files never present an estimate as exact.
+
+        Args:
+            trace: Trace object to write
+            file_path: Path to write to
+        """
+        meta = trace.metadata
+        n = len(trace)
+        unique = meta.unique_addresses
+        if not meta.unique_addresses_exact:
+            unique = count_unique(trace.addresses)
+
+        with open(file_path, "wb") as f:
+            f.write(self.HEADER.pack(
+                self.MAGIC,
+                self.VERSION,
+                self.RECORD_DTYPE.itemsize,
+                n,
+                meta.read_count,
+                meta.write_count,
+                unique,
+                meta.address_range[0],
+                meta.address_range[1],
+            ))
+
+            for start in range(0, n, self.WRITE_CHUNK):
+                end = min(start + self.WRITE_CHUNK, n)
+                records = np.zeros(end - start, dtype=self.RECORD_DTYPE)
+                records["address"] = trace.addresses[start:end]
+                records["size"] = trace.sizes[start:end]
+                records["op"] = trace.operations[start:end]
+                if trace.timestamps is not None:
+                    records["timestamp"] = trace.timestamps[start:end]
+                else:
+                    records["timestamp"] = np.arange(start, end, dtype=np.uint64)
+                f.write(records.tobytes())
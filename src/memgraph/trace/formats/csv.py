@@ -1,13 +1,25 @@
 """Parser for simple CSV trace format."""
 
 import csv
+import io
 from pathlib import Path
-from typing import Iterator
-from memgraph.trace.models import MemoryAccess, Trace
-from memgraph.trace.formats.base import BaseParser
+from typing import Iterator, Optional, Sequence
 
+import numpy as np  # type: ignore
 
-class CSVParser(BaseParser):
+from memgraph.trace.models import (
+    MemoryAccess,
+    Trace,
+    OP_CODES,
+    ADDRESS_DTYPE,
+    OPERATION_DTYPE,
+    SIZE_DTYPE,
+)
+from memgraph.trace.compression import READ_ERRORS, open_trace
+from memgraph.trace.formats.base import RangeParser
+
+
+class CSVParser(RangeParser):
     """Parser for simple CSV trace format.
 
     Format:
@@ -16,6 +28,8 @@ class CSVParser(BaseParser):
         W,0x7fff5a8b1008,4
     """
 
+    REQUIRED_HEADERS = {"op", "address", "size"}
+
     @classmethod
     def format_name(cls) -> str:
         """Return the name of this format."""
@@ -35,7 +49,7 @@ class CSVParser(BaseParser):
             return False
 
         try:
-            with open(file_path, "r") as f:
+            with open_trace(file_path, "r") as f:
                 # Try to parse as CSV
                 reader = csv.DictReader(f)
                 first_row = next(reader, None)
@@ -43,12 +57,63 @@ class CSVParser(BaseParser):
                     return False
 
                 # Check for expected headers
-                required_headers = {"op", "address", "size"}
-                return required_headers.issubset(set(first_row.keys()))
+                return cls.REQUIRED_HEADERS.issubset(first_row.keys())
 
-        except (IOError, UnicodeDecodeError, csv.Error):
+        except READ_ERRORS + (csv.Error,):
             return False
 
+    @staticmethod
+    def _parse_row(row: dict, row_num: int) -> tuple[str, int, int]:
+        """Parse one CSV row.
+
+        Args:
+            row: Row mapping from csv.DictReader
+            row_num: Row number, for error messages
+
+        Returns:
+            Tuple of (op, address, size)
+
+        Raises:
+            ValueError: If the row is malformed
+        """
+        try:
+            op = row["op"].strip().upper()
+            if op not in ("R", "W"):
+                raise ValueError(f"Invalid operation: {op}")
+
+            # Parse address (handle hex with or without 0x prefix)
+            addr_str = row["address"].strip()
+            if addr_str.startswith("0x") or addr_str.startswith("0X"):
+                address = int(addr_str, 16)
+            else:
+                # Try as hex, fall back to decimal
+                try:
+                    address = int(addr_str, 16)
+                except ValueError:
+                    address = int(addr_str, 10)
+
+            size = int(row["size"])
+
+            return op, address, size
+
+        except (ValueError, KeyError) as e:
+            raise ValueError(f"Error parsing CSV row {row_num}: {row} - {e}")
+
+    def _check_headers(self, fieldnames: Optional[Sequence[str]]) -> None:
+        """Validate the CSV header row.
+
+        Raises:
+            ValueError: If the header is missing or lacks required columns
+        """
+        if not fieldnames:
+            raise ValueError("CSV file is empty")
+
+        if not self.REQUIRED_HEADERS.issubset(set(fieldnames)):
+            raise ValueError(
+                f"CSV file missing required headers. "
+                f"Expected: {self.REQUIRED_HEADERS}, Got: {fieldnames}"
+            )
+
     def parse_iter(self, file_path: Path) -> Iterator[MemoryAccess]:
         """Parse a CSV trace file lazily.
 
@@ -67,44 +132,85 @@ class CSVParser(BaseParser):
 
         timestamp = 0
 
-        with open(file_path, "r") as f:
+        with open_trace(file_path, "r") as f:
             reader = csv.DictReader(f)
 
             # Validate headers
-            if not reader.fieldnames:
-                raise ValueError("CSV file is empty")
-
-            required_headers = {"op", "address", "size"}
-            if not required_headers.issubset(set(reader.fieldnames)):
-                raise ValueError(
-                    f"CSV file missing required headers. "
-                    f"Expected: {required_headers}, Got: {reader.fieldnames}"
-                )
+            self._check_headers(reader.fieldnames)
 
             for row_num, row in enumerate(reader, 2):  # 2 because of header
-                try:
-                    op = row["op"].strip().upper()
-                    if op not in ("R", "W"):
-                        raise ValueError(f"Invalid operation: {op}")
+                op, address, size = self._parse_row(row, row_num)
+                yield MemoryAccess(op, address, size, timestamp)  # type: ignore
+                timestamp += 1
+
+    def _read_header(self, file_path: Path) -> tuple[list[str], int]:
+        """Read the header row.
+
+        Returns:
+            Tuple of (fieldnames, byte offset of the first data row)
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Trace file not found: {file_path}")
+
+        with open_trace(file_path, "rb") as f:
+            header = f.readline()
 
-                    # Parse address (handle hex with or without 0x prefix)
-                    addr_str = row["address"].strip()
-                    if addr_str.startswith("0x") or addr_str.startswith("0X"):
-                        address = int(addr_str, 16)
-                    else:
-                        # Try as hex, fall back to decimal
-                        try:
-                            address = int(addr_str, 16)
-                        except ValueError:
-                            address = int(addr_str, 10)
+        fieldnames = next(csv.reader([header.decode("utf-8")]), [])
+        self._check_headers(fieldnames)
+        return fieldnames, len(header)
 
-                    size = int(row["size"])
+    def data_offset(self, file_path: Path) -> int:
+        """Return the byte offset of the first data row (after the header)."""
+        return self._read_header(file_path)[1]
 
-                    yield MemoryAccess(op, address, size, timestamp)  # type: ignore
-                    timestamp += 1
+    def parse_range(
+        self,
+        file_path: Path,
+        start: int = 0,
+        end: Optional[int] = None,
+        first_line: int = 1
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parse a newline-aligned byte range of a CSV trace file.
 
-                except (ValueError, KeyError) as e:
-                    raise ValueError(f"Error parsing CSV row {row_num}: {row} - {e}")
+        Args:
+            file_path: Path to the trace file
+            start: Byte offset of the first row in the range. Offsets inside
+                the header are moved to the first data row.
+            end: Byte offset just past the last row (None = end of file)
+            first_line: Row number of the first row, for error messages
+
+        Returns:
+            Tuple of (addresses, operations, sizes) column arrays
+
+        Raises:
+            ValueError: If the file format is invalid
+            FileNotFoundError: If the file doesn't exist
+        """
+        fieldnames, header_end = self._read_header(file_path)
+        if start < header_end:
+            start = header_end
+            first_line = max(first_line, 2)
+
+        with open_trace(file_path, "rb") as f:
+            f.seek(start)
+            data = f.read() if end is None else f.read(max(end - start, 0))
+
+        reader = csv.DictReader(io.StringIO(data.decode("utf-8")), fieldnames=fieldnames)
+
+        addresses: list[int] = []
+        operations: list[int] = []
+        sizes: list[int] = []
+        for row_num, row in enumerate(reader, first_line):
+            op, address, size = self._parse_row(row, row_num)
+            addresses.append(address)
+            operations.append(OP_CODES[op])
+            sizes.append(size)
+
+        return (
+            np.array(addresses, dtype=ADDRESS_DTYPE),
+            np.array(operations, dtype=OPERATION_DTYPE),
+            np.array(sizes, dtype=SIZE_DTYPE),
+        )
 
     def parse(self, file_path: Path) -> Trace:
         """Parse a CSV trace file.
@@ -119,5 +225,12 @@ class CSVParser(BaseParser):
             ValueError: If the file format is invalid
             FileNotFoundError: If the file doesn't exist
         """
-        accesses = list(self.parse_iter(file_path))
-        return Trace.from_accesses(accesses, file_path, self.format_name())
+        addresses, operations, sizes = self.parse_range(file_path)
+        return Trace.from_arrays(
+            addresses,
+            operations,
+            sizes,
+            file_path,
+            self.format_name(),
+            cardinality=self.cardinality,
+        )
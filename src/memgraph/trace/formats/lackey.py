@@ -1,12 +1,51 @@
 """Parser for Valgrind Lackey trace format."""
 
 from pathlib import Path
-from typing import Iterator
-from memgraph.trace.models import MemoryAccess, Trace
-from memgraph.trace.formats.base import BaseParser
+from typing import Iterator, Optional
 
+import numpy as np  # type: ignore
 
-class LackeyParser(BaseParser):
+from memgraph.trace.models import (
+    MemoryAccess,
+    Trace,
+    OP_READ,
+    OP_WRITE,
+    ADDRESS_DTYPE,
+    OPERATION_DTYPE,
+    SIZE_DTYPE,
+    concatenate_columns,
+)
+from memgraph.trace.compression import READ_ERRORS, open_trace
+from memgraph.trace.formats.base import RangeParser
+
+
+# Per-line operation codes used by the bulk decoder
+_LINE_SKIP = 0
+_LINE_LOAD = 1
+_LINE_STORE = 2
+_LINE_MODIFY = 3
+
+# Accesses produced by each line code (M expands to a read and a write)
+_LINE_ACCESS_COUNT = np.array([0, 1, 1, 2], dtype=np.int64)
+_LINE_FIRST_OP = np.array([0, OP_READ, OP_WRITE, OP_READ], dtype=OPERATION_DTYPE)
+
+# Largest values the address and size columns can hold
+_MAX_ADDRESS = int(np.iinfo(ADDRESS_DTYPE).max)
+_MAX_SIZE = int(np.iinfo(SIZE_DTYPE).max)
+_LINE_CODES = {"L": _LINE_LOAD, "S": _LINE_STORE, "M": _LINE_MODIFY}
+
+# Byte -> hex digit value lookup table (255 = not a hex digit)
+_HEX_VALUES = np.full(256, 255, dtype=np.uint8)
+for _digit, _char in enumerate(b"0123456789abcdef"):
+    _HEX_VALUES[_char] = _digit
+for _digit, _char in enumerate(b"ABCDEF", start=10):
+    _HEX_VALUES[_char] = _digit
+
+_MAX_HEX_DIGITS = 16   # 64-bit address
+_MAX_SIZE_DIGITS = 9   # always fits in uint32
+
+
+class LackeyParser(RangeParser):
     """Parser for Valgrind Lackey trace format.
 
     Format:
@@ -16,6 +55,9 @@ class LackeyParser(BaseParser):
          M 7ff000390,8   - Modify (read + write)
     """
 
+    # Bytes read per chunk by the bulk (columnar) parser
+    CHUNK_SIZE = 4 << 20
+
     @classmethod
     def format_name(cls) -> str:
         """Return the name of this format."""
@@ -35,7 +77,7 @@ class LackeyParser(BaseParser):
             return False
 
         try:
-            with open(file_path, "r") as f:
+            with open_trace(file_path, "r") as f:
                 for line in f:
                     line = line.strip()
                     if not line:
@@ -49,11 +91,66 @@ class LackeyParser(BaseParser):
                                 return True
                     # Only check first few non-empty lines
                     break
-        except (IOError, UnicodeDecodeError):
+        except READ_ERRORS:
             return False
 
         return False
 
+    @staticmethod
+    def _parse_line(line: str, line_num: int) -> Optional[tuple[str, int, int]]:
+        """Parse one Lackey line.
+
+        Args:
+            line: Raw line text
+            line_num: 1-based line number, for error messages
+
+        Returns:
+            Tuple of (op, address, size), or None for lines that carry no
+            data access (blank lines, instruction fetches, other output).
+            `op` is returned as written and may be something other than
+            L/S/M, in which case the line produces no accesses.
+
+        Raises:
+            ValueError: If a data line is malformed, or its address or size
+                doesn't fit the trace columns
+        """
+        line = line.strip()
+
+        # Skip empty lines
+        if not line:
+            return None
+
+        # Skip instruction fetches (I)
+        if line.startswith("I"):
+            return None
+
+        # Parse the line
+        try:
+            parts = line.strip().split()
+            if len(parts) != 2:
+                return None
+
+            op = parts[0]
+            addr_size = parts[1]
+
+            # Parse address and size
+            if "," not in addr_size:
+                raise ValueError(f"Invalid format at line {line_num}: {line}")
+
+            addr_str, size_str = addr_size.split(",", 1)
+
+            # Convert address (hex) and size (decimal)
+            address = int(addr_str, 16)
+            size = int(size_str)
+            if not 0 <= address <= _MAX_ADDRESS:
+                raise ValueError(f"address {addr_str} does not fit in 64 bits")
+            if not 0 <= size <= _MAX_SIZE:
+                raise ValueError(f"size {size_str} out of range")
+            return op, address, size
+
+        except ValueError as e:
+            raise ValueError(f"Error parsing line {line_num}: {line} - {e}")
+
     def parse_iter(self, file_path: Path) -> Iterator[MemoryAccess]:
         """Parse a Lackey trace file lazily.
 
@@ -72,55 +169,128 @@ class LackeyParser(BaseParser):
 
         timestamp = 0
 
-        with open(file_path, "r") as f:
+        with open_trace(file_path, "r") as f:
             for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip empty lines
-                if not line:
+                parsed = self._parse_line(line, line_num)
+                if parsed is None:
                     continue
 
-                # Skip instruction fetches (I)
-                if line.startswith("I"):
+                op, address, size = parsed
+
+                # Handle different operation types
+                if op == "L":
+                    # Load (read)
+                    yield MemoryAccess("R", address, size, timestamp)
+                    timestamp += 1
+                elif op == "S":
+                    # Store (write)
+                    yield MemoryAccess("W", address, size, timestamp)
+                    timestamp += 1
+                elif op == "M":
+                    # Modify (read then write)
+                    yield MemoryAccess("R", address, size, timestamp)
+                    timestamp += 1
+                    yield MemoryAccess("W", address, size, timestamp)
+                    timestamp += 1
+
+    def parse_chunks(
+        self,
+        file_path: Path,
+        chunk_size: Optional[int] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+        first_line: int = 1
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Parse a Lackey trace file in bulk, one byte chunk at a time.
+
+        The file is read in large binary chunks cut at line boundaries, and
+        each chunk is decoded with vectorized NumPy operations. Lines that
+        don't match the canonical Lackey layout (``" L 7ff000398,8"``) fall
+        back to the line-by-line parser, so the results are identical to
+        `parse_iter`.
+
+        Args:
+            file_path: Path to the trace file
+            chunk_size: Bytes per chunk (default: CHUNK_SIZE)
+            start: Byte offset to start at (must be the start of a line)
+            end: Byte offset to stop at (None = end of file)
+            first_line: Line number of the line at `start`
+
+        Yields:
+            Tuples of (addresses, operations, sizes) column arrays
+
+        Raises:
+            ValueError: If the file format is invalid
+            FileNotFoundError: If the file doesn't exist
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Trace file not found: {file_path}")
+
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        line_num = first_line
+        pending = b""
+        remaining = -1 if end is None else end - start
+
+        with open_trace(file_path, "rb") as f:
+            f.seek(start)
+            while remaining != 0:
+                to_read = chunk_size if remaining < 0 else min(chunk_size, remaining)
+                data = f.read(to_read)
+                if not data:
+                    break
+                if remaining > 0:
+                    remaining -= len(data)
+
+                data = pending + data
+                cut = data.rfind(b"\n") + 1
+                if cut == 0:
+                    # No complete line yet
+                    pending = data
                     continue
 
-                # Parse the line
-                try:
-                    parts = line.strip().split()
-                    if len(parts) != 2:
-                        continue
+                pending = data[cut:]
+                block = data[:cut]
+                yield self._decode_block(block, line_num)
+                line_num += block.count(b"\n")
+
+        if pending:
+            yield self._decode_block(pending + b"\n", line_num)
+
+    def iter_columns(
+        self,
+        file_path: Path
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Parse a Lackey trace file lazily as a stream of column chunks.
 
-                    op = parts[0]
-                    addr_size = parts[1]
-
-                    # Parse address and size
-                    if "," not in addr_size:
-                        raise ValueError(f"Invalid format at line {line_num}: {line}")
-
-                    addr_str, size_str = addr_size.split(",", 1)
-
-                    # Convert address (hex) and size (decimal)
-                    address = int(addr_str, 16)
-                    size = int(size_str)
-
-                    # Handle different operation types
-                    if op == "L":
-                        # Load (read)
-                        yield MemoryAccess("R", address, size, timestamp)
-                        timestamp += 1
-                    elif op == "S":
-                        # Store (write)
-                        yield MemoryAccess("W", address, size, timestamp)
-                        timestamp += 1
-                    elif op == "M":
-                        # Modify (read then write)
-                        yield MemoryAccess("R", address, size, timestamp)
-                        timestamp += 1
-                        yield MemoryAccess("W", address, size, timestamp)
-                        timestamp += 1
-
-                except ValueError as e:
-                    raise ValueError(f"Error parsing line {line_num}: {line} - {e}")
+        Args:
+            file_path: Path to the trace file
+
+        Yields:
+            Tuples of (addresses, operations, sizes) column arrays
+        """
+        return self.parse_chunks(file_path)
+
+    def parse_range(
+        self,
+        file_path: Path,
+        start: int = 0,
+        end: Optional[int] = None,
+        first_line: int = 1
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Parse a newline-aligned byte range of a Lackey trace file.
+
+        Args:
+            file_path: Path to the trace file
+            start: Byte offset of the first line in the range
+            end: Byte offset just past the last line (None = end of file)
+            first_line: Line number of the first line, for error messages
+
+        Returns:
+            Tuple of (addresses, operations, sizes) column arrays
+        """
+        return concatenate_columns(list(
+            self.parse_chunks(file_path, start=start, end=end, first_line=first_line)
+        ))
 
     def parse(self, file_path: Path) -> Trace:
         """Parse a Lackey trace file.
@@ -135,5 +305,142 @@ class LackeyParser(BaseParser):
             ValueError: If the file format is invalid
             FileNotFoundError: If the file doesn't exist
         """
-        accesses = list(self.parse_iter(file_path))
-        return Trace.from_accesses(accesses, file_path, self.format_name())
+        addresses, operations, sizes = self.parse_range(file_path)
+        return Trace.from_arrays(
+            addresses,
+            operations,
+            sizes,
+            file_path,
+            self.format_name(),
+            cardinality=self.cardinality,
+        )
+
+    def _decode_block(
+        self,
+        block: bytes,
+        first_line: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Decode a block of complete lines into column arrays.
+
+        Args:
+            block: Bytes ending with a newline
+            first_line: Line number of the first line in the block
+
+        Returns:
+            Tuple of (addresses, operations, sizes)
+        """
+        buf = np.frombuffer(block, dtype=np.uint8)
+        ends = np.flatnonzero(buf == ord("\n"))
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+        n_lines = len(ends)
+
+        line_code = np.zeros(n_lines, dtype=np.uint8)
+        line_addr = np.zeros(n_lines, dtype=ADDRESS_DTYPE)
+        line_size = np.zeros(n_lines, dtype=SIZE_DTYPE)
+
+        # Instruction fetches (I) and blank lines produce nothing.
+        # Everything else must be " X hex,dec" to take the fast path.
+        lengths = ends - starts
+        first = buf[starts]
+        skip = (lengths == 0) | (first == ord("I"))
+        candidate = ~skip & (lengths >= 6)
+
+        fast = np.zeros(n_lines, dtype=bool)
+        idx = np.flatnonzero(candidate)
+        if len(idx):
+            fast[idx] = self._decode_fast(
+                buf, starts[idx], ends[idx], idx, line_code, line_addr, line_size
+            )
+
+        # Fall back to the line parser for anything irregular
+        for i in np.flatnonzero(~skip & ~fast).tolist():
+            line = block[starts[i]:ends[i]].decode("utf-8", errors="replace")
+            parsed = self._parse_line(line, first_line + i)
+            if parsed is None or parsed[0] not in _LINE_CODES:
+                continue
+            op, address, size = parsed
+            line_code[i] = _LINE_CODES[op]
+            line_addr[i] = address
+            line_size[i] = size
+
+        # Expand lines into accesses (M becomes a read followed by a write)
+        counts = _LINE_ACCESS_COUNT[line_code]
+        line_of_access = np.repeat(np.arange(n_lines), counts)
+
+        addresses = line_addr[line_of_access]
+        sizes = line_size[line_of_access]
+        operations = _LINE_FIRST_OP[line_code][line_of_access]
+
+        modify_starts = (np.cumsum(counts) - counts)[line_code == _LINE_MODIFY]
+        operations[modify_starts + 1] = OP_WRITE
+
+        return addresses, operations, sizes
+
+    @staticmethod
+    def _decode_fast(
+        buf: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        lines: np.ndarray,
+        line_code: np.ndarray,
+        line_addr: np.ndarray,
+        line_size: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized decode of canonical Lackey data lines.
+
+        Fills `line_code`, `line_addr` and `line_size` at `lines` for every
+        line that matches `` X hex,dec`` exactly.
+
+        Returns:
+            Boolean mask over `lines` of the lines that were decoded
+        """
+        op_char = buf[starts + 1]
+        ok = (buf[starts] == ord(" ")) & (buf[starts + 2] == ord(" "))
+        code = np.zeros(len(starts), dtype=np.uint8)
+        code[op_char == ord("L")] = _LINE_LOAD
+        code[op_char == ord("S")] = _LINE_STORE
+        code[op_char == ord("M")] = _LINE_MODIFY
+        ok &= code != _LINE_SKIP
+
+        # Exactly one comma per line
+        commas = np.flatnonzero(buf == ord(","))
+        first_comma = np.searchsorted(commas, starts)
+        ok &= np.searchsorted(commas, ends) - first_comma == 1
+        comma = commas[np.minimum(first_comma, len(commas) - 1)] if len(commas) else starts
+
+        addr_start = starts + 3
+        addr_len = comma - addr_start
+        size_len = ends - comma - 1
+        ok &= (addr_len >= 1) & (addr_len <= _MAX_HEX_DIGITS)
+        ok &= (size_len >= 1) & (size_len <= _MAX_SIZE_DIGITS)
+
+        # Hex address, right-aligned on the comma. Positions left of the
+        # field contribute a zero digit and no shift.
+        address = np.zeros(len(starts), dtype=np.uint64)
+        for j in range(_MAX_HEX_DIGITS, 0, -1):
+            pos = comma - j
+            present = pos >= addr_start
+            digit = _HEX_VALUES[buf[np.maximum(pos, 0)]]
+            ok &= ~present | (digit != 255)
+            digit[~present] = 0
+            shift = present.astype(np.uint64) << np.uint64(2)
+            address = (address << shift) | digit
+
+        # Decimal size, right-aligned on the line end
+        size = np.zeros(len(starts), dtype=np.uint64)
+        for j in range(_MAX_SIZE_DIGITS, 0, -1):
+            pos = ends - j
+            present = pos > comma
+            digit = buf[np.maximum(pos, 0)] - np.uint8(ord("0"))
+            ok &= ~present | (digit <= 9)
+            digit[~present] = 0
+            scale = np.where(present, np.uint64(10), np.uint64(1))
+            size = size * scale + digit
+
+        decoded = lines[ok]
+        line_code[decoded] = code[ok]
+        line_addr[decoded] = address[ok]
+        line_size[decoded] = size[ok]
+        return ok  # type: ignore[no-any-return]
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Iterator
 from memgraph.trace.models import MemoryAccess, Trace
+from memgraph.trace.compression import READ_ERRORS, open_trace
 from memgraph.trace.formats.base import BaseParser
 
 
@@ -38,10 +39,10 @@ class NativeParser(BaseParser):
             return False
 
         try:
-            with open(file_path, "r") as f:
+            with open_trace(file_path, "r") as f:
                 first_line = f.readline().strip()
-                return first_line == cls.HEADER
-        except (IOError, UnicodeDecodeError):
+                return bool(first_line == cls.HEADER)
+        except READ_ERRORS:
             return False
 
     def parse_iter(self, file_path: Path) -> Iterator[MemoryAccess]:
@@ -60,7 +61,7 @@ class NativeParser(BaseParser):
         if not file_path.exists():
             raise FileNotFoundError(f"Trace file not found: {file_path}")
 
-        with open(file_path, "r") as f:
+        with open_trace(file_path, "r") as f:
             first_line = f.readline().strip()
             if first_line != self.HEADER:
                 raise ValueError(
@@ -124,7 +125,9 @@ class NativeParser(BaseParser):
             FileNotFoundError: If the file doesn't exist
         """
         accesses = list(self.parse_iter(file_path))
-        return Trace.from_accesses(accesses, file_path, self.format_name())
+        return Trace.from_accesses(
+            accesses, file_path, self.format_name(), cardinality=self.cardinality
+        )
 
     def write(self, trace: Trace, file_path: Path) -> None:
         """Write a trace to a file in native format.
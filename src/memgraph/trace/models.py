@@ -1,13 +1,39 @@
 """Data models for memory traces."""
 
 from dataclasses import dataclass
-from typing import Literal, Iterator
+from typing import Literal, Iterator, Optional, Sequence, Union, overload
 from pathlib import Path
 
+import numpy as np  # type: ignore
 
-@dataclass
+from memgraph.trace.cardinality import CardinalityConfig, HyperLogLog
+
+
+# Operation codes used by the columnar trace representation
+OP_READ = 0
+OP_WRITE = 1
+
+OP_NAMES: tuple[Literal["R"], Literal["W"]] = ("R", "W")
+OP_CODES: dict[str, int] = {"R": OP_READ, "W": OP_WRITE}
+
+# Column dtypes for the struct-of-arrays layout
+ADDRESS_DTYPE = np.uint64
+OPERATION_DTYPE = np.uint8
+SIZE_DTYPE = np.uint32
+TIMESTAMP_DTYPE = np.uint64
+
+# Number of accesses converted to Python objects at a time when iterating
+_ITER_CHUNK = 65536
+
+
+@dataclass(slots=True)
 class MemoryAccess:
-    """Single memory access event."""
+    """Single memory access event.
+
+    Slotted (no per-instance ``__dict__``): an access object takes 64 bytes
+    instead of 104 and is ~15% cheaper to construct, which matters when
+    parsers, generators and trace views create millions of them.
+    """
 
     operation: Literal["R", "W"]  # Read or Write
     address: int                   # Memory address
@@ -26,14 +52,175 @@ class TraceMetadata:
     read_count: int
     write_count: int
     address_range: tuple[int, int]  # min, max addresses
+    # Relative standard error of unique_addresses: 0.0 when counted exactly,
+    # otherwise the error of the HyperLogLog estimate
+    unique_addresses_error: float = 0.0
+
+    @property
+    def unique_addresses_exact(self) -> bool:
+        """True if unique_addresses is an exact count rather than an estimate."""
+        return self.unique_addresses_error == 0.0
+
+
+class AccessView(Sequence[MemoryAccess]):
+    """Read-only sequence of MemoryAccess objects over a columnar Trace.
+
+    Objects are created on demand, so indexing and iterating behave like the
+    old ``list[MemoryAccess]`` without ever holding the full list in memory.
+    Slicing returns another view over the same (unsliced) arrays.
+    """
+
+    def __init__(
+        self,
+        addresses: np.ndarray,
+        operations: np.ndarray,
+        sizes: np.ndarray,
+        timestamps: np.ndarray | None,
+        offset: int = 0
+    ):
+        self._addresses = addresses
+        self._operations = operations
+        self._sizes = sizes
+        self._timestamps = timestamps
+        self._offset = offset
+
+    @property
+    def addresses(self) -> np.ndarray:
+        """Address column of the view (a view of the trace's array)."""
+        return self._addresses
+
+    @property
+    def offset(self) -> int:
+        """Position of the view's first access in the underlying trace."""
+        return self._offset
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    @overload
+    def __getitem__(self, index: int) -> MemoryAccess: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AccessView": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[MemoryAccess, "AccessView"]:
+        if isinstance(index, slice):
+            start, _, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("AccessView slices must be contiguous")
+            return AccessView(
+                self._addresses[index],
+                self._operations[index],
+                self._sizes[index],
+                self._timestamps[index] if self._timestamps is not None else None,
+                self._offset + start,
+            )
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("access index out of range")
+
+        if self._timestamps is not None:
+            timestamp = int(self._timestamps[index])
+        else:
+            timestamp = self._offset + index
+
+        return MemoryAccess(
+            OP_NAMES[self._operations[index]],
+            int(self._addresses[index]),
+            int(self._sizes[index]),
+            timestamp,
+        )
+
+    def __iter__(self) -> Iterator[MemoryAccess]:
+        n = len(self)
+        for start in range(0, n, _ITER_CHUNK):
+            end = min(start + _ITER_CHUNK, n)
+            if self._timestamps is not None:
+                timestamps = self._timestamps[start:end].tolist()
+            else:
+                timestamps = range(self._offset + start, self._offset + end)
+
+            for op, address, size, timestamp in zip(
+                self._operations[start:end].tolist(),
+                self._addresses[start:end].tolist(),
+                self._sizes[start:end].tolist(),
+                timestamps,
+            ):
+                yield MemoryAccess(OP_NAMES[op], address, size, timestamp)
+
+    def __repr__(self) -> str:
+        return f"AccessView(len={len(self)})"
 
 
-@dataclass
 class Trace:
-    """Container for parsed trace data."""
+    """Container for parsed trace data.
+
+    Accesses are stored column-wise rather than as one object per access:
+
+    - ``addresses``: uint64 memory addresses
+    - ``operations``: uint8 operation codes (``OP_READ`` / ``OP_WRITE``)
+    - ``sizes``: uint32 access sizes in bytes
+    - ``timestamps``: uint64 timestamps, or None when they are implicit
+      (the access index), which is the case for every parsed format except
+      native traces with explicit timestamps.
+
+    ``trace.accesses`` still exposes the trace as a sequence of MemoryAccess
+    objects for code that wants the object API.
+    """
+
+    def __init__(
+        self,
+        metadata: TraceMetadata,
+        accesses: Optional[Sequence[MemoryAccess]] = None,
+        *,
+        addresses: Optional[np.ndarray] = None,
+        operations: Optional[np.ndarray] = None,
+        sizes: Optional[np.ndarray] = None,
+        timestamps: Optional[np.ndarray] = None
+    ):
+        """Initialize a trace from columns or from a list of accesses.
+
+        Args:
+            metadata: Summary statistics for the trace
+            accesses: Optional sequence of MemoryAccess objects. Mutually
+                exclusive with the column arguments.
+            addresses: uint64 address column
+            operations: uint8 operation column
+            sizes: uint32 size column
+            timestamps: Optional uint64 timestamp column (None = implicit)
+        """
+        if accesses is not None:
+            if addresses is not None or operations is not None or sizes is not None:
+                raise ValueError("Pass either accesses or column arrays, not both")
+            addresses, operations, sizes, timestamps = _columns_from_accesses(accesses)
+
+        self.metadata = metadata
+        self.addresses: np.ndarray = _as_column(addresses, ADDRESS_DTYPE)
+        self.operations: np.ndarray = _as_column(operations, OPERATION_DTYPE)
+        self.sizes: np.ndarray = _as_column(sizes, SIZE_DTYPE)
+        self.timestamps: Optional[np.ndarray] = (
+            None if timestamps is None else _as_column(timestamps, TIMESTAMP_DTYPE)
+        )
+
+        n = len(self.addresses)
+        if len(self.operations) != n or len(self.sizes) != n:
+            raise ValueError("Trace columns must all have the same length")
+        if self.timestamps is not None and len(self.timestamps) != n:
+            raise ValueError("Trace columns must all have the same length")
+
+    @property
+    def accesses(self) -> AccessView:
+        """Sequence view of the trace as MemoryAccess objects."""
+        return AccessView(self.addresses, self.operations, self.sizes, self.timestamps)
 
-    metadata: TraceMetadata
-    accesses: list[MemoryAccess]
+    def get_timestamps(self) -> np.ndarray:
+        """Return the timestamp column, materializing implicit timestamps."""
+        if self.timestamps is not None:
+            return self.timestamps
+        return np.arange(len(self.addresses), dtype=TIMESTAMP_DTYPE)
 
     def __iter__(self) -> Iterator[MemoryAccess]:
         """Iterate over memory accesses."""
@@ -41,18 +228,84 @@ class Trace:
 
     def __len__(self) -> int:
         """Return number of memory accesses."""
-        return len(self.accesses)
+        return len(self.addresses)
+
+    def __repr__(self) -> str:
+        return (
+            f"Trace(source={str(self.metadata.source)!r}, "
+            f"format={self.metadata.format!r}, accesses={len(self)})"
+        )
 
     @classmethod
     def from_accesses(
         cls,
-        accesses: list[MemoryAccess],
+        accesses: Sequence[MemoryAccess],
         source: Path,
-        format_name: str
+        format_name: str,
+        cardinality: Optional[CardinalityConfig] = None
     ) -> "Trace":
-        """Create a Trace with computed metadata from a list of accesses."""
-        if not accesses:
-            metadata = TraceMetadata(
+        """Create a Trace with computed metadata from a list of accesses.
+
+        Args:
+            accesses: Sequence of MemoryAccess objects
+            source: Path the trace was read from
+            format_name: Name of the trace format
+            cardinality: How to count unique addresses (default: exactly)
+
+        Returns:
+            Trace with metadata computed over the accesses
+        """
+        addresses, operations, sizes, timestamps = _columns_from_accesses(accesses)
+        return cls.from_arrays(
+            addresses,
+            operations,
+            sizes,
+            source,
+            format_name,
+            timestamps=timestamps,
+            cardinality=cardinality,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        addresses: np.ndarray,
+        operations: np.ndarray,
+        sizes: np.ndarray,
+        source: Path,
+        format_name: str,
+        timestamps: Optional[np.ndarray] = None,
+        metadata: Optional[TraceMetadata] = None,
+        cardinality: Optional[CardinalityConfig] = None
+    ) -> "Trace":
+        """Create a Trace with computed metadata from column arrays.
+
+        Args:
+            addresses: Address column (converted to uint64)
+            operations: Operation column of OP_READ/OP_WRITE codes
+            sizes: Access size column
+            source: Path the trace was read from
+            format_name: Name of the trace format
+            timestamps: Optional explicit timestamps (None = implicit)
+            metadata: Metadata already accumulated while parsing (e.g. with
+                a MetadataAccumulator). Computed over the columns if None.
+            cardinality: How to count unique addresses when computing
+                metadata (default: exactly)
+
+        Returns:
+            Trace with metadata computed over the columns
+        """
+        if metadata is not None:
+            return cls(
+                metadata=metadata,
+                addresses=addresses,
+                operations=operations,
+                sizes=sizes,
+                timestamps=timestamps,
+            )
+
+        trace = cls(
+            metadata=TraceMetadata(
                 source=source,
                 format=format_name,
                 total_accesses=0,
@@ -60,24 +313,303 @@ class Trace:
                 read_count=0,
                 write_count=0,
                 address_range=(0, 0)
+            ),
+            addresses=addresses,
+            operations=operations,
+            sizes=sizes,
+            timestamps=timestamps,
+        )
+        trace.metadata = _compute_metadata(
+            trace.addresses, trace.operations, source, format_name, cardinality
+        )
+        return trace
+
+
+def concatenate_columns(
+    chunks: Sequence[tuple[np.ndarray, np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Concatenate (addresses, operations, sizes) column chunks.
+
+    Args:
+        chunks: Column tuples in trace order
+
+    Returns:
+        Single (addresses, operations, sizes) tuple
+    """
+    if not chunks:
+        return (
+            np.empty(0, dtype=ADDRESS_DTYPE),
+            np.empty(0, dtype=OPERATION_DTYPE),
+            np.empty(0, dtype=SIZE_DTYPE),
+        )
+    if len(chunks) == 1:
+        return chunks[0]
+
+    return (
+        np.concatenate([c[0] for c in chunks]),
+        np.concatenate([c[1] for c in chunks]),
+        np.concatenate([c[2] for c in chunks]),
+    )
+
+
+def _as_column(values: Optional[np.ndarray], dtype: type) -> np.ndarray:
+    """Convert values to a 1-D column of the given dtype without copying if possible."""
+    if values is None:
+        return np.empty(0, dtype=dtype)
+    return np.asarray(values, dtype=dtype).reshape(-1)
+
+
+def _columns_from_accesses(
+    accesses: Sequence[MemoryAccess],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """Split a sequence of MemoryAccess objects into column arrays.
+
+    Timestamps are dropped (returned as None) when they are simply the
+    access index, which keeps the implicit-timestamp representation.
+    """
+    if isinstance(accesses, AccessView):
+        view_ts = accesses._timestamps
+        if view_ts is None and accesses._offset != 0:
+            view_ts = np.arange(
+                accesses._offset, accesses._offset + len(accesses), dtype=TIMESTAMP_DTYPE
             )
-            return cls(metadata=metadata, accesses=[])
+        return accesses._addresses, accesses._operations, accesses._sizes, view_ts
+
+    n = len(accesses)
+    addresses = np.fromiter((acc.address for acc in accesses), dtype=ADDRESS_DTYPE, count=n)
+    operations = np.fromiter(
+        (OP_CODES[acc.operation] for acc in accesses), dtype=OPERATION_DTYPE, count=n
+    )
+    sizes = np.fromiter((acc.size for acc in accesses), dtype=SIZE_DTYPE, count=n)
+    timestamps = np.fromiter(
+        (acc.timestamp for acc in accesses), dtype=TIMESTAMP_DTYPE, count=n
+    )
+    if np.array_equal(timestamps, np.arange(n, dtype=TIMESTAMP_DTYPE)):
+        return addresses, operations, sizes, None
+
+    return addresses, operations, sizes, timestamps
+
+
+def sorted_unique(values: np.ndarray) -> np.ndarray:
+    """Return the sorted distinct values of an array.
+
+    Equivalent to ``np.unique`` but uses a sort and a neighbour compare,
+    which is much faster than NumPy's hash-based unique for uint64 data.
+    """
+    if len(values) == 0:
+        return np.asarray(values)
+    ordered = np.sort(values)
+    keep = np.empty(len(ordered), dtype=bool)
+    keep[0] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=keep[1:])
+    return ordered[keep]
+
+
+def count_unique(values: np.ndarray) -> int:
+    """Count distinct values in an array with a sort and a neighbour compare."""
+    if len(values) == 0:
+        return 0
+    ordered = np.sort(values)
+    return 1 + int(np.count_nonzero(ordered[1:] != ordered[:-1]))
+
+
+class MetadataAccumulator:
+    """Accumulate TraceMetadata over column chunks in a single streaming pass.
+
+    Used when a trace is consumed chunk by chunk and never held in memory
+    as a whole, and to combine the metadata of trace pieces parsed in
+    parallel. Counts, min and max are updated per chunk; distinct addresses
+    are kept as a sorted array that pending chunks are merged into once
+    they outgrow it, so memory use is proportional to the number of
+    distinct addresses rather than to the trace length.
+
+    If the configuration disables exact counting, or the distinct set
+    outgrows its memory budget, distinct addresses are counted with a
+    HyperLogLog sketch instead (constant memory).
+    """
+
+    # Pending addresses are merged into the distinct set once they exceed
+    # twice its size (and at least this many), keeping merges amortized
+    _MIN_COMPACT = 1 << 16
 
-        # Compute statistics
-        addresses = {acc.address for acc in accesses}
-        read_count = sum(1 for acc in accesses if acc.operation == "R")
-        write_count = sum(1 for acc in accesses if acc.operation == "W")
-        min_addr = min(acc.address for acc in accesses)
-        max_addr = max(acc.address for acc in accesses)
+    def __init__(self, cardinality: Optional[CardinalityConfig] = None) -> None:
+        """Initialize an empty accumulator.
 
-        metadata = TraceMetadata(
+        Args:
+            cardinality: How to count unique addresses (default: exactly)
+        """
+        self.cardinality = cardinality or CardinalityConfig()
+        self.total_accesses = 0
+        self.read_count = 0
+        self.min_address: Optional[int] = None
+        self.max_address: Optional[int] = None
+        self._unique = np.empty(0, dtype=ADDRESS_DTYPE)
+        self._pending: list[np.ndarray] = []
+        self._pending_size = 0
+        self._sketch: Optional[HyperLogLog] = None
+        if not self.cardinality.exact:
+            self._sketch = HyperLogLog.from_error(self.cardinality.error)
+
+    def update(self, addresses: np.ndarray, operations: np.ndarray) -> None:
+        """Add a chunk of accesses.
+
+        Args:
+            addresses: Address column of the chunk
+            operations: Operation column of the chunk
+        """
+        n = len(addresses)
+        if n == 0:
+            return
+
+        self.total_accesses += n
+        self.read_count += int(np.count_nonzero(operations == OP_READ))
+        self._update_range(int(addresses.min()), int(addresses.max()))
+        self._add_pending(np.asarray(addresses, dtype=ADDRESS_DTYPE))
+
+    def merge(self, other: "MetadataAccumulator") -> None:
+        """Add everything accumulated by another accumulator.
+
+        Args:
+            other: Accumulator over a different part of the trace
+        """
+        if other.total_accesses == 0:
+            return
+
+        self.total_accesses += other.total_accesses
+        self.read_count += other.read_count
+        assert other.min_address is not None and other.max_address is not None
+        self._update_range(other.min_address, other.max_address)
+
+        if other._sketch is not None:
+            if self._sketch is None:
+                self._switch_to_sketch()
+            assert self._sketch is not None
+            self._sketch.merge(other._sketch)
+        for addresses in (other._unique, *other._pending):
+            self._add_pending(addresses)
+
+    def _update_range(self, low: int, high: int) -> None:
+        """Widen the address range to include [low, high]."""
+        self.min_address = low if self.min_address is None else min(self.min_address, low)
+        self.max_address = high if self.max_address is None else max(self.max_address, high)
+
+    def _add_pending(self, addresses: np.ndarray) -> None:
+        """Queue addresses for the distinct set, merging when enough are queued."""
+        if not len(addresses):
+            return
+        if self._sketch is not None:
+            self._sketch.update(addresses)
+            return
+
+        self._pending.append(addresses)
+        self._pending_size += len(addresses)
+        if (
+            self._pending_size > max(2 * len(self._unique), self._MIN_COMPACT)
+            or not self.cardinality.exact_fits(len(self._unique) + self._pending_size)
+        ):
+            self.compact()
+
+    def _switch_to_sketch(self) -> None:
+        """Replace the exact distinct set with a HyperLogLog sketch."""
+        sketch = HyperLogLog.from_error(self.cardinality.error)
+        for addresses in (self._unique, *self._pending):
+            sketch.update(addresses)
+        self._sketch = sketch
+        self._unique = np.empty(0, dtype=ADDRESS_DTYPE)
+        self._pending = []
+        self._pending_size = 0
+
+    def compact(self) -> None:
+        """Merge pending addresses into the distinct set.
+
+        Happens automatically; call it explicitly to shrink the accumulator
+        before sending it to another process.
+        """
+        if self._pending:
+            self._unique = sorted_unique(np.concatenate([self._unique, *self._pending]))
+            self._pending = []
+            self._pending_size = 0
+            if not self.cardinality.exact_fits(len(self._unique)):
+                self._switch_to_sketch()
+
+    @property
+    def unique_addresses(self) -> int:
+        """Number of distinct addresses seen so far (estimated if sketched)."""
+        self.compact()
+        if self._sketch is not None:
+            return self._sketch.estimate()
+        return len(self._unique)
+
+    @property
+    def unique_addresses_error(self) -> float:
+        """Relative standard error of `unique_addresses` (0.0 if exact)."""
+        return 0.0 if self._sketch is None else self._sketch.error
+
+    def metadata(self, source: Path, format_name: str) -> TraceMetadata:
+        """Return the metadata accumulated so far.
+
+        Args:
+            source: Path the trace was read from
+            format_name: Name of the trace format
+
+        Returns:
+            TraceMetadata over every chunk passed to `update`
+        """
+        return TraceMetadata(
             source=source,
             format=format_name,
-            total_accesses=len(accesses),
-            unique_addresses=len(addresses),
-            read_count=read_count,
-            write_count=write_count,
-            address_range=(min_addr, max_addr)
+            total_accesses=self.total_accesses,
+            unique_addresses=self.unique_addresses,
+            read_count=self.read_count,
+            write_count=self.total_accesses - self.read_count,
+            address_range=(self.min_address or 0, self.max_address or 0),
+            unique_addresses_error=self.unique_addresses_error,
         )
 
-        return cls(metadata=metadata, accesses=accesses)
+
+def _compute_metadata(
+    addresses: np.ndarray,
+    operations: np.ndarray,
+    source: Path,
+    format_name: str,
+    cardinality: Optional[CardinalityConfig] = None
+) -> TraceMetadata:
+    """Compute trace metadata with vectorized reductions over the columns.
+
+    Each statistic is a single NumPy reduction over a column, so the trace
+    is never walked in Python. Exact unique counting sorts a copy of the
+    address column; if that copy would exceed the configured memory budget
+    (or exact counting is disabled) a HyperLogLog estimate is used instead.
+    """
+    total = len(addresses)
+    if total == 0:
+        return TraceMetadata(
+            source=source,
+            format=format_name,
+            total_accesses=0,
+            unique_addresses=0,
+            read_count=0,
+            write_count=0,
+            address_range=(0, 0)
+        )
+
+    read_count = int(np.count_nonzero(operations == OP_READ))
+
+    cardinality = cardinality or CardinalityConfig()
+    if cardinality.exact_fits(total):
+        unique, unique_error = count_unique(addresses), 0.0
+    else:
+        sketch = HyperLogLog.from_error(cardinality.error)
+        sketch.update(addresses)
+        unique, unique_error = sketch.estimate(), sketch.error
+
+    return TraceMetadata(
+        source=source,
+        format=format_name,
+        total_accesses=total,
+        unique_addresses=unique,
+        read_count=read_count,
+        write_count=total - read_count,
+        address_range=(int(addresses.min()), int(addresses.max())),
+        unique_addresses_error=unique_error,
+    )
@@ -0,0 +1,201 @@
+"""Parallel parsing of line-oriented trace files by byte range."""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import numpy as np  # type: ignore
+
+from memgraph.trace.cardinality import CardinalityConfig
+from memgraph.trace.compression import detect_compression
+from memgraph.trace.models import MetadataAccumulator, Trace, concatenate_columns
+from memgraph.trace.formats.base import RangeParser
+
+
+# Ranges smaller than this are not worth a separate process
+MIN_RANGE_BYTES = 1 << 20
+
+# Bytes scanned at a time when aligning a boundary to the next newline
+_ALIGN_BLOCK = 1 << 16
+
+
+def split_ranges(
+    file_path: Path,
+    parts: int,
+    start: int = 0,
+    min_range: Optional[int] = None
+) -> list[tuple[int, int]]:
+    """Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        file_path: Path to the file
+        parts: Desired number of ranges
+        start: Byte offset where the first range starts (e.g. after a header)
+        min_range: Minimum size of a range in bytes (default: MIN_RANGE_BYTES)
+
+    Returns:
+        Non-empty, contiguous (start, end) ranges covering [start, file size)
+    """
+    file_size = file_path.stat().st_size
+    if start >= file_size:
+        return []
+
+    if min_range is None:
+        min_range = MIN_RANGE_BYTES
+    parts = max(1, min(parts, (file_size - start) // max(min_range, 1)))
+    step = (file_size - start) / parts
+
+    boundaries = [start]
+    with open(file_path, "rb") as f:
+        for i in range(1, parts):
+            boundary = _next_line_start(f, int(start + i * step), file_size)
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+    if file_size > boundaries[-1]:
+        boundaries.append(file_size)
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _next_line_start(f: BinaryIO, offset: int, file_size: int) -> int:
+    """Return the first line start at or after `offset`."""
+    if offset <= 0:
+        return 0
+
+    # A line starts at `offset` if the previous byte is a newline
+    f.seek(offset - 1)
+    position = offset - 1
+    while position < file_size:
+        block = f.read(_ALIGN_BLOCK)
+        if not block:
+            break
+        newline = block.find(b"\n")
+        if newline >= 0:
+            return position + newline + 1
+        position += len(block)
+    return file_size
+
+
+def _count_lines(file_path: Path, end: int) -> int:
+    """Count newlines in the first `end` bytes of a file."""
+    count = 0
+    remaining = end
+    with open(file_path, "rb") as f:
+        while remaining > 0:
+            block = f.read(min(remaining, _ALIGN_BLOCK * 16))
+            if not block:
+                break
+            count += block.count(b"\n")
+            remaining -= len(block)
+    return count
+
+
+def _parse_range(
+    parser_cls: type[RangeParser],
+    cardinality: Optional[CardinalityConfig],
+    file_path: Path,
+    start: int,
+    end: int
+) -> tuple[tuple[np.ndarray, np.ndarray, np.ndarray], MetadataAccumulator]:
+    """Process pool entry point: parse one byte range.
+
+    Returns:
+        Tuple of (column arrays, metadata accumulated over the range)
+    """
+    columns = parser_cls(cardinality).parse_range(file_path, start, end)
+    accumulator = MetadataAccumulator(cardinality)
+    accumulator.update(columns[0], columns[1])
+    accumulator.compact()
+    return columns, accumulator
+
+
+def parse_parallel(
+    parser: RangeParser,
+    file_path: Path,
+    workers: int
+) -> Trace:
+    """Parse a line-oriented trace file with a pool of worker processes.
+
+    The file is split into newline-aligned byte ranges, each range is parsed
+    in its own process, and the column arrays are concatenated in file
+    order. Timestamps are implicit (the access index), so concatenation
+    renumbers them without extra work. Each worker also accumulates the
+    metadata of its range, and the partial results are merged, so the
+    metadata pass is parallel too.
+
+    Args:
+        parser: Parser for a format that can be parsed by byte range
+        file_path: Path to the trace file
+        workers: Number of worker processes
+
+    Returns:
+        Parsed Trace object
+
+    Raises:
+        ValueError: If the parser can't parse byte ranges, the file is
+            compressed, or the file format is invalid
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not isinstance(parser, RangeParser):
+        raise ValueError(
+            f"Parallel parsing is not supported for {parser.format_name()} traces"
+        )
+    if not file_path.exists():
+        raise FileNotFoundError(f"Trace file not found: {file_path}")
+    if detect_compression(file_path) is not None:
+        raise ValueError("Compressed traces can't be split into byte ranges")
+
+    ranges = split_ranges(file_path, workers, start=parser.data_offset(file_path))
+
+    if len(ranges) <= 1:
+        addresses, operations, sizes = parser.parse_range(file_path)
+        return Trace.from_arrays(
+            addresses,
+            operations,
+            sizes,
+            file_path,
+            parser.format_name(),
+            cardinality=parser.cardinality,
+        )
+
+    accumulator = MetadataAccumulator(parser.cardinality)
+    chunks = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [
+            pool.submit(
+                _parse_range, type(parser), parser.cardinality, file_path, start, end
+            )
+            for start, end in ranges
+        ]
+
+        for (start, end), future in zip(ranges, futures):
+            try:
+                columns, partial = future.result()
+            except ValueError:
+                # Re-parse the failing range in-process with its real
+                # line number so the error message points at the file
+                _reraise_with_line_numbers(parser, file_path, start, end)
+                raise
+            chunks.append(columns)
+            accumulator.merge(partial)
+
+    addresses, operations, sizes = concatenate_columns(chunks)
+    return Trace.from_arrays(
+        addresses,
+        operations,
+        sizes,
+        file_path,
+        parser.format_name(),
+        metadata=accumulator.metadata(file_path, parser.format_name()),
+    )
+
+
+def _reraise_with_line_numbers(
+    parser: RangeParser,
+    file_path: Path,
+    start: int,
+    end: Optional[int]
+) -> None:
+    """Parse a range again knowing its first line number, to raise a precise error."""
+    first_line = _count_lines(file_path, start) + 1
+    parser.parse_range(file_path, start, end, first_line=first_line)
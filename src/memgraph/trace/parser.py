@@ -2,16 +2,22 @@
 
 from pathlib import Path
 from typing import Optional
+from memgraph.trace.cardinality import CardinalityConfig
+from memgraph.trace.compression import detect_compression
 from memgraph.trace.models import Trace
-from memgraph.trace.formats.base import BaseParser
+from memgraph.trace.formats.base import BaseParser, RangeParser
+from memgraph.trace.formats.binary import BinaryParser
 from memgraph.trace.formats.native import NativeParser
 from memgraph.trace.formats.lackey import LackeyParser
 from memgraph.trace.formats.csv import CSVParser
+from memgraph.trace.parallel import parse_parallel
+from memgraph.trace.stream import TraceStream
 
 
 # Parsers in order of precedence (most specific first)
 PARSERS: list[type[BaseParser]] = [
-    NativeParser,  # Check native first (has explicit header)
+    BinaryParser,  # Check binary first (magic bytes)
+    NativeParser,  # Check native text next (has explicit header)
     CSVParser,     # Check CSV second (has header row)
     LackeyParser,  # Check Lackey last (more ambiguous format)
 ]
@@ -20,6 +26,9 @@ PARSERS: list[type[BaseParser]] = [
 def detect_format(file_path: Path) -> Optional[type[BaseParser]]:
     """Detect the format of a trace file.
 
+    Compressed files (gzip, bz2, xz) are sniffed from the start of their
+    decompressed content.
+
     Args:
         file_path: Path to the trace file
 
@@ -34,14 +43,25 @@ def detect_format(file_path: Path) -> Optional[type[BaseParser]]:
 
 def parse_trace(
     file_path: Path | str,
-    format: Optional[str] = None
+    format: Optional[str] = None,
+    workers: int = 1,
+    cardinality: Optional[CardinalityConfig] = None
 ) -> Trace:
     """Parse a trace file, auto-detecting format if not specified.
 
+    gzip, bz2 and xz compressed files are decompressed on the fly.
+
     Args:
         file_path: Path to the trace file
-        format: Optional format name ("native", "lackey", "csv").
+        format: Optional format name ("binary", "native", "lackey", "csv").
                 If None, format will be auto-detected.
+        workers: Number of processes to parse with. Line-oriented formats
+                (Lackey, CSV) are split into byte ranges parsed in parallel;
+                other formats and compressed files ignore this and parse
+                on one core.
+        cardinality: How to count unique addresses in the metadata
+                (default: exactly). Use ``CardinalityConfig(exact=False)``
+                or a memory budget for a HyperLogLog estimate.
 
     Returns:
         Parsed Trace object
@@ -54,11 +74,67 @@ def parse_trace(
 
     if not file_path.exists():
         raise FileNotFoundError(f"Trace file not found: {file_path}")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    parser = _resolve_parser(file_path, format, cardinality)
+    if (
+        workers > 1
+        and isinstance(parser, RangeParser)
+        and detect_compression(file_path) is None
+    ):
+        return parse_parallel(parser, file_path, workers)
+    return parser.parse(file_path)
+
+
+def stream_trace(
+    file_path: Path | str,
+    format: Optional[str] = None,
+    cardinality: Optional[CardinalityConfig] = None
+) -> TraceStream:
+    """Open a trace file for single-pass streaming, without loading it.
+
+    Accesses are decoded chunk by chunk as the returned stream is iterated,
+    and the trace metadata is accumulated on the fly. Use this instead of
+    `parse_trace` when the trace is too large to hold in memory.
+
+    Args:
+        file_path: Path to the trace file
+        format: Optional format name ("binary", "native", "lackey", "csv").
+                If None, format will be auto-detected.
+        cardinality: How to count unique addresses in the metadata
+                (default: exactly)
+
+    Returns:
+        TraceStream over the file
+
+    Raises:
+        ValueError: If format is invalid or cannot be detected
+        FileNotFoundError: If the file doesn't exist
+    """
+    file_path = Path(file_path)
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"Trace file not found: {file_path}")
+
+    return TraceStream(_resolve_parser(file_path, format, cardinality), file_path)
+
 
+def _resolve_parser(
+    file_path: Path,
+    format: Optional[str],
+    cardinality: Optional[CardinalityConfig] = None
+) -> BaseParser:
+    """Return a parser for the given format name, or auto-detect one.
+
+    Raises:
+        ValueError: If format is invalid or cannot be detected
+    """
     # If format specified, use that parser
     if format:
         format = format.lower()
         parser_map: dict[str, type[BaseParser]] = {
+            "binary": BinaryParser,
             "native": NativeParser,
             "lackey": LackeyParser,
             "csv": CSVParser,
@@ -71,16 +147,14 @@ def parse_trace(
             )
 
         parser_cls = parser_map[format]
-        parser = parser_cls()
-        return parser.parse(file_path)
-
-    # Auto-detect format
-    detected_parser = detect_format(file_path)
-    if detected_parser is None:
-        raise ValueError(
-            f"Could not detect format of trace file: {file_path}. "
-            f"Try specifying format explicitly."
-        )
-
-    parser = detected_parser()
-    return parser.parse(file_path)
+    else:
+        # Auto-detect format
+        detected_parser = detect_format(file_path)
+        if detected_parser is None:
+            raise ValueError(
+                f"Could not detect format of trace file: {file_path}. "
+                f"Try specifying format explicitly."
+            )
+        parser_cls = detected_parser
+
+    return parser_cls(cardinality)
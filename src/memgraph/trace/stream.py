@@ -0,0 +1,68 @@
+"""Single-pass streaming access to trace files."""
+
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np  # type: ignore
+
+from memgraph.trace.models import MetadataAccumulator, TraceMetadata
+from memgraph.trace.formats.base import BaseParser
+
+
+class TraceStream:
+    """A trace file consumed once, chunk by chunk, instead of loaded whole.
+
+    Iterating the stream yields (addresses, operations, sizes) column chunks
+    decoded straight from the file, and accumulates the trace metadata as a
+    side effect. Only one chunk is held in memory at a time, so `metadata`
+    is complete once the stream has been fully consumed.
+
+    Example:
+        >>> stream = stream_trace("trace.log")
+        >>> graph = GraphBuilder().build_stream(stream.addresses())
+        >>> stream.metadata.total_accesses
+    """
+
+    def __init__(self, parser: BaseParser, file_path: Path):
+        """Initialize a stream over a trace file.
+
+        Args:
+            parser: Parser for the file's format
+            file_path: Path to the trace file
+        """
+        self.parser = parser
+        self.file_path = file_path
+        self._accumulator = MetadataAccumulator(parser.cardinality)
+        self._started = False
+        self._finished = False
+
+    def __iter__(self) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Yield column chunks, accumulating metadata.
+
+        Raises:
+            ValueError: If the stream has already been consumed
+        """
+        if self._started:
+            raise ValueError("Trace streams can only be consumed once")
+        self._started = True
+
+        for addresses, operations, sizes in self.parser.iter_columns(self.file_path):
+            self._accumulator.update(addresses, operations)
+            yield addresses, operations, sizes
+
+        self._finished = True
+
+    def addresses(self) -> Iterator[np.ndarray]:
+        """Yield only the address column of each chunk."""
+        for addresses, _, _ in self:
+            yield addresses
+
+    @property
+    def finished(self) -> bool:
+        """True once every chunk has been read."""
+        return self._finished
+
+    @property
+    def metadata(self) -> TraceMetadata:
+        """Metadata over the chunks read so far (the whole trace once finished)."""
+        return self._accumulator.metadata(self.file_path, self.parser.format_name())
@@ -0,0 +1,113 @@
+"""Tests for approximate unique-address counting."""
+
+import numpy as np  # type: ignore
+import pytest
+from pathlib import Path
+
+from memgraph.trace.cardinality import CardinalityConfig, HyperLogLog
+from memgraph.trace.models import MetadataAccumulator, Trace
+from memgraph.trace.parser import parse_trace
+
+
+def test_hyperloglog_estimate_within_error() -> None:
+    """Test that estimates fall within a few standard errors of the truth."""
+    rng = np.random.default_rng(42)
+
+    for n in (10, 1000, 50000, 300000):
+        values = rng.integers(0, 1 << 48, size=n).astype(np.uint64)
+        sketch = HyperLogLog.from_error(0.01)
+        sketch.update(values)
+        sketch.update(values[: n // 2])  # Duplicates don't change the estimate
+
+        true_count = len(np.unique(values))
+        assert abs(sketch.estimate() - true_count) <= 4 * sketch.error * true_count + 1
+
+
+def test_hyperloglog_from_error_and_merge() -> None:
+    """Test precision selection and that merging equals a single sketch."""
+    sketch = HyperLogLog.from_error(0.01)
+    assert sketch.error <= 0.01
+    assert sketch.precision == 14
+
+    values = np.arange(100000, dtype=np.uint64) * 64
+    whole = HyperLogLog(12)
+    whole.update(values)
+    left, right = HyperLogLog(12), HyperLogLog(12)
+    left.update(values[:60000])
+    right.update(values[40000:])
+    left.merge(right)
+
+    assert left.estimate() == whole.estimate()
+
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(10))
+    with pytest.raises(ValueError):
+        HyperLogLog(2)
+    with pytest.raises(ValueError):
+        CardinalityConfig(error=0.0)
+
+
+def test_accumulator_switches_to_sketch_over_budget() -> None:
+    """Test that exact counting falls back to HyperLogLog past the memory budget."""
+    addresses = np.arange(200000, dtype=np.uint64) * 8
+    operations = np.zeros(200000, dtype=np.uint8)
+
+    small = MetadataAccumulator(CardinalityConfig(memory_budget=1 << 20))
+    small.update(addresses[:1000], operations[:1000])
+    assert small.unique_addresses == 1000
+    assert small.unique_addresses_error == 0.0
+
+    for start in range(1000, 200000, 10000):
+        small.update(addresses[start:start + 10000], operations[start:start + 10000])
+
+    meta = small.metadata(Path("<test>"), "test")
+    assert not meta.unique_addresses_exact
+    assert meta.total_accesses == 200000
+    assert abs(meta.unique_addresses - 200000) <= 4 * meta.unique_addresses_error * 200000
+
+
+def test_trace_metadata_approximate_unique(temp_dir: Path) -> None:
+    """Test approximate counting for in-memory traces and parsed files."""
+    addresses = np.arange(5000, dtype=np.uint64) * 64
+    trace = Trace.from_arrays(
+        addresses,
+        np.zeros(5000, dtype=np.uint8),
+        np.full(5000, 8, dtype=np.uint32),
+        Path("<test>"),
+        "test",
+        cardinality=CardinalityConfig(exact=False, error=0.02),
+    )
+    assert trace.metadata.unique_addresses_error > 0
+    assert abs(trace.metadata.unique_addresses - 5000) < 500
+
+    trace_file = temp_dir / "approx.csv"
+    trace_file.write_text("op,address,size\n" + "".join(f"R,{i * 8:x},8\n" for i in range(100)))
+    exact = parse_trace(trace_file)
+    approx = parse_trace(trace_file, cardinality=CardinalityConfig(exact=False))
+
+    assert exact.metadata.unique_addresses_exact
+    assert not approx.metadata.unique_addresses_exact
+    assert approx.metadata.total_accesses == exact.metadata.total_accesses
+
+
+def test_binary_roundtrip_counts_unique_exactly(temp_dir: Path) -> None:
+    """Test that binary files store an exact count in place of an estimate."""
+    from memgraph.trace.formats.binary import BinaryParser
+
+    addresses = np.arange(5000, dtype=np.uint64) * 64
+    trace = Trace.from_arrays(
+        addresses,
+        np.zeros(5000, dtype=np.uint8),
+        np.full(5000, 8, dtype=np.uint32),
+        Path("<test>"),
+        "test",
+        cardinality=CardinalityConfig(exact=False),
+    )
+    assert not trace.metadata.unique_addresses_exact
+
+    output_file = temp_dir / "approx.bin"
+    BinaryParser().write(trace, output_file)
+    loaded = BinaryParser().parse(output_file)
+
+    assert loaded.metadata.unique_addresses_exact
+    assert loaded.metadata.unique_addresses == 5000
@@ -28,6 +28,20 @@ def test_cli_report_renders():
     assert "1,000" in rendered  # Total accesses formatted
 
 
+def test_cli_report_sketched_edge_weights():
+    """CLI report should flag sketched edge weights with their error bound."""
+    result = create_mock_result()
+
+    output = StringIO()
+    CLIReporter(Console(file=output, force_terminal=True, width=120)).report(result)
+    assert "count-min" not in output.getvalue()
+
+    result.edge_weight_error = 1234
+    output = StringIO()
+    CLIReporter(Console(file=output, force_terminal=True, width=120)).report(result)
+    assert "approximate (≤+1,234, count-min)" in output.getvalue()
+
+
 def test_cli_report_with_empty_recommendations():
     """CLI report should handle empty recommendations."""
     result = create_mock_result()
@@ -57,3 +71,24 @@ def test_cli_report_with_empty_graphlets():
 
     rendered = output.getvalue()
     assert "Graphlet Distribution" in rendered
+
+
+def test_cli_report_multi_granularity():
+    """Combined report should compare every granularity."""
+    results = []
+    for granularity, pattern in [("byte", "random"), ("page", "sequential")]:
+        result = create_mock_result()
+        result.granularity = granularity
+        result.detected_pattern = pattern
+        results.append(result)
+
+    output = StringIO()
+    console = Console(file=output, force_terminal=True, width=120)
+
+    CLIReporter(console).report_multi(results)
+
+    rendered = output.getvalue()
+    assert "Granularity Comparison" in rendered
+    assert rendered.count("MemGraph Analysis Report") == 1
+    assert "byte" in rendered and "page" in rendered
+    assert "random" in rendered and "sequential" in rendered
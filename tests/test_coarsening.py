@@ -98,3 +98,58 @@ def test_coarsen_large_addresses() -> None:
     assert byte == large_addr
     assert cacheline == large_addr >> 6
     assert page == large_addr >> 12
+
+
+def test_huge_page_granularities() -> None:
+    """Test the line-pair and huge-page granularities."""
+    assert Granularity.LINE_PAIR.shift_bits == 7
+    assert Granularity.HUGE_PAGE.shift_bits == 21
+    assert Granularity.GIGA_PAGE.shift_bits == 30
+
+    addr = 0x4020_0080
+    assert coarsen_address(addr, Granularity.LINE_PAIR) == addr >> 7
+    assert coarsen_address(addr, Granularity.HUGE_PAGE) == 0x201
+    assert coarsen_address(addr, Granularity.GIGA_PAGE) == 0x1
+
+
+def test_power_of_two_granularity() -> None:
+    """Any power of two is a granularity; other sizes are rejected."""
+    import numpy as np  # type: ignore
+    from memgraph.graph.coarsening import coarsen_addresses
+
+    block = Granularity(8192)
+    assert block is Granularity(8192)
+    assert block.shift_bits == 13
+    assert block.label == "8kb"
+    assert Granularity(4096) is Granularity.PAGE
+    assert block not in list(Granularity)
+
+    addresses = np.array([0x1FFF, 0x2000, 0x7FFFFFFF_FFFFF000], dtype=np.uint64)
+    assert coarsen_addresses(addresses, block).tolist() == [0, 1, 0x7FFFFFFF_FFFFF000 >> 13]
+
+    for size in (0, 3, 100, 1 << 64):
+        with pytest.raises(ValueError):
+            Granularity(size)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("cacheline", Granularity.CACHELINE),
+    ("Huge-Page", Granularity.HUGE_PAGE),
+    ("128", Granularity.LINE_PAIR),
+    ("0x1000", Granularity.PAGE),
+    ("4k", Granularity.PAGE),
+    ("2MB", Granularity.HUGE_PAGE),
+    ("1GiB", Granularity.GIGA_PAGE),
+    ("256B", Granularity(256)),
+])
+def test_parse_granularity(text: str, expected: Granularity) -> None:
+    """Test parsing granularity names and sizes."""
+    assert Granularity.parse(text) is expected
+    assert Granularity.parse(expected.label) is expected
+
+
+@pytest.mark.parametrize("text", ["3MB", "lines", "", "-64"])
+def test_parse_granularity_invalid(text: str) -> None:
+    """Test that unknown names and non-power-of-two sizes are rejected."""
+    with pytest.raises(ValueError, match="Unknown granularity"):
+        Granularity.parse(text)
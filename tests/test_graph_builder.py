@@ -2,11 +2,12 @@
 
 import pytest
 import networkx as nx  # type: ignore
+import numpy as np  # type: ignore
 from pathlib import Path
 
 from memgraph.graph.builder import GraphBuilder
-from memgraph.graph.windowing import FixedWindow, SlidingWindow
-from memgraph.graph.coarsening import Granularity
+from memgraph.graph.windowing import Accesses, FixedWindow, SlidingWindow
+from memgraph.graph.coarsening import Granularity, coarsen_address
 from memgraph.graph.stats import GraphStats
 from memgraph.graph.serialization import save_graph, load_graph
 from memgraph.trace.generator import (
@@ -18,6 +19,35 @@ from memgraph.trace.generator import (
 )
 
 
+def _reference_graph(
+    windows: list[Accesses],
+    granularity: Granularity,
+    min_edge_weight: int = 1
+) -> nx.Graph:
+    """Build the clique graph of some windows with plain Python loops.
+
+    Pairs are counted once per window in a dict, and edges are added in
+    the order pairs are first seen.
+    """
+    edge_weights: dict[tuple[int, int], int] = {}
+    for window in windows:
+        if isinstance(window, np.ndarray):
+            addresses = window.tolist()
+        else:
+            addresses = [access.address for access in window]
+        lines = sorted({coarsen_address(address, granularity) for address in addresses})
+        for i in range(len(lines)):
+            for j in range(i + 1, len(lines)):
+                edge = (lines[i], lines[j])
+                edge_weights[edge] = edge_weights.get(edge, 0) + 1
+
+    graph: nx.Graph = nx.Graph()
+    for (node1, node2), weight in edge_weights.items():
+        if weight >= min_edge_weight:
+            graph.add_edge(node1, node2, weight=weight)
+    return graph
+
+
 def test_graph_builder_basic() -> None:
     """Test basic graph building from trace."""
     trace = generate_sequential(n=50, stride=8)
@@ -392,3 +422,484 @@ def test_graph_builder_all_granularities() -> None:
         graph = builder.build(trace)
 
         assert graph.number_of_nodes() > 0
+
+
+def test_graph_builder_array_windows_match_access_windows() -> None:
+    """Windows over the address column give the same edges as MemoryAccess windows."""
+    trace = generate_working_set(500, working_set_size=30, seed=7)
+    builder = GraphBuilder(FixedWindow(25), Granularity.CACHELINE)
+
+    from memgraph.graph.edges import EdgeAggregator
+
+    from_arrays = EdgeAggregator(Granularity.CACHELINE)
+    from_objects = EdgeAggregator(Granularity.CACHELINE)
+    from_arrays.add_windows(FixedWindow(25).windows(trace.addresses))
+    from_objects.add_windows(FixedWindow(25).windows(list(trace.accesses)))
+
+    arrays = from_arrays.result()
+    objects = from_objects.result()
+    for column in ("a", "b", "weight", "first_window"):
+        assert getattr(arrays, column).tolist() == getattr(objects, column).tolist()
+
+    expected = _reference_graph(
+        list(FixedWindow(25).windows(list(trace.accesses))), Granularity.CACHELINE
+    )
+    assert list(builder.build(trace).edges(data=True)) == list(expected.edges(data=True))
+
+
+def test_graph_builder_stream_matches_build(
+    temp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Streaming a trace file gives the same graph and metadata as loading it."""
+    from memgraph.graph.windowing import AdaptiveWindow
+    from memgraph.trace.formats.lackey import LackeyParser
+    from memgraph.trace.parser import parse_trace, stream_trace
+
+    trace_file = temp_dir / "stream.trace"
+    trace_file.write_text("I  04000000,3\n" + "".join(
+        f" {'LSM'[i % 3]} {(i * 97) % 4096:x},8\n" for i in range(3000)
+    ))
+    trace = parse_trace(trace_file)
+
+    # Small chunks so windows straddle chunk boundaries
+    monkeypatch.setattr(LackeyParser, "CHUNK_SIZE", 1000)
+
+    for strategy in (FixedWindow(50), SlidingWindow(40, step=7), AdaptiveWindow(30)):
+        builder = GraphBuilder(strategy, Granularity.CACHELINE)
+        expected = builder.build(trace)
+
+        stream = stream_trace(trace_file)
+        graph = builder.build_stream(stream.addresses())
+
+        assert sorted(graph.edges(data="weight")) == sorted(expected.edges(data="weight"))
+        assert stream.finished
+        assert stream.metadata == trace.metadata
+
+
+@pytest.mark.parametrize("granularity", list(Granularity))
+def test_vectorized_build_matches_reference(
+    granularity: Granularity,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Vectorized edge aggregation gives the dict-based graph, in the same order."""
+    from memgraph.graph.edges import EdgeAggregator
+    from memgraph.graph.windowing import AdaptiveWindow
+
+    # Tiny batches so several batch results are merged
+    monkeypatch.setattr(EdgeAggregator, "BATCH_PAIRS", 500)
+    monkeypatch.setattr(EdgeAggregator, "MERGE_ROWS", 2000)
+
+    traces = [
+        generate_working_set(2000, working_set_size=80, seed=3),
+        generate_random(2000, seed=5),
+    ]
+    strategies = [
+        FixedWindow(30),
+        SlidingWindow(20, step=3),
+        SlidingWindow(15),
+        SlidingWindow(5, step=8),
+        AdaptiveWindow(25),
+    ]
+
+    for trace in traces:
+        for strategy in strategies:
+            for min_weight in (1, 3):
+                builder = GraphBuilder(strategy, granularity, min_edge_weight=min_weight)
+                graph = builder.build(trace)
+
+                expected = _reference_graph(
+                    list(strategy.windows(trace.addresses)), granularity, min_weight
+                )
+
+                assert list(graph.nodes) == list(expected.nodes)
+                assert list(graph.edges(data=True)) == list(expected.edges(data=True))
+
+
+def test_graph_builder_time_window_uses_timestamps() -> None:
+    """Time windows over a columnar trace follow its timestamp column."""
+    import numpy as np  # type: ignore
+    from memgraph.graph.windowing import TimeWindow
+    from memgraph.trace.models import Trace
+
+    # Two bursts of accesses far apart in time
+    addresses = np.array([0x1000, 0x2000, 0x3000, 0x4000, 0x5000], dtype=np.uint64)
+    timestamps = np.array([0, 1, 2, 1000, 1001], dtype=np.uint64)
+    trace = Trace.from_arrays(
+        addresses,
+        np.zeros(5, dtype=np.uint8),
+        np.full(5, 8, dtype=np.uint32),
+        Path("bursts.trace"),
+        "native",
+        timestamps=timestamps,
+    )
+
+    graph, metadata = GraphBuilder(TimeWindow(100)).build_with_metadata(trace)
+
+    assert metadata["window_count"] == 2
+    assert sorted(graph.edges()) == [
+        (0x1000 >> 6, 0x2000 >> 6),
+        (0x1000 >> 6, 0x3000 >> 6),
+        (0x2000 >> 6, 0x3000 >> 6),
+        (0x4000 >> 6, 0x5000 >> 6),
+    ]
+
+
+def test_graph_builder_dense_ids() -> None:
+    """Dense graphs use int32 IDs in address order and recover the addresses."""
+    import numpy as np  # type: ignore
+
+    trace = generate_working_set(1000, working_set_size=50, seed=7)
+    builder = GraphBuilder(SlidingWindow(10, step=2), min_edge_weight=2)
+
+    dense = builder.build_dense(trace)
+    graph = builder.build(trace)
+
+    assert dense.u.dtype == np.int32 and dense.v.dtype == np.int32
+    assert dense.num_nodes == graph.number_of_nodes()
+    assert dense.num_edges == graph.number_of_edges()
+    assert dense.addresses.tolist() == sorted(graph.nodes)
+    assert np.all(dense.u < dense.v)
+
+    # The address table maps IDs back to the same graph
+    restored = dense.to_networkx()
+    assert list(restored.nodes) == list(graph.nodes)
+    assert list(restored.edges(data=True)) == list(graph.edges(data=True))
+
+    nodes = dense.addresses[[3, 0, 5]]
+    assert dense.node_ids(nodes).tolist() == [3, 0, 5]
+    with pytest.raises(ValueError, match="not a node"):
+        dense.node_ids(np.array([int(dense.addresses[-1]) + 1]))
+
+
+def test_graph_builder_csr_matches_networkx(temp_dir: Path) -> None:
+    """CSR graphs hold the same graph, statistics and saved form as NetworkX."""
+    import numpy as np  # type: ignore
+    from memgraph.graph.csr import CSRGraph
+
+    trace = generate_random(800, seed=11)
+    builder = GraphBuilder(FixedWindow(3))
+
+    csr = builder.build_csr(trace)
+    graph = builder.build(trace)
+
+    assert csr.number_of_nodes() == graph.number_of_nodes()
+    assert csr.number_of_edges() == graph.number_of_edges()
+    assert nx.utils.edges_equal(csr.to_networkx().edges(data="weight"), graph.edges(data="weight"))
+    for node in (0, csr.number_of_nodes() - 1):
+        address = int(csr.addresses[node])
+        assert csr.addresses[csr.neighbors(node)].tolist() == sorted(graph.neighbors(address))
+
+    # Random accesses give many components, exercising component labelling
+    expected = GraphStats.from_graph(graph)
+    stats = GraphStats.from_graph(csr)
+    assert expected.connected_components > 1
+    assert stats.connected_components == expected.connected_components
+    assert stats.largest_component_size == expected.largest_component_size
+    assert stats.max_degree == expected.max_degree
+    assert stats.avg_degree == pytest.approx(expected.avg_degree)
+    assert stats.avg_clustering == pytest.approx(expected.avg_clustering)
+
+    converted = CSRGraph.from_networkx(graph)
+    assert np.array_equal(converted.indices, csr.indices)
+    assert np.array_equal(converted.weights, csr.weights)
+
+    graph_file = temp_dir / "graph.npz"
+    save_graph(csr, graph_file, format="npz")
+    loaded = load_graph(graph_file)
+    assert isinstance(loaded, CSRGraph)
+    assert np.array_equal(loaded.indptr, csr.indptr)
+    assert np.array_equal(loaded.weights, csr.weights)
+
+    # Other formats store the NetworkX form
+    save_graph(csr, temp_dir / "graph.pkl")
+    assert isinstance(load_graph(temp_dir / "graph.pkl"), nx.Graph)
+
+
+def test_graph_builder_build_multi_matches_single_builds() -> None:
+    """build_multi gives each granularity's build() graph from one windowing."""
+    trace = generate_working_set(1500, working_set_size=120, seed=9)
+
+    for strategy in (FixedWindow(25), SlidingWindow(12, step=2)):
+        builder = GraphBuilder(strategy, min_edge_weight=2)
+        graphs = builder.build_multi(trace)
+        csr_graphs = builder.build_multi_csr(trace, [Granularity.PAGE, Granularity.BYTE])
+
+        assert list(graphs) == list(Granularity)
+        assert list(csr_graphs) == [Granularity.PAGE, Granularity.BYTE]
+        for granularity, graph in graphs.items():
+            expected = GraphBuilder(strategy, granularity, min_edge_weight=2).build(trace)
+            assert list(graph.nodes) == list(expected.nodes)
+            assert list(graph.edges(data=True)) == list(expected.edges(data=True))
+        for granularity, csr in csr_graphs.items():
+            assert csr.number_of_edges() == graphs[granularity].number_of_edges()
+
+    with pytest.raises(ValueError, match="granularity"):
+        GraphBuilder().build_multi(trace, [])
+
+
+def test_graph_builder_parallel_matches_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sharding windows across worker processes gives the serial graph."""
+    from memgraph.graph import builder as builder_module
+    from memgraph.graph.windowing import AdaptiveWindow
+
+    monkeypatch.setattr(builder_module, "MIN_SHARD_ACCESSES", 100)
+    trace = generate_working_set(3000, working_set_size=150, seed=21)
+
+    for strategy in (FixedWindow(40), SlidingWindow(16, step=3), AdaptiveWindow(30)):
+        serial = GraphBuilder(strategy, min_edge_weight=2)
+        parallel = GraphBuilder(strategy, min_edge_weight=2, workers=3)
+
+        graph, metadata = parallel.build_with_metadata(trace)
+        expected, expected_metadata = serial.build_with_metadata(trace)
+        assert list(graph.nodes) == list(expected.nodes)
+        assert list(graph.edges(data=True)) == list(expected.edges(data=True))
+        assert metadata == expected_metadata
+
+        graphs = parallel.build_multi(trace, [Granularity.BYTE, Granularity.PAGE])
+        for granularity, multi_graph in graphs.items():
+            single = GraphBuilder(strategy, granularity, min_edge_weight=2).build(trace)
+            assert list(multi_graph.edges(data=True)) == list(single.edges(data=True))
+
+    with pytest.raises(ValueError, match="workers"):
+        GraphBuilder(workers=0)
+
+
+def test_graph_builder_spill_matches_in_memory(
+    temp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Spilling sorted edge runs to disk gives the in-memory graph, in order."""
+    from memgraph.graph import edges as edges_module
+    from memgraph.graph.edges import EDGE_ROW_BYTES, EdgeAggregator, SpillConfig
+    from memgraph.graph.windowing import AdaptiveWindow
+
+    # Small batches and merge chunks so many runs are written and merged
+    monkeypatch.setattr(EdgeAggregator, "BATCH_PAIRS", 500)
+    monkeypatch.setattr(edges_module, "_MIN_MERGE_CHUNK", 16)
+    written = []
+    write = edges_module._SpilledRuns.write
+    monkeypatch.setattr(
+        edges_module._SpilledRuns,
+        "write",
+        lambda runs, edges: written.append(len(edges)) or write(runs, edges),
+    )
+
+    trace = generate_working_set(3000, working_set_size=200, seed=9)
+    spill = SpillConfig(memory_budget=300 * EDGE_ROW_BYTES, directory=str(temp_dir))
+
+    for strategy in (FixedWindow(40), SlidingWindow(16, step=3), AdaptiveWindow(30)):
+        for min_weight in (1, 3):
+            expected = GraphBuilder(strategy, min_edge_weight=min_weight).build(trace)
+            builder = GraphBuilder(strategy, min_edge_weight=min_weight, spill=spill)
+
+            written.clear()
+            graph = builder.build(trace)
+            assert len(written) > 1
+            assert list(graph.nodes) == list(expected.nodes)
+            assert list(graph.edges(data=True)) == list(expected.edges(data=True))
+
+            streamed = builder.build_stream(iter([trace.addresses]))
+            assert list(streamed.edges(data=True)) == list(expected.edges(data=True))
+
+    # Runs are deleted once merged
+    assert list(temp_dir.iterdir()) == []
+
+    with pytest.raises(ValueError, match="memory_budget"):
+        SpillConfig(memory_budget=0)
+
+
+def test_graph_builder_sketch_keeps_heavy_edges(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sketched builds keep every heavy edge, overcounting within the bound."""
+    from memgraph.graph.edges import EdgeAggregator, SpillConfig
+    from memgraph.graph.sketch import SketchConfig
+
+    # Small batches so pairs are counted across many sketch updates
+    monkeypatch.setattr(EdgeAggregator, "BATCH_PAIRS", 2000)
+    trace = generate_working_set(20000, working_set_size=100, total_addresses=20000, seed=4)
+
+    for strategy in (FixedWindow(40), SlidingWindow(20, step=4)):
+        exact = GraphBuilder(strategy, Granularity.BYTE, min_edge_weight=3).build(trace)
+        builder = GraphBuilder(
+            strategy, Granularity.BYTE, min_edge_weight=3,
+            sketch=SketchConfig(memory_budget=1 << 16),
+        )
+        graph, metadata = builder.build_with_metadata(trace)
+
+        bound = builder.edge_weight_error
+        assert bound > 0
+        assert metadata["edge_sketch"]["error_bound"] == bound
+        for u, v, weight in exact.edges(data="weight"):
+            assert weight <= graph[u][v]["weight"] <= weight + bound
+        assert all(weight >= 3 for _, _, weight in graph.edges(data="weight"))
+
+    with pytest.raises(ValueError, match="sketched or spilled"):
+        GraphBuilder(sketch=SketchConfig(), spill=SpillConfig(1 << 20))
+
+
+def test_graph_builder_temporal_neighbors(temp_dir: Path) -> None:
+    """Each access links to its k nearest predecessors, optionally decayed."""
+    from collections import defaultdict
+    from memgraph.graph.coarsening import coarsen_addresses
+    from memgraph.graph.edges import TemporalNeighbors
+    from memgraph.graph.windowing import AdaptiveWindow
+
+    trace = generate_working_set(2000, working_set_size=60, seed=2)
+
+    for strategy in (FixedWindow(30), SlidingWindow(20, step=3), AdaptiveWindow(25)):
+        # Once k spans every window, the model is the clique model
+        clique = GraphBuilder(strategy).build(trace)
+        wide = GraphBuilder(strategy, neighbors=TemporalNeighbors(10**6)).build(trace)
+        assert list(wide.edges(data=True)) == list(clique.edges(data=True))
+
+        for model in (TemporalNeighbors(3), TemporalNeighbors(4, decay=0.5)):
+            graph = GraphBuilder(strategy, neighbors=model).build(trace)
+
+            expected: dict[tuple[int, int], float] = defaultdict(float)
+            for window in strategy.windows(trace.addresses):
+                lines = coarsen_addresses(window, Granularity.CACHELINE).tolist()
+                nearest: dict[tuple[int, int], int] = {}
+                for i, line in enumerate(lines):
+                    for d in range(1, model.k + 1):
+                        if i >= d and lines[i - d] != line:
+                            pair = (min(line, lines[i - d]), max(line, lines[i - d]))
+                            nearest[pair] = min(nearest.get(pair, d), d)
+                for pair, d in nearest.items():
+                    expected[pair] += 1 if model.decay is None else model.decay ** (d - 1)
+
+            weights = {tuple(sorted((u, v))): w for u, v, w in graph.edges(data="weight")}
+            assert weights == pytest.approx(dict(expected))
+            assert graph.number_of_edges() < clique.number_of_edges()
+
+    # Decayed weights are floats all the way through CSR graphs and files
+    model = TemporalNeighbors(4, decay=0.5)
+    builder = GraphBuilder(FixedWindow(30), neighbors=model)
+    csr = builder.build_csr(trace)
+    assert csr.weights.dtype.kind == "f"
+    for fmt in ("npz", "edgelist"):
+        save_graph(csr, temp_dir / f"graph.{fmt}", format=fmt)
+        loaded = load_graph(temp_dir / f"graph.{fmt}", format=fmt)
+        if fmt == "npz":
+            loaded = loaded.to_networkx()
+        assert loaded.size(weight="weight") == pytest.approx(csr.weights.sum() / 2)
+
+    with pytest.raises(ValueError, match="decay"):
+        TemporalNeighbors(4, decay=1.5)
+
+
+def test_transition_graph_builder(temp_dir: Path) -> None:
+    """Transition edges follow access order and feed the undirected pipeline."""
+    import numpy as np  # type: ignore
+    from collections import Counter
+    from memgraph.graph.coarsening import coarsen_addresses
+    from memgraph.graph.transitions import TransitionGraphBuilder
+    from memgraph.graphlets.enumeration import GraphletEnumerator
+
+    trace = generate_working_set(2000, working_set_size=30, seed=4)
+    builder = TransitionGraphBuilder(Granularity.CACHELINE)
+    graph = builder.build(trace)
+    assert graph.is_directed()
+
+    lines = coarsen_addresses(trace.addresses, Granularity.CACHELINE).tolist()
+    expected = Counter(
+        (a, b) for a, b in zip(lines[:-1], lines[1:]) if a != b
+    )
+    assert {(u, v): w for u, v, w in graph.edges(data="weight")} == expected
+    assert list(graph.nodes()) == list(dict.fromkeys(lines))
+
+    chunks = np.array_split(trace.addresses, 7)
+    streamed = builder.build_stream(chunks)
+    assert list(streamed.edges(data=True)) == list(graph.edges(data=True))
+
+    # The undirected reduction sums both directions
+    undirected = builder.build_undirected(trace).to_networkx()
+    reduced = nx.Graph()
+    for (a, b), weight in expected.items():
+        previous = reduced.get_edge_data(a, b, {"weight": 0})["weight"]
+        reduced.add_edge(a, b, weight=previous + weight)
+    assert nx.utils.edges_equal(undirected.edges(data=True), reduced.edges(data=True))
+
+    # Stats and graphlets accept the directed graph
+    stats = GraphStats.from_graph(graph)
+    assert stats.edge_count == len(expected)
+    assert stats.connected_components == nx.number_connected_components(reduced)
+    coarse = TransitionGraphBuilder(Granularity(256))
+    assert (
+        GraphletEnumerator(coarse.build(trace)).count_all().counts
+        == GraphletEnumerator(coarse.build_undirected(trace)).count_all().counts
+    )
+
+    save_graph(graph, temp_dir / "transitions.graphml", format="graphml")
+    assert load_graph(temp_dir / "transitions.graphml").is_directed()
+    with pytest.raises(ValueError, match="directed"):
+        save_graph(graph, temp_dir / "transitions.npz", format="npz")
+
+
+def test_graph_builder_hot_node_filter() -> None:
+    """Cold addresses are dropped before windowing."""
+    import numpy as np  # type: ignore
+    from collections import Counter
+    from memgraph.graph.coarsening import coarsen_addresses
+    from memgraph.trace.models import Trace
+
+    trace = generate_random(3000, addr_range=(0x1000, 0x40000), seed=6)
+    lines = coarsen_addresses(trace.addresses, Granularity.CACHELINE)
+    counts = Counter(lines.tolist())
+
+    builder = GraphBuilder(FixedWindow(20), min_node_frequency=3)
+    graph, metadata = builder.build_with_metadata(trace)
+    hot = {line for line, count in counts.items() if count >= 3}
+    keep = np.isin(lines, list(hot))
+    assert metadata["dropped_access_fraction"] == pytest.approx(1 - keep.mean())
+    assert 0 < metadata["dropped_access_fraction"] < 1
+
+    # Same as windowing a trace of the hot accesses only
+    hot_trace = Trace(trace.metadata, addresses=trace.addresses[keep],
+                      operations=trace.operations[keep], sizes=trace.sizes[keep])
+    expected = GraphBuilder(FixedWindow(20)).build(hot_trace)
+    assert list(graph.edges(data=True)) == list(expected.edges(data=True))
+
+    top = GraphBuilder(FixedWindow(20), top_n_nodes=10).build(trace)
+    ranked = sorted(counts, key=lambda line: (-counts[line], line))
+    assert set(top.nodes()) <= set(ranked[:10])
+
+    multi = GraphBuilder(FixedWindow(20), min_node_frequency=3).build_multi(
+        trace, [Granularity.CACHELINE, Granularity.PAGE]
+    )
+    page = GraphBuilder(FixedWindow(20), Granularity.PAGE, min_node_frequency=3).build(trace)
+    assert list(multi[Granularity.PAGE].edges(data=True)) == list(page.edges(data=True))
+
+    with pytest.raises(ValueError, match="stream"):
+        builder.build_stream([trace.addresses])
+
+
+def test_graph_builder_window_memo(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Memoized window cliques give the same graph as forming every clique."""
+    from memgraph.graph.edges import EdgeAggregator, WindowMemo
+    from memgraph.graph.edges import TemporalNeighbors
+
+    # Small batches exercise the per-batch memo and pending-clique paths
+    monkeypatch.setattr(EdgeAggregator, "BATCH_ELEMENTS", 500)
+    monkeypatch.setattr(EdgeAggregator, "BATCH_PAIRS", 2000)
+
+    traces = [
+        generate_strided(4000, stride=64, count=40),
+        generate_working_set(4000, working_set_size=30, seed=2),
+        generate_random(2000, seed=3),
+    ]
+    for trace in traces:
+        for strategy in (FixedWindow(40), FixedWindow(64)):
+            expected = GraphBuilder(strategy).build(trace)
+            for memo in (WindowMemo(), WindowMemo(max_windows=2)):
+                graph = GraphBuilder(strategy, memo=memo).build(trace)
+                assert list(graph.edges(data=True)) == list(expected.edges(data=True))
+
+            streamed = GraphBuilder(strategy, memo=WindowMemo()).build_stream(
+                [trace.addresses[:1000], trace.addresses[1000:]]
+            )
+            assert list(streamed.edges(data=True)) == list(expected.edges(data=True))
+
+    with pytest.raises(ValueError, match="clique"):
+        GraphBuilder(memo=WindowMemo(), neighbors=TemporalNeighbors(4))
+    with pytest.raises(ValueError, match="max_windows"):
+        WindowMemo(max_windows=0)
@@ -261,3 +261,18 @@ def test_graphlet_counts_are_integers() -> None:
     for gtype, count in counts.counts.items():
         assert isinstance(count, int)
         assert count >= 0
+
+
+def test_csr_graph_counts_match_networkx() -> None:
+    """Enumeration and sampling accept CSR graphs directly."""
+    trace = generate_working_set(500, working_set_size=30, seed=4)
+    builder = GraphBuilder(FixedWindow(5))
+    graph = builder.build(trace)
+    csr = builder.build_csr(trace)
+
+    assert GraphletEnumerator(csr).count_all() == GraphletEnumerator(graph).count_all()
+
+    counts = GraphletSampler(csr, seed=1).sample_count(num_samples=500)
+    assert counts.node_count == graph.number_of_nodes()
+    assert counts.edge_count == graph.number_of_edges()
+    assert counts.total > 0
@@ -70,3 +70,19 @@ def test_json_minimal_report():
     assert data["pattern"] == "sequential"
     assert data["confidence"] == 0.85
     assert len(data["recommendations"]) == 2
+
+
+def test_json_multi_report(tmp_path):
+    """Combined JSON report maps each granularity to its result."""
+    results = []
+    for granularity in ("byte", "cacheline"):
+        result = create_mock_result()
+        result.granularity = granularity
+        results.append(result)
+
+    path = tmp_path / "report.json"
+    data = json.loads(JSONReporter().report_multi(results, path))
+
+    assert json.loads(path.read_text()) == data
+    assert list(data["granularities"]) == ["byte", "cacheline"]
+    assert AnalysisResult.from_dict(data["granularities"]["byte"]) == results[0]
@@ -0,0 +1,164 @@
+"""Tests for trace data models."""
+
+import numpy as np  # type: ignore
+import pytest
+from pathlib import Path
+
+from memgraph.trace.models import (
+    MemoryAccess,
+    Trace,
+    TraceMetadata,
+    OP_READ,
+    OP_WRITE,
+)
+
+
+def test_trace_columns_from_accesses() -> None:
+    """Test that from_accesses stores the trace column-wise."""
+    accesses = [
+        MemoryAccess("R", 0x1000, 8, 0),
+        MemoryAccess("W", 0x2000, 4, 1),
+        MemoryAccess("R", 0x1000, 8, 2),
+    ]
+    trace = Trace.from_accesses(accesses, Path("<test>"), "test")
+
+    assert trace.addresses.dtype == np.uint64
+    assert trace.operations.dtype == np.uint8
+    assert trace.sizes.dtype == np.uint32
+    assert trace.addresses.tolist() == [0x1000, 0x2000, 0x1000]
+    assert trace.operations.tolist() == [OP_READ, OP_WRITE, OP_READ]
+    assert trace.sizes.tolist() == [8, 4, 8]
+
+    # Index timestamps are kept implicit
+    assert trace.timestamps is None
+    assert trace.get_timestamps().tolist() == [0, 1, 2]
+
+
+def test_trace_metadata_from_arrays() -> None:
+    """Test metadata computed over column arrays."""
+    trace = Trace.from_arrays(
+        np.array([0x3000, 0x1000, 0x3000, 0x2000], dtype=np.uint64),
+        np.array([OP_READ, OP_WRITE, OP_WRITE, OP_READ], dtype=np.uint8),
+        np.array([8, 8, 8, 8], dtype=np.uint32),
+        Path("<test>"),
+        "test",
+    )
+    meta = trace.metadata
+
+    assert meta.total_accesses == 4
+    assert meta.unique_addresses == 3
+    assert meta.read_count == 2
+    assert meta.write_count == 2
+    assert meta.address_range == (0x1000, 0x3000)
+
+
+def test_trace_iter_and_len_compatible() -> None:
+    """Test that iterating a columnar trace yields MemoryAccess objects."""
+    accesses = [MemoryAccess("W" if i % 3 else "R", 0x1000 + i * 8, 8, i) for i in range(10)]
+    trace = Trace.from_accesses(accesses, Path("<test>"), "test")
+
+    assert len(trace) == 10
+    assert list(trace) == accesses
+    assert trace.accesses[3] == accesses[3]
+    assert trace.accesses[-1] == accesses[-1]
+
+
+def test_trace_explicit_timestamps_preserved() -> None:
+    """Test that non-index timestamps survive the columnar round trip."""
+    accesses = [MemoryAccess("R", 0x1000, 8, 10), MemoryAccess("R", 0x2000, 8, 25)]
+    trace = Trace.from_accesses(accesses, Path("<test>"), "test")
+
+    assert trace.timestamps is not None
+    assert [acc.timestamp for acc in trace] == [10, 25]
+
+
+def test_access_view_slice_keeps_timestamps() -> None:
+    """Test that slicing the access view keeps implicit timestamps absolute."""
+    accesses = [MemoryAccess("R", 0x1000 + i, 1, i) for i in range(10)]
+    trace = Trace.from_accesses(accesses, Path("<test>"), "test")
+
+    window = trace.accesses[4:7]
+
+    assert len(window) == 3
+    assert [acc.timestamp for acc in window] == [4, 5, 6]
+    assert window[0] == accesses[4]
+
+
+def test_trace_rejects_mismatched_columns() -> None:
+    """Test that column arrays must have equal lengths."""
+    metadata = TraceMetadata(Path("<test>"), "test", 0, 0, 0, 0, (0, 0))
+
+    with pytest.raises(ValueError, match="same length"):
+        Trace(
+            metadata,
+            addresses=np.zeros(3, dtype=np.uint64),
+            operations=np.zeros(2, dtype=np.uint8),
+            sizes=np.zeros(3, dtype=np.uint32),
+        )
+
+
+def test_trace_empty() -> None:
+    """Test empty trace metadata."""
+    trace = Trace.from_accesses([], Path("<empty>"), "test")
+
+    assert len(trace) == 0
+    assert list(trace) == []
+    assert trace.metadata.unique_addresses == 0
+    assert trace.metadata.address_range == (0, 0)
+
+
+def test_metadata_accumulator_matches_trace_metadata() -> None:
+    """Test that metadata accumulated over chunks equals whole-trace metadata."""
+    from memgraph.trace.models import MetadataAccumulator
+
+    rng = np.random.default_rng(0)
+    addresses = rng.integers(0x1000, 0x9000, size=5000).astype(np.uint64)
+    operations = rng.integers(0, 2, size=5000).astype(np.uint8)
+    sizes = np.full(5000, 8, dtype=np.uint32)
+    trace = Trace.from_arrays(addresses, operations, sizes, Path("<test>"), "test")
+
+    accumulator = MetadataAccumulator()
+    accumulator._MIN_COMPACT = 16  # Exercise incremental merges
+    for start in range(0, 5000, 333):
+        accumulator.update(addresses[start:start + 333], operations[start:start + 333])
+
+    assert accumulator.metadata(Path("<test>"), "test") == trace.metadata
+
+
+def test_metadata_accumulator_merge() -> None:
+    """Test that merging per-piece accumulators equals accumulating the whole."""
+    from memgraph.trace.models import MetadataAccumulator
+
+    rng = np.random.default_rng(1)
+    addresses = rng.integers(0, 3000, size=4000).astype(np.uint64)
+    operations = rng.integers(0, 2, size=4000).astype(np.uint8)
+    trace = Trace.from_arrays(
+        addresses, operations, np.ones(4000, dtype=np.uint32), Path("<test>"), "test"
+    )
+
+    merged = MetadataAccumulator()
+    merged.merge(MetadataAccumulator())  # Empty pieces are ignored
+    for start in range(0, 4000, 1000):
+        piece = MetadataAccumulator()
+        piece.update(addresses[start:start + 1000], operations[start:start + 1000])
+        piece.compact()
+        merged.merge(piece)
+
+    assert merged.metadata(Path("<test>"), "test") == trace.metadata
+
+
+def test_memory_access_is_compact_and_compatible() -> None:
+    """Test that MemoryAccess has no instance dict but keeps dataclass semantics."""
+    import pickle
+    from dataclasses import replace
+
+    access = MemoryAccess("R", 0x1000, 8, 3)
+
+    assert not hasattr(access, "__dict__")
+    assert access == MemoryAccess("R", 0x1000, 8, 3)
+    assert access != MemoryAccess("W", 0x1000, 8, 3)
+    assert replace(access, size=4).size == 4
+    assert pickle.loads(pickle.dumps(access)) == access
+
+    access.timestamp = 7
+    assert access.timestamp == 7
@@ -1,11 +1,16 @@
 """Tests for trace parsers."""
 
+import bz2
+import gzip
+import lzma
 import pytest
 from pathlib import Path
+from typing import IO, Callable
 from memgraph.trace.parser import parse_trace, detect_format
 from memgraph.trace.formats.lackey import LackeyParser
 from memgraph.trace.formats.csv import CSVParser
 from memgraph.trace.formats.native import NativeParser
+from memgraph.trace.formats.binary import BinaryParser
 from memgraph.trace.models import MemoryAccess
 
 
@@ -209,3 +214,255 @@ def test_trace_iteration(sample_native_trace: Path) -> None:
         count += 1
 
     assert count == 4
+
+
+def test_binary_parser_roundtrip(temp_dir: Path) -> None:
+    """Test writing and memory-mapping a binary v2 trace."""
+    from memgraph.trace.models import Trace
+
+    accesses = [
+        MemoryAccess("R", 0x1000, 8, 0),
+        MemoryAccess("W", 0x7fff5a8b1008, 4, 5),
+        MemoryAccess("R", 0x1000, 8, 9),
+    ]
+    trace = Trace.from_accesses(accesses, Path("<test>"), "native")
+
+    output_file = temp_dir / "output.mgt"
+    BinaryParser().write(trace, output_file)
+    read_trace = BinaryParser().parse(output_file)
+
+    assert list(read_trace) == accesses
+    # Columns are views into the mapped file, not copies
+    assert not read_trace.addresses.flags["OWNDATA"]
+    assert read_trace.metadata.format == "binary"
+    assert read_trace.metadata.total_accesses == 3
+    assert read_trace.metadata.unique_addresses == 2
+    assert read_trace.metadata.read_count == 2
+    assert read_trace.metadata.address_range == (0x1000, 0x7fff5a8b1008)
+
+
+def test_binary_parser_detection(temp_dir: Path, sample_native_trace: Path) -> None:
+    """Test magic-byte detection of binary traces."""
+    trace = parse_trace(sample_native_trace)
+    output_file = temp_dir / "output.mgt"
+    BinaryParser().write(trace, output_file)
+
+    assert BinaryParser.can_parse(output_file) is True
+    assert BinaryParser.can_parse(sample_native_trace) is False
+    assert detect_format(output_file) == BinaryParser
+
+    read_trace = parse_trace(output_file)
+    assert read_trace.metadata.format == "binary"
+    assert list(read_trace) == list(trace)
+
+
+def test_binary_parser_empty_trace(temp_dir: Path) -> None:
+    """Test binary round trip of an empty trace."""
+    from memgraph.trace.models import Trace
+
+    output_file = temp_dir / "empty.mgt"
+    BinaryParser().write(Trace.from_accesses([], Path("<empty>"), "test"), output_file)
+
+    trace = parse_trace(output_file, format="binary")
+    assert len(trace) == 0
+
+
+def test_binary_parser_truncated(temp_dir: Path, sample_native_trace: Path) -> None:
+    """Test that truncated binary traces are rejected."""
+    output_file = temp_dir / "output.mgt"
+    BinaryParser().write(parse_trace(sample_native_trace), output_file)
+    output_file.write_bytes(output_file.read_bytes()[:-10])
+
+    with pytest.raises(ValueError, match="truncated"):
+        BinaryParser().parse(output_file)
+
+
+def test_lackey_bulk_parse_matches_iter(temp_dir: Path) -> None:
+    """Test that the chunked vectorized parser matches the line parser."""
+    trace_file = temp_dir / "mixed_lackey.trace"
+    trace_file.write_text(
+        "==42== Lackey, an example Valgrind tool\n"
+        "I  04000000,3\n"
+        " L 7ff000398,8\n"
+        " M 0000000000001000,4\n"
+        "\n"
+        "   S   2000,8   \n"
+        " S 7FF0003A0,16\r\n"
+        " L ffffffffffffffff,1\n"
+        " S 10,123456789"
+    )
+    parser = LackeyParser()
+    expected = list(parser.parse_iter(trace_file))
+
+    assert len(expected) == 7
+    assert list(parser.parse(trace_file)) == expected
+
+    # Chunk boundaries that cut lines must not change the result
+    for chunk_size in (1, 5, 16):
+        addresses = [
+            int(a)
+            for chunk in parser.parse_chunks(trace_file, chunk_size=chunk_size)
+            for a in chunk[0]
+        ]
+        assert addresses == [acc.address for acc in expected]
+
+
+def test_lackey_bulk_parse_error_line_number(temp_dir: Path) -> None:
+    """Test that malformed lines report their line number in bulk mode."""
+    trace_file = temp_dir / "bad_lackey.trace"
+    trace_file.write_text(" L 1000,8\n S 2000,8\n L zzzz,8\n")
+
+    with pytest.raises(ValueError, match="line 3"):
+        LackeyParser().parse(trace_file)
+
+
+@pytest.mark.parametrize("line", [
+    " L 1000,-4",
+    " S 10000000000000000,8",
+    " M 1000,4294967296",
+])
+def test_lackey_out_of_range_values(temp_dir: Path, line: str) -> None:
+    """Test that values that don't fit the columns report their line number."""
+    trace_file = temp_dir / "range_lackey.trace"
+    trace_file.write_text(f" L 1000,8\n{line}\n")
+
+    with pytest.raises(ValueError, match="line 2"):
+        LackeyParser().parse(trace_file)
+    with pytest.raises(ValueError, match="line 2"):
+        list(LackeyParser().parse_iter(trace_file))
+
+
+def test_split_ranges_align_to_lines(temp_dir: Path) -> None:
+    """Test that byte ranges start on line boundaries and cover the file."""
+    from memgraph.trace.parallel import split_ranges
+
+    trace_file = temp_dir / "lines.trace"
+    content = "".join(f" L {i:x},8\n" for i in range(1000))
+    trace_file.write_text(content)
+
+    ranges = split_ranges(trace_file, 7, min_range=1)
+
+    assert len(ranges) == 7
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(content)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert content[start - 1] == "\n"
+
+
+def test_parse_trace_parallel_matches_serial(
+    temp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that parallel parsing gives the same trace as serial parsing."""
+    import memgraph.trace.parallel as parallel
+
+    monkeypatch.setattr(parallel, "MIN_RANGE_BYTES", 64)
+
+    lackey_file = temp_dir / "big_lackey.trace"
+    lackey_file.write_text("".join(
+        f"I  {i:08x},3\n {'LSM'[i % 3]} {i * 64:x},8\n" for i in range(500)
+    ))
+    csv_file = temp_dir / "big.csv"
+    csv_file.write_text("op,address,size\n" + "".join(
+        f"{'RW'[i % 2]},{hex(i * 8)},8\n" for i in range(500)
+    ))
+
+    for trace_file in (lackey_file, csv_file):
+        serial = parse_trace(trace_file)
+        parallel_trace = parse_trace(trace_file, workers=4)
+
+        assert list(parallel_trace) == list(serial)
+        assert parallel_trace.metadata == serial.metadata
+
+
+def test_parse_trace_parallel_error_line_number(
+    temp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that errors from worker ranges report absolute line numbers."""
+    import memgraph.trace.parallel as parallel
+
+    monkeypatch.setattr(parallel, "MIN_RANGE_BYTES", 16)
+
+    lines = [f" L {i:x},8" for i in range(100)]
+    lines[80] = " L zz,8"
+    trace_file = temp_dir / "bad.trace"
+    trace_file.write_text("\n".join(lines) + "\n")
+
+    with pytest.raises(ValueError, match="line 81"):
+        parse_trace(trace_file, format="lackey", workers=4)
+
+
+def test_parse_trace_rejects_invalid_workers(sample_lackey_trace: Path) -> None:
+    """Test that workers must be at least 1."""
+    with pytest.raises(ValueError, match="workers"):
+        parse_trace(sample_lackey_trace, workers=0)
+
+
+def test_parse_parallel_requires_range_parser(sample_native_trace: Path) -> None:
+    """Test that only line-oriented formats are parsed by byte range."""
+    from memgraph.trace.formats.base import BaseParser, RangeParser
+    from memgraph.trace.parallel import parse_parallel
+
+    assert issubclass(LackeyParser, RangeParser)
+    assert issubclass(CSVParser, RangeParser)
+    assert not hasattr(BaseParser, "parse_range")
+
+    with pytest.raises(ValueError, match="not supported"):
+        parse_parallel(NativeParser(), sample_native_trace, 2)  # type: ignore[arg-type]
+
+    # Formats without ranges still parse with workers, on one core
+    assert len(parse_trace(sample_native_trace, workers=2)) > 0
+
+
+@pytest.mark.parametrize("suffix, opener", [
+    (".gz", gzip.open),
+    (".bz2", bz2.open),
+    (".xz", lzma.open),
+])
+def test_parse_compressed_traces(
+    sample_lackey_trace: Path,
+    sample_csv_trace: Path,
+    sample_native_trace: Path,
+    suffix: str,
+    opener: Callable[..., IO[bytes]]
+) -> None:
+    """Test that compressed traces are detected and parsed like plain ones."""
+    for plain in (sample_lackey_trace, sample_csv_trace, sample_native_trace):
+        compressed = plain.with_name(plain.name + suffix)
+        with opener(compressed, "wb") as f:
+            f.write(plain.read_bytes())
+
+        expected = parse_trace(plain)
+        parser_cls = detect_format(compressed)
+
+        assert parser_cls is not None
+        assert parser_cls.format_name() == expected.metadata.format
+        assert list(parser_cls().parse_iter(compressed)) == list(expected)
+
+        trace = parse_trace(compressed, workers=2)
+        assert list(trace) == list(expected)
+        assert trace.metadata.unique_addresses == expected.metadata.unique_addresses
+
+
+def test_parse_compressed_binary_trace(temp_dir: Path) -> None:
+    """Test that gzip-compressed binary traces are parsed without mapping."""
+    from memgraph.trace.models import Trace
+
+    accesses = [MemoryAccess("R" if i % 2 else "W", 0x1000 + i * 8, 8, i * 3) for i in range(50)]
+    trace = Trace.from_accesses(accesses, Path("<test>"), "test")
+
+    binary_file = temp_dir / "trace.mgt"
+    BinaryParser().write(trace, binary_file)
+    compressed = temp_dir / "trace.mgt.gz"
+    compressed.write_bytes(gzip.compress(binary_file.read_bytes()))
+
+    assert detect_format(compressed) is BinaryParser
+    assert list(parse_trace(compressed)) == accesses
+    assert list(BinaryParser().parse_iter(compressed)) == accesses
+
+    truncated = temp_dir / "truncated.mgt.gz"
+    truncated.write_bytes(gzip.compress(binary_file.read_bytes()[:-10]))
+    with pytest.raises(ValueError, match="truncated"):
+        parse_trace(truncated)
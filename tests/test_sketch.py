@@ -0,0 +1,40 @@
+"""Tests for count-min edge-weight sketches."""
+
+import numpy as np  # type: ignore
+import pytest
+
+from memgraph.graph.sketch import CountMinSketch, SketchConfig
+
+
+def test_count_min_never_undercounts() -> None:
+    """Estimates cover the true totals and stay within the error bound."""
+    rng = np.random.default_rng(7)
+    sketch = CountMinSketch(width=256, depth=4)
+    keys = rng.integers(0, 1 << 63, size=5000).astype(np.uint64)
+    totals = np.zeros(len(keys), dtype=np.int64)
+
+    for _ in range(20):
+        batch = np.unique(rng.integers(0, len(keys), size=400))
+        counts = rng.integers(1, 5, size=len(batch))
+        estimates = sketch.update(keys[batch], counts)
+        totals[batch] += counts
+        assert np.all(estimates >= totals[batch])
+
+    estimates = sketch.estimate(keys)
+    assert sketch.total == int(totals.sum())
+    assert np.all(estimates >= totals)
+    assert np.mean(estimates - totals <= sketch.error_bound()) >= 1 - sketch.delta
+
+
+def test_sketch_config_size() -> None:
+    """The configured budget sets the sketch width."""
+    config = SketchConfig(memory_budget=1 << 20, depth=4)
+    sketch = config.create()
+    assert (sketch.width, sketch.depth) == (1 << 15, 4)
+    assert sketch.counters.nbytes == 1 << 20
+    assert config.confidence == pytest.approx(1 - np.exp(-4))
+
+    with pytest.raises(ValueError, match="depth"):
+        SketchConfig(depth=0)
+    with pytest.raises(ValueError, match="memory_budget"):
+        SketchConfig(memory_budget=16, depth=4)
@@ -1,10 +1,16 @@
 """Tests for windowing strategies."""
 
+from typing import Iterator
+
+import numpy as np  # type: ignore
 import pytest
 from memgraph.graph.windowing import (
+    Accesses,
+    WindowStrategy,
     FixedWindow,
     SlidingWindow,
     AdaptiveWindow,
+    TimeWindow,
 )
 from memgraph.trace.models import MemoryAccess
 
@@ -148,6 +154,21 @@ def test_sliding_window_invalid_params() -> None:
         SlidingWindow(size=10, step=0)
 
 
+def test_sliding_window_bounds_match_windows() -> None:
+    """bounds() gives the offsets of exactly the windows windows() yields."""
+    for n in range(0, 25):
+        addresses = np.arange(n, dtype=np.uint64)
+        for size in (1, 4, 7):
+            for step in (1, 3, 10):
+                strategy = SlidingWindow(size, step)
+                starts, ends = strategy.bounds(n)
+                windows = list(strategy.windows(addresses))
+
+                assert len(windows) == len(starts)
+                for window, start, end in zip(windows, starts, ends):
+                    assert np.array_equal(window, addresses[start:end])
+
+
 def test_adaptive_window_high_locality() -> None:
     """Test that adaptive window grows with high locality."""
     # Create trace with high reuse (same addresses repeated)
@@ -245,6 +266,53 @@ def test_adaptive_window_locality_computation() -> None:
     assert max(sizes) > 15  # At least one window grew beyond base
 
 
+def test_adaptive_window_matches_set_based_locality() -> None:
+    """Test that vectorized locality gives the same windows as a seen-address set."""
+    rng = np.random.default_rng(6)
+    addresses = (rng.integers(0, 120, size=3000) * 8).astype(np.uint64)
+    strategy = AdaptiveWindow(base_size=30, min_size=5, max_size=90, locality_threshold=0.6)
+
+    expected = []
+    seen: set[int] = set()
+    size = strategy.base_size
+    i = 0
+    while i < len(addresses):
+        end = min(i + size, len(addresses))
+        expected.append((i, end))
+        window = addresses[i:end].tolist()
+        locality = sum(1 for address in window if address in seen) / len(window)
+        seen.update(window)
+        if locality > strategy.locality_threshold:
+            size = min(int(size * 1.2), strategy.max_size)
+        else:
+            size = max(int(size * 0.8), strategy.min_size)
+        i = end
+
+    assert list(strategy.spans(addresses)) == expected
+
+
+def test_adaptive_window_coarse_locality() -> None:
+    """Test that coarse tracking counts accesses to the same page as reuse."""
+    from memgraph.graph.coarsening import Granularity
+
+    # Every byte address is new, but the same 16 pages are used throughout
+    positions = np.arange(4000, dtype=np.uint64)
+    addresses = (positions % 16) * 4096 + positions // 16
+
+    raw = AdaptiveWindow(base_size=40, min_size=10, max_size=200)
+    coarse = AdaptiveWindow(
+        base_size=40, min_size=10, max_size=200, granularity=Granularity.PAGE
+    )
+
+    raw_sizes = [end - start for start, end in raw.spans(addresses)]
+    coarse_sizes = [end - start for start, end in coarse.spans(addresses)]
+    assert max(raw_sizes) == 40
+    assert max(coarse_sizes) == 200
+
+    chunks = [addresses[i:i + 100] for i in range(0, len(addresses), 100)]
+    assert [len(w) for w in coarse.stream(chunks)] == coarse_sizes
+
+
 def test_adaptive_window_invalid_params() -> None:
     """Test that invalid parameters raise errors."""
     with pytest.raises(ValueError, match="All sizes must be positive"):
@@ -294,3 +362,194 @@ def test_window_strategies_preserve_order() -> None:
             timestamps = [acc.timestamp for acc in window]
             assert timestamps == sorted(timestamps), \
                 f"{strategy.__class__.__name__} didn't preserve order"
+
+
+@pytest.mark.parametrize("strategy", [
+    FixedWindow(size=7),
+    SlidingWindow(size=7, step=3),
+    SlidingWindow(size=4, step=9),
+    AdaptiveWindow(base_size=10, min_size=3, max_size=40, locality_threshold=0.3),
+])
+def test_stream_windows_match_windows(strategy: WindowStrategy) -> None:
+    """Test that streamed windows equal windows over the whole address array."""
+    rng = np.random.default_rng(3)
+    addresses = rng.integers(0, 50, size=500).astype(np.uint64)
+
+    expected = [w.tolist() for w in strategy.windows(addresses)]
+
+    for chunk_size in (1, 5, 64, 1000):
+        chunks = [addresses[i:i + chunk_size] for i in range(0, len(addresses), chunk_size)]
+        streamed = [w.tolist() for w in strategy.stream(iter(chunks))]
+        assert streamed == expected
+
+
+def test_stream_windows_empty() -> None:
+    """Test that an empty stream yields no windows."""
+    assert list(FixedWindow(5).stream([])) == []
+    assert list(SlidingWindow(5).stream([np.empty(0, dtype=np.uint64)])) == []
+    assert list(AdaptiveWindow().stream([])) == []
+
+
+@pytest.mark.parametrize("strategy", [
+    FixedWindow(size=7),
+    SlidingWindow(size=7, step=3),
+    AdaptiveWindow(base_size=10, min_size=3, max_size=40, locality_threshold=0.3),
+])
+def test_spans_match_windows(strategy: WindowStrategy) -> None:
+    """Test that spans, span arrays and windows describe the same windows."""
+    rng = np.random.default_rng(4)
+    addresses = rng.integers(0, 50, size=300).astype(np.uint64)
+
+    spans = list(strategy.spans(addresses))
+    starts, ends = strategy.span_arrays(addresses)
+    windows = list(strategy.windows(addresses))
+
+    assert spans == list(zip(starts.tolist(), ends.tolist()))
+    assert len(windows) == len(spans)
+    for window, (start, end) in zip(windows, spans):
+        # Windows over an array are views, not copies
+        assert window.base is not None
+        assert np.array_equal(window, addresses[start:end])
+
+
+class _LegacyWindow(WindowStrategy):
+    """Strategy written against the old protocol: it only implements windows()."""
+
+    def windows(self, accesses: Accesses) -> Iterator[Accesses]:
+        for i in range(0, len(accesses), 6):
+            yield accesses[i:i + 4]
+
+
+def test_legacy_strategy_adapted_to_spans() -> None:
+    """Test that a windows()-only strategy still yields spans and builds graphs."""
+    from memgraph.graph.builder import GraphBuilder
+    from memgraph.trace.generator import generate_working_set
+
+    addresses = np.arange(20, dtype=np.uint64)
+    assert list(_LegacyWindow().spans(addresses)) == [
+        (0, 4), (6, 10), (12, 16), (18, 20)
+    ]
+
+    accesses = [MemoryAccess("R", i * 8, 8, i) for i in range(20)]
+    assert list(_LegacyWindow().spans(accesses)) == [
+        (0, 4), (6, 10), (12, 16), (18, 20)
+    ]
+
+    trace = generate_working_set(200, working_set_size=10, seed=1)
+    starts, ends = _LegacyWindow().trace_spans(trace)
+    spans = list(_LegacyWindow().spans(trace.accesses))
+    assert list(zip(starts.tolist(), ends.tolist())) == spans
+    graph, metadata = GraphBuilder(_LegacyWindow()).build_with_metadata(trace)
+    assert metadata["window_count"] == 34
+    assert graph.number_of_edges() > 0
+
+
+class _PageWindow(WindowStrategy):
+    """Old-protocol strategy that rebuilds windows from MemoryAccess fields.
+
+    Consecutive accesses to the same 4 KiB page form one window.
+    """
+
+    def windows(self, accesses: Accesses) -> Iterator[Accesses]:
+        window: list[MemoryAccess] = []
+        for acc in accesses:
+            if window and acc.address >> 12 != window[-1].address >> 12:
+                yield window
+                window = []
+            window.append(acc)
+        if window:
+            yield window
+
+
+def test_legacy_strategy_reads_memory_accesses() -> None:
+    """Test that GraphBuilder aggregates rebuilt windows of a windows()-only strategy."""
+    from pathlib import Path
+
+    from memgraph.graph.builder import GraphBuilder
+    from memgraph.trace.models import Trace
+
+    addresses = [0, 64, 128, 4096, 4160, 0, 64]
+    trace = Trace.from_accesses(
+        [MemoryAccess("R", address, 8, i) for i, address in enumerate(addresses)],
+        Path("pages.trace"),
+        "test",
+    )
+
+    graph, metadata = GraphBuilder(_PageWindow()).build_with_metadata(trace)
+    assert metadata["window_count"] == 3
+    assert sorted(w for _, _, w in graph.edges(data="weight")) == [1, 1, 1, 2]
+
+    chunks = [trace.addresses[:4], trace.addresses[4:]]
+    streamed = GraphBuilder(_PageWindow()).build_stream(chunks)
+    assert sorted(streamed.edges(data="weight")) == sorted(graph.edges(data="weight"))
+
+    # Rebuilt windows have no offsets into the trace
+    with pytest.raises(ValueError, match="slices of the trace"):
+        list(_PageWindow().spans(trace.accesses))
+
+
+def test_strategy_without_windows_or_spans() -> None:
+    """Test that a strategy must implement spans() or windows()."""
+    class Empty(WindowStrategy):
+        pass
+
+    with pytest.raises(TypeError, match="spans\\(\\) or windows\\(\\)"):
+        Empty()
+    with pytest.raises(TypeError):
+        WindowStrategy()
+
+
+def test_time_window_matches_scan() -> None:
+    """Test that time windows hold exactly the accesses in each time range."""
+    rng = np.random.default_rng(5)
+    timestamps = np.cumsum(rng.integers(0, 20, size=400)).astype(np.uint64) + 1000
+    accesses = [MemoryAccess("R", i * 8, 8, int(t)) for i, t in enumerate(timestamps)]
+
+    for duration, step in ((50, None), (50, 10), (45, 20), (7, 30)):
+        strategy = TimeWindow(duration, step)
+        step = step or duration
+
+        expected = []
+        t = int(timestamps[0])
+        while t <= int(timestamps[-1]):
+            inside = [i for i, ts in enumerate(timestamps) if t <= ts < t + duration]
+            if inside:
+                expected.append((inside[0], inside[-1] + 1))
+            t += step
+
+        assert list(strategy.spans(accesses)) == expected
+
+
+def test_time_window_sparse_timestamps() -> None:
+    """Test that huge gaps between timestamps don't enumerate empty windows."""
+    timestamps = np.array([0, 5, 10**12, 10**12 + 150], dtype=np.uint64)
+    accesses = [MemoryAccess("R", i * 8, 8, int(t)) for i, t in enumerate(timestamps)]
+
+    assert list(TimeWindow(100).spans(accesses)) == [(0, 2), (2, 3), (3, 4)]
+    # Windows starting at 10**12 - 50 and 10**12 both hold only the third access
+    assert list(TimeWindow(100, step=50).spans(accesses)) == [
+        (0, 2), (2, 3), (2, 3), (3, 4), (3, 4),
+    ]
+
+
+def test_time_window_implicit_timestamps() -> None:
+    """Test that address arrays use the access index as time."""
+    addresses = np.arange(23, dtype=np.uint64)
+    assert [w.tolist() for w in TimeWindow(10).windows(addresses)] == [
+        w.tolist() for w in FixedWindow(10).windows(addresses)
+    ]
+
+
+def test_time_window_invalid() -> None:
+    """Test parameter validation and unsorted timestamps."""
+    with pytest.raises(ValueError, match="duration must be positive"):
+        TimeWindow(0)
+    with pytest.raises(ValueError, match="Step size must be positive"):
+        TimeWindow(10, step=0)
+
+    accesses = [MemoryAccess("R", 0, 8, 5), MemoryAccess("R", 8, 8, 3)]
+    with pytest.raises(ValueError, match="non-decreasing"):
+        list(TimeWindow(10).spans(accesses))
+
+    with pytest.raises(ValueError, match="stream"):
+        TimeWindow(10).stream([np.arange(5, dtype=np.uint64)])